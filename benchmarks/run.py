@@ -0,0 +1,362 @@
+"""Time the loading, parsing and drawing paths on synthetic data.
+
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.2
+
+Every case runs a few times after an untimed preparation step and records
+the best and median wall time. With ``--compare`` the best times are checked
+against an earlier results file, and any case slower by more than the
+threshold fails the run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from .synthetic import BoardSpec, write_gerber_set, write_pickplace_csv
+
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_REPEAT = 5
+PICKPLACE_ROWS = [1_000, 10_000, 100_000, 500_000]
+QUICK_PICKPLACE_ROWS = [1_000, 10_000]
+# The last board is the largest; Pick & Place files and view cases use its size.
+BOARDS = {
+    "small": BoardSpec(traces=500, pours=4, flashes=300, holes=100),
+    "pours": BoardSpec(traces=2_000, pours=80, pour_vertices=4_000, flashes=2_000, holes=500),
+    "large": BoardSpec(traces=20_000, pours=40, flashes=8_000, holes=2_000),
+}
+QUICK_BOARDS = {
+    "pours": BoardSpec(traces=200, pours=20, pour_vertices=2_000, flashes=200, holes=50),
+    "small": BOARDS["small"],
+}
+VIEW_SIZE = (1400, 900)
+WHEEL_STEPS = 12
+# Rows and columns of the step-and-repeat panel painted by paint_panel.
+PANEL_SIZE = (4, 6)
+
+
+@dataclass
+class Case:
+    """One benchmark: ``prepare`` runs untimed before every ``run(prepared)``."""
+    name: str
+    run: Callable[[Any], Any]
+    prepare: Callable[[], Any] = lambda: None
+    repeat: int = DEFAULT_REPEAT
+    params: dict = field(default_factory=dict)
+
+
+def time_case(case: Case) -> dict:
+    times = []
+    for _ in range(case.repeat):
+        prepared = case.prepare()
+        start = time.perf_counter()
+        case.run(prepared)
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": case.repeat, "params": case.params}
+
+
+def _cold_caches():
+    # Imported late so the cache root can be redirected first.
+    from pcb_viewer.disk_cache import disk_cache
+    from pcb_viewer.layer_registry import layer_registry
+
+    disk_cache.clear()
+    layer_registry.clear()
+
+
+def board_cases(name: str, folder: Path, repeat: int) -> list[Case]:
+    from pcb_viewer.gerber_loader import discover_gerbers
+    from pcb_viewer.load_worker import load_board
+    from pcb_viewer.models import Side
+    from pcb_viewer.render_board import get_board_bounds, render_gerber_to_svg
+
+    gerber_set = discover_gerbers(folder)
+    params = {"board": name}
+
+    def prepare_svg():
+        _cold_caches()
+        return get_board_bounds(gerber_set)
+
+    return [
+        Case(f"discover_gerbers[{name}]", lambda _: discover_gerbers(folder), repeat=repeat, params=params),
+        Case(f"get_board_bounds[{name}]", lambda _: get_board_bounds(gerber_set), _cold_caches, repeat, params),
+        Case(
+            f"render_gerber_to_svg[{name}]",
+            lambda bounds: render_gerber_to_svg(gerber_set, Side.TOP, bounds),
+            prepare_svg,
+            repeat,
+            params,
+        ),
+        Case(f"load_board[{name}]", lambda _: load_board(folder), _cold_caches, repeat, params),
+    ]
+
+
+def pickplace_cases(rows: int, path: Path, repeat: int) -> list[Case]:
+    from pcb_viewer.components_table import ComponentsTableModel
+    from pcb_viewer.models import Side
+    from pcb_viewer.pickplace import load_pickplace_store, parse_pickplace_csv
+
+    params = {"rows": rows}
+    label = f"{rows // 1000}k"
+
+    def group(store):
+        model = ComponentsTableModel()
+        model.set_store(store)
+        model.set_side_filter(Side.TOP)
+        model.set_side_filter(None)
+
+    return [
+        Case(f"parse_pickplace_csv[{label}]", lambda _: parse_pickplace_csv(path), repeat=repeat, params=params),
+        Case(f"load_pickplace_store[{label}]", lambda _: load_pickplace_store(path), repeat=repeat, params=params),
+        Case(f"table_grouping[{label}]", group, lambda: load_pickplace_store(path), repeat, params),
+    ]
+
+
+def view_cases(name: str, folder: Path, rows: int, pickplace: Path, repeat: int) -> list[Case]:
+    from PySide6.QtWidgets import QApplication
+
+    from pcb_viewer.layer_item import LayerPaths
+    from pcb_viewer.load_worker import load_board
+    from pcb_viewer.models import Side
+    from pcb_viewer.pcb_view import PCBView
+    from pcb_viewer.pickplace import load_pickplace_store
+    from pcb_viewer.render_board import default_layer_styles, render_gerber_to_svg, side_layers
+    from pcb_viewer.tiles import tile_renderer
+
+    app = QApplication.instance() or QApplication([])
+    result = load_board(folder)
+    svg_data = render_gerber_to_svg(result.gerber_set, Side.TOP, result.bounds)
+    store = load_pickplace_store(pickplace)
+
+    view = PCBView()
+    view.resize(*VIEW_SIZE)
+    view.show()
+    roles = side_layers(result.gerber_set, Side.TOP)
+    layers = [
+        (style, LayerPaths(result.layers[roles[style.role]]))
+        for style in default_layer_styles().values()
+        if roles.get(style.role) in result.layers
+    ]
+
+    def prepare_highlight():
+        view.clear_highlights()
+        view.set_board_layers(layers, result.bounds, Side.TOP)
+        view.set_components(store, result.bounds, Side.TOP)
+        view.zoom_to_fit()
+        # Paint until every tile is cached, so the timed repaint is a warm one;
+        # the first paint after a layout change can request a second round.
+        for _ in range(3):
+            app.processEvents()
+            view.viewport().repaint()
+            tile_renderer().wait_for_done()
+        # The largest value group on the board, as a click on the table would select.
+        rows = store.side_indices(Side.TOP)
+        codes = store.comment_codes[rows]
+        return rows[codes == np.bincount(codes).argmax()] if len(rows) else rows
+
+    def highlight(rows):
+        view.highlight_components(rows)
+        view.viewport().repaint()
+
+    return [
+        Case(
+            f"set_board_svg[{name}]",
+            lambda _: view.set_board_svg(svg_data, result.bounds),
+            repeat=repeat,
+            params={"board": name},
+        ),
+        Case(
+            f"highlight_components[{name},{rows // 1000}k]",
+            highlight,
+            prepare_highlight,
+            repeat,
+            {"board": name, "rows": rows},
+        ),
+    ]
+
+
+def tile_cases(name: str, folder: Path, repeat: int) -> list[Case]:
+    """Paint the zoom-to-fit view from an empty tile cache, with and without the simplified levels,
+    as a panel, and step the wheel into it."""
+    from dataclasses import replace
+
+    from PySide6.QtCore import QPoint, QPointF, Qt
+    from PySide6.QtGui import QWheelEvent
+    from PySide6.QtWidgets import QApplication
+
+    from pcb_viewer.layer_item import LayerPaths
+    from pcb_viewer.load_worker import load_board
+    from pcb_viewer.models import Side
+    from pcb_viewer.panel import PanelLayout
+    from pcb_viewer.pcb_view import PCBView
+    from pcb_viewer.render_board import default_layer_styles, side_layers
+    from pcb_viewer.tiles import tile_cache, tile_renderer
+
+    app = QApplication.instance() or QApplication([])
+    result = load_board(folder)
+    roles = side_layers(result.gerber_set, Side.TOP)
+    styles = [style for style in default_layer_styles().values() if roles.get(style.role) in result.layers]
+
+    view = PCBView()
+    view.resize(*VIEW_SIZE)
+    view.show()
+
+    rows, columns = PANEL_SIZE
+    panel = PanelLayout(rows, columns, result.bounds.width + 2, result.bounds.height + 2)
+
+    def prepare(simplified: bool, panel: PanelLayout | None = None):
+        layers = []
+        for style in styles:
+            geometry = result.layers[roles[style.role]]
+            if not simplified:
+                geometry = replace(geometry, levels=[])
+            layers.append((style, LayerPaths(geometry)))
+        tile_renderer().wait_for_done()
+        tile_cache.clear()
+        view.set_panel(panel)
+        view.set_board_layers(layers, result.bounds, Side.TOP)
+        view.zoom_to_fit()
+        app.processEvents()
+
+    def paint(_):
+        view.viewport().repaint()
+        tile_renderer().wait_for_done()
+
+    def prepare_wheel():
+        prepare(True)
+        paint(None)
+        view.viewport().repaint()
+
+    def wheel_zoom(_):
+        # Each step is handled and painted before the next, as with a fast wheel.
+        center = QPointF(VIEW_SIZE[0] / 2, VIEW_SIZE[1] / 2)
+        for _ in range(WHEEL_STEPS):
+            view.wheelEvent(
+                QWheelEvent(
+                    center, view.mapToGlobal(center), QPoint(), QPoint(0, 120),
+                    Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier, Qt.ScrollPhase.NoScrollPhase, False,
+                )
+            )
+            view.viewport().repaint()
+
+    params = {"board": name}
+    return [
+        Case(f"paint_tiles[{name}]", paint, lambda: prepare(True), repeat, params),
+        Case(f"paint_tiles_full_detail[{name}]", paint, lambda: prepare(False), repeat, params),
+        Case(f"paint_panel[{name}]", paint, lambda: prepare(True, panel), repeat, {**params, "boards": panel.count}),
+        Case(f"wheel_zoom[{name}]", wheel_zoom, prepare_wheel, repeat, {**params, "steps": WHEEL_STEPS}),
+    ]
+
+
+def collect_cases(workdir: Path, boards: dict[str, BoardSpec], rows_list: list[int], repeat: int) -> list[Case]:
+    cases = []
+    folders = {}
+    for name, spec in boards.items():
+        folders[name] = write_gerber_set(workdir / f"gerbers_{name}", spec)
+        cases += board_cases(name, folders[name], repeat)
+        if spec.pour_vertices:
+            cases += tile_cases(name, folders[name], repeat)
+
+    pickplace = {}
+    largest_board = list(boards.values())[-1]
+    for rows in rows_list:
+        pickplace[rows] = write_pickplace_csv(
+            workdir / f"pnp_{rows}.csv", rows, largest_board.width_mm, largest_board.height_mm
+        )
+        # Half a million rows take long enough that fewer repeats still give a stable best.
+        cases += pickplace_cases(rows, pickplace[rows], repeat if rows < 100_000 else max(1, repeat // 2))
+
+    name = list(boards)[-1]
+    rows = max(rows_list)
+    cases += view_cases(name, folders[name], rows, pickplace[rows], repeat)
+    return cases
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Names of cases whose best time grew by more than ``threshold`` over the baseline."""
+    regressions = []
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["best"] / before["best"] if before["best"] else float("inf")
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:45s} {before['best'] * 1e3:10.2f} ms -> {result['best'] * 1e3:10.2f} ms  x{ratio:5.2f} {marker}")
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def _environment() -> dict:
+    import numpy
+    import PySide6
+    import gerbonara
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "pyside6": PySide6.__version__,
+        "gerbonara": getattr(gerbonara, "__version__", ""),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON to check for regressions against")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction of the baseline (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per case (default: %(default)s)")
+    parser.add_argument("--quick", action="store_true", help="small board and up to 10k rows only")
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose name contains this")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    with tempfile.TemporaryDirectory(prefix="pcb-viewer-bench-") as tmp:
+        workdir = Path(tmp)
+        # Keep the user's cache out of it; cold cases clear this one freely.
+        os.environ["XDG_CACHE_HOME"] = str(workdir / "cache")
+
+        boards = QUICK_BOARDS if args.quick else BOARDS
+        rows_list = QUICK_PICKPLACE_ROWS if args.quick else PICKPLACE_ROWS
+        results = {"environment": _environment(), "results": {}}
+        for case in collect_cases(workdir, boards, rows_list, args.repeat):
+            if args.pattern not in case.name:
+                continue
+            result = results["results"][case.name] = time_case(case)
+            print(f"{case.name:45s} best {result['best'] * 1e3:10.2f} ms  median {result['median'] * 1e3:10.2f} ms")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Synthetic Gerber sets and Pick & Place files of configurable size."""
+
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+# Designator prefix -> (values, footprints) drawn from for that kind of part.
+PART_KINDS = {
+    "R": (["10k", "4k7", "100R", "1k", "47k", "0R"], ["0402", "0603", "0805"]),
+    "C": (["100n", "1u", "10u", "22p", "4u7"], ["0402", "0603", "0805", "1206"]),
+    "L": (["10uH", "2u2", "BLM18"], ["0603", "1210"]),
+    "D": (["BAT54", "1N4148", "LED_RED"], ["SOD-123", "SOD-323", "SOT-23"]),
+    "Q": (["BSS138", "AO3401"], ["SOT-23", "SOT-323"]),
+    "U": (["LM358", "STM32F103", "TPS62130"], ["SOIC-8", "TSSOP-20", "SOT-223"]),
+}
+# Relative frequency of each kind, roughly that of a real board.
+PART_WEIGHTS = {"R": 40, "C": 40, "L": 4, "D": 6, "Q": 4, "U": 6}
+
+_GERBER_HEADER = """\
+%FSLAX46Y46*%
+%MOMM*%
+%ADD10C,0.250000*%
+%ADD11R,1.000000X0.600000*%
+%ADD12C,0.150000*%
+%ADD13C,0.800000*%
+G01*
+%LPD*%
+"""
+
+
+@dataclass
+class BoardSpec:
+    """Size of a synthetic board; counts are per copper layer."""
+    width_mm: float = 100.0
+    height_mm: float = 80.0
+    traces: int = 2000
+    pours: int = 10
+    # Vertices per pour outline; 0 gives coarse polygons of 5-24 vertices,
+    # more gives smooth outlines like a CAD tool's filled zones.
+    pour_vertices: int = 0
+    flashes: int = 1000
+    holes: int = 200
+    seed: int = 0
+
+
+def _coord(value_mm: float) -> int:
+    return round(value_mm * 1_000_000)
+
+
+def _point(rng: random.Random, spec: BoardSpec) -> tuple[float, float]:
+    return rng.uniform(0, spec.width_mm), rng.uniform(0, spec.height_mm)
+
+
+def _traces(rng: random.Random, spec: BoardSpec, count: int, aperture: int) -> list[str]:
+    lines = [f"D{aperture}*"]
+    for _ in range(count):
+        x, y = _point(rng, spec)
+        length = rng.uniform(1.0, 8.0)
+        angle = rng.choice((0.0, 45.0, 90.0, 135.0)) + rng.choice((0.0, 180.0))
+        x2 = min(max(x + length * math.cos(math.radians(angle)), 0.0), spec.width_mm)
+        y2 = min(max(y + length * math.sin(math.radians(angle)), 0.0), spec.height_mm)
+        lines.append(f"X{_coord(x)}Y{_coord(y)}D02*")
+        lines.append(f"X{_coord(x2)}Y{_coord(y2)}D01*")
+    return lines
+
+
+def _pours(rng: random.Random, spec: BoardSpec) -> list[str]:
+    lines = []
+    for _ in range(spec.pours):
+        cx, cy = _point(rng, spec)
+        radius = rng.uniform(3.0, min(spec.width_mm, spec.height_mm) / 6)
+        if spec.pour_vertices:
+            # A wobbly blob: a few low harmonics keep the outline smooth.
+            count = spec.pour_vertices
+            angles = [2 * math.pi * i / count for i in range(count)]
+            harmonics = [(k, rng.uniform(0.0, 0.08), rng.uniform(0, 2 * math.pi)) for k in range(2, 7)]
+            scales = [1.0 - sum(amp * (1 + math.sin(k * a + phase)) for k, amp, phase in harmonics) for a in angles]
+        else:
+            angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(rng.randint(5, 24)))
+            scales = [rng.uniform(0.6, 1.0) for _ in angles]
+        vertices = [
+            (
+                min(max(cx + radius * scale * math.cos(a), 0.0), spec.width_mm),
+                min(max(cy + radius * scale * math.sin(a), 0.0), spec.height_mm),
+            )
+            for a, scale in zip(angles, scales)
+        ]
+        lines.append("G36*")
+        x, y = vertices[0]
+        lines.append(f"X{_coord(x)}Y{_coord(y)}D02*")
+        for x, y in vertices[1:] + vertices[:1]:
+            lines.append(f"X{_coord(x)}Y{_coord(y)}D01*")
+        lines.append("G37*")
+    return lines
+
+
+def _flashes(pads: list[tuple[float, float, int]]) -> list[str]:
+    lines = []
+    aperture = None
+    for x, y, pad_aperture in pads:
+        if pad_aperture != aperture:
+            aperture = pad_aperture
+            lines.append(f"D{aperture}*")
+        lines.append(f"X{_coord(x)}Y{_coord(y)}D03*")
+    return lines
+
+
+def _write_gerber(path: Path, body: list[str]):
+    path.write_text(_GERBER_HEADER + "\n".join(body) + "\nM02*\n")
+
+
+def write_gerber_set(folder: str | Path, spec: BoardSpec = BoardSpec()) -> Path:
+    """Write a two-sided Gerber set with outline and drill file into ``folder``."""
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+
+    w, h = _coord(spec.width_mm), _coord(spec.height_mm)
+    _write_gerber(folder / "board.GM1", [
+        "D12*", "X0Y0D02*", f"X{w}Y0D01*", f"X{w}Y{h}D01*", f"X0Y{h}D01*", "X0Y0D01*",
+    ])
+
+    for side, copper, silk, mask, paste in (("top", "GTL", "GTO", "GTS", "GTP"), ("bottom", "GBL", "GBO", "GBS", "GBP")):
+        pads = [(*_point(rng, spec), rng.choice((11, 13))) for _ in range(spec.flashes)]
+        pads.sort(key=lambda pad: pad[2])
+        _write_gerber(folder / f"board.{copper}", _traces(rng, spec, spec.traces, 10) + _pours(rng, spec) + _flashes(pads))
+        _write_gerber(folder / f"board.{mask}", _flashes(pads))
+        _write_gerber(folder / f"board.{paste}", _flashes([pad for pad in pads if pad[2] == 11]))
+        _write_gerber(folder / f"board.{silk}", _traces(rng, spec, spec.traces // 4, 12))
+
+    drill = ["M48", "METRIC,TZ", "T1C0.300", "T2C0.800", "%"]
+    for tool in (1, 2):
+        drill.append(f"T{tool}")
+        drill.extend(
+            f"X{x:.3f}Y{y:.3f}" for x, y in (_point(rng, spec) for _ in range(spec.holes // 2))
+        )
+    drill.append("M30")
+    (folder / "board.DRL").write_text("\n".join(drill) + "\n")
+    return folder
+
+
+def write_pickplace_csv(
+    path: str | Path, rows: int, width_mm: float = 100.0, height_mm: float = 80.0, seed: int = 0
+) -> Path:
+    """Write an Altium-style Pick & Place CSV with ``rows`` placements in mm."""
+    path = Path(path)
+    rng = random.Random(seed)
+    kinds = list(PART_WEIGHTS)
+    weights = list(PART_WEIGHTS.values())
+    numbers = dict.fromkeys(kinds, 0)
+
+    lines = [
+        "Altium Designer Pick and Place Locations",
+        f"{path.stem}.PcbDoc",
+        "",
+        "========================================================================================================================",
+        "File Design Information:",
+        "",
+        "Units used in this file : Metric (mm)",
+        "",
+        '"Designator","Comment","Layer","Footprint","Center-X(mm)","Center-Y(mm)","Rotation","Description"',
+    ]
+    for kind in rng.choices(kinds, weights, k=rows):
+        numbers[kind] += 1
+        values, footprints = PART_KINDS[kind]
+        lines.append(
+            f'"{kind}{numbers[kind]}","{rng.choice(values)}",'
+            f'"{rng.choice(("TopLayer", "BottomLayer"))}","{rng.choice(footprints)}",'
+            f'"{rng.uniform(0, width_mm):.4f}","{rng.uniform(0, height_mm):.4f}",'
+            f'"{rng.choice((0, 90, 180, 270))}","{kind} part"'
+        )
+    path.write_text("\n".join(lines) + "\n")
+    return path
@@ -0,0 +1,254 @@
+import argparse
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtCore import Qt, QMarginsF, QPointF, QRectF, QSizeF
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QGuiApplication, QImage, QPageSize, QPainter, QPdfWriter
+
+from .models import Side
+from .pickplace import ColumnMapping, load_pickplace_store
+from .component_store import map_to_scene
+from .render_board import side_layers, default_layer_styles
+from .load_worker import GerberLoadResult, load_board
+from .layer_item import LayerPaths, SCENE_UNITS_PER_MM, board_transform, draw_layer_paths
+from .highlight_item import LABEL_COLOR, draw_markers
+from .components_table import ComponentsTableModel
+
+DEFAULT_DPI = 300
+HEADER_MM = 14.0
+MARGIN_MM = 3.0
+MARKER_RADIUS_MM = 1.2
+MARKER_PEN_MM = 0.25
+LABEL_MM = 1.6
+
+# Set once per worker process by _init_worker.
+_app: QGuiApplication | None = None
+_backgrounds: dict[str, QImage] = {}
+
+
+@dataclass
+class SheetJob:
+    """One page: a group of parts highlighted on a pre-rendered side of the board."""
+    background: str
+    output: str
+    title: str
+    subtitle: str
+    points: np.ndarray  # pixel positions on the background
+    labels: list[str]
+    dpi: int
+
+
+def _init_worker():
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _app = QGuiApplication.instance() or QGuiApplication([])
+
+
+def _background(path: str) -> QImage:
+    # Every page of a side shares one background, so each worker reads it once.
+    image = _backgrounds.get(path)
+    if image is None:
+        image = _backgrounds[path] = QImage(path)
+    return image
+
+
+def _safe_name(text: str) -> str:
+    return re.sub(r"[^\w.+-]+", "_", text).strip("_")[:60] or "unnamed"
+
+
+def render_background(result: GerberLoadResult, side: Side, dpi: int, path: Path):
+    """Paint one side of the board at ``dpi`` into a PNG, using the viewer's layer stack."""
+    bounds = result.bounds
+    px_per_mm = dpi / 25.4
+    image = QImage(
+        max(1, round(bounds.width * px_per_mm)),
+        max(1, round(bounds.height * px_per_mm)),
+        QImage.Format.Format_ARGB32_Premultiplied,
+    )
+    image.fill(QColor("#1a1a1a"))
+
+    roles = side_layers(result.gerber_set, side)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(px_per_mm / SCENE_UNITS_PER_MM, px_per_mm / SCENE_UNITS_PER_MM)
+    painter.setTransform(board_transform(bounds, side), True)
+    for style in default_layer_styles().values():
+        layer_path = roles.get(style.role)
+        if not style.visible or layer_path not in result.layers:
+            continue
+        painter.setOpacity(style.opacity)
+        draw_layer_paths(painter, LayerPaths(result.layers[layer_path]), QColor(style.color))
+    painter.end()
+
+    if not image.save(str(path)):
+        raise OSError(f"could not write {path}")
+
+
+def _compose(painter: QPainter, job: SheetJob, width: float, height: float):
+    px_per_mm = job.dpi / 25.4
+    margin = MARGIN_MM * px_per_mm
+    header = HEADER_MM * px_per_mm
+
+    painter.fillRect(QRectF(0, 0, width, height), QColor("#ffffff"))
+    font = QFont()
+    font.setPixelSize(max(1, round(4.5 * px_per_mm)))
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(QColor("#000000"))
+    title = QFontMetricsF(font).elidedText(job.title, Qt.TextElideMode.ElideRight, width - 2 * margin)
+    painter.drawText(QRectF(margin, margin, width - 2 * margin, 5 * px_per_mm), Qt.AlignmentFlag.AlignLeft, title)
+    font.setBold(False)
+    font.setPixelSize(max(1, round(2.5 * px_per_mm)))
+    painter.setFont(font)
+    painter.drawText(
+        QRectF(margin, margin + 6 * px_per_mm, width - 2 * margin, header - 6 * px_per_mm),
+        Qt.AlignmentFlag.AlignLeft | Qt.TextFlag.TextWordWrap,
+        job.subtitle,
+    )
+
+    painter.translate(margin, margin + header)
+    painter.drawImage(0, 0, _background(job.background))
+    draw_markers(painter, job.points, MARKER_RADIUS_MM * px_per_mm, MARKER_PEN_MM * px_per_mm)
+
+    font.setPixelSize(max(1, round(LABEL_MM * px_per_mm)))
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(LABEL_COLOR)
+    offset = MARKER_RADIUS_MM * 1.6 * px_per_mm
+    for (x, y), label in zip(job.points.tolist(), job.labels):
+        painter.drawText(QPointF(x + offset, y - offset / 2), label)
+
+
+def render_sheet(job: SheetJob) -> str:
+    """Write one sheet as PNG or PDF, chosen by the output suffix; runs in a worker process."""
+    background = _background(job.background)
+    px_per_mm = job.dpi / 25.4
+    width = background.width() + 2 * MARGIN_MM * px_per_mm
+    height = background.height() + (2 * MARGIN_MM + HEADER_MM) * px_per_mm
+
+    if job.output.lower().endswith(".pdf"):
+        writer = QPdfWriter(job.output)
+        writer.setResolution(job.dpi)
+        writer.setPageSize(QPageSize(QSizeF(width / px_per_mm, height / px_per_mm), QPageSize.Unit.Millimeter))
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = QPainter(writer)
+        _compose(painter, job, width, height)
+        painter.end()
+    else:
+        image = QImage(round(width), round(height), QImage.Format.Format_RGB32)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        _compose(painter, job, width, height)
+        painter.end()
+        if not image.save(job.output):
+            raise OSError(f"could not write {job.output}")
+    return job.output
+
+
+def sheet_jobs(
+    result: GerberLoadResult,
+    pnp_path: str | Path,
+    backgrounds: dict[Side, Path],
+    out_dir: Path,
+    fmt: str,
+    dpi: int,
+    mapping: ColumnMapping | None = None,
+) -> list[SheetJob]:
+    """One job per value group and side, in table order."""
+    store = load_pickplace_store(pnp_path, mapping)
+    model = ComponentsTableModel()
+    model.set_store(store)
+
+    bounds = result.bounds
+    px_per_mm = dpi / 25.4
+    viewbox = (bounds.xmin, bounds.ymin, bounds.width, bounds.height)
+    item_bounds = (0.0, 0.0, bounds.width * px_per_mm, bounds.height * px_per_mm)
+
+    jobs = []
+    for side in Side:
+        if side not in backgrounds:
+            continue
+        x, y = map_to_scene(store.x_mm, store.y_mm, bounds, side, viewbox, item_bounds)
+        points = np.column_stack((x, y))
+
+        model.set_side_filter(side)
+        for row in range(model.rowCount()):
+            group = model.get_group(row)
+            name = f"{len(jobs) + 1:03d}_{side.name.lower()}_{_safe_name(group.value)}.{fmt}"
+            jobs.append(
+                SheetJob(
+                    background=str(backgrounds[side]),
+                    output=str(out_dir / name),
+                    title=f"{group.value or '(no value)'} \N{EM DASH} {len(group.indices)} parts, {side.name.lower()} side",
+                    subtitle=f"{group.designators}\n{group.description}",
+                    points=points[group.indices],
+                    labels=group.designator_list,
+                    dpi=dpi,
+                )
+            )
+    return jobs
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="pcb-viewer sheets",
+        description="Render one assembly sheet per value group and board side.",
+    )
+    parser.add_argument("gerber_folder", help="folder or .zip archive with the Gerber and drill files")
+    parser.add_argument("pickplace", help="Pick & Place file (Altium CSV, KiCad .pos, Eagle .mnt/.mnb)")
+    parser.add_argument(
+        "--columns",
+        type=ColumnMapping.parse,
+        metavar="FIELD=COLUMN,...",
+        help="read the Pick & Place file as a CSV with these columns, e.g. designator=Ref,x=X,y=Y,units=mil",
+    )
+    parser.add_argument("-o", "--output", default="sheets", help="output folder (default: %(default)s)")
+    parser.add_argument("-f", "--format", choices=["png", "pdf"], default="png")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="resolution (default: %(default)s)")
+    parser.add_argument("--side", choices=["top", "bottom", "both"], default="both")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _init_worker()
+
+    out_dir = Path(args.output)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sides = [side for side in Side if args.side in ("both", side.name.lower())]
+    started = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=args.jobs or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as executor:
+        result = load_board(args.gerber_folder, executor)
+
+        backgrounds = {}
+        for side in sides:
+            path = out_dir / f".background_{side.name.lower()}.png"
+            render_background(result, side, args.dpi, path)
+            backgrounds[side] = path
+
+        jobs = sheet_jobs(result, args.pickplace, backgrounds, out_dir, args.format, args.dpi, args.columns)
+        # A handful of pages per task keeps the pool busy without paying for a
+        # round trip per page.
+        chunksize = max(1, len(jobs) // ((args.jobs or os.cpu_count() or 1) * 4))
+        for done, output in enumerate(executor.map(render_sheet, jobs, chunksize=chunksize), 1):
+            print(f"[{done}/{len(jobs)}] {output}")
+
+    for path in backgrounds.values():
+        path.unlink(missing_ok=True)
+    print(f"Wrote {len(jobs)} sheets to {out_dir} in {time.perf_counter() - started:.1f} s")
+    return 0
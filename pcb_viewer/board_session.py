@@ -0,0 +1,181 @@
+import sys
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QPainterPath, QPolygonF
+
+from .models import Side
+from .component_store import ComponentStore
+from .components_table import ComponentsTableModel
+from .search_index import SearchIndex
+from .pickplace import ColumnMapping
+from .panel import PanelLayout
+from .gerber_loader import LayerFile
+from .layer_item import LayerPaths
+from .load_worker import GerberLoadResult
+from .layer_registry import layer_registry
+from .pcb_view import SideScene, side_tile_bytes
+
+DEFAULT_BUDGET_BYTES = 1024 * 1024 * 1024
+# Rough heap cost of one QPainterPath element: x, y and a type tag.
+PATH_ELEMENT_BYTES = 24
+# Elements of an object array measured one by one; larger arrays are sampled.
+OBJECT_SAMPLE = 1000
+
+
+def estimate_bytes(*roots) -> int:
+    """Approximate memory held by ``roots`` and everything reachable from them.
+
+    Counts numpy arrays, ``array.array`` buffers, painter paths, polygons and
+    strings, walking containers and plain object attributes; shared objects
+    are counted once.
+    """
+    seen: set[int] = set()
+    stack = list(roots)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, np.ndarray):
+            total += obj.nbytes
+            if obj.dtype == object and obj.size:
+                # Scaled up from a sample; designator columns can hold millions of strings.
+                flat = obj.ravel()
+                sample = flat[:: max(1, flat.size // OBJECT_SAMPLE)]
+                total += sum(sys.getsizeof(item) for item in sample) * flat.size // len(sample)
+        elif isinstance(obj, array):
+            total += obj.itemsize * len(obj)
+        elif isinstance(obj, (str, bytes)):
+            total += sys.getsizeof(obj)
+        elif isinstance(obj, QPainterPath):
+            total += obj.elementCount() * PATH_ELEMENT_BYTES
+        elif isinstance(obj, QPolygonF):
+            total += obj.size() * 16
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.extend(vars(obj).values())
+    return total
+
+
+@dataclass
+class BoardSession:
+    """One open board: its sources, the data loaded from them and how it was last viewed.
+
+    While resident it holds the parsed layers, the scenes of both sides and
+    the component table; :meth:`evict` drops all of that and keeps only what
+    is needed to load the board again and come back to the same view.
+    """
+    gerber_source: str | None = None
+    pnp_path: str | None = None
+    pnp_mapping: ColumnMapping | None = None
+    panel: PanelLayout | None = None
+    board: GerberLoadResult | None = None
+    layer_paths: dict[LayerFile, LayerPaths] = field(default_factory=dict)
+    sides: dict[Side, SideScene] | None = None
+    store: ComponentStore = field(default_factory=ComponentStore.empty)
+    search_index: SearchIndex | None = None
+    table_model: ComponentsTableModel | None = None
+    current_side: Side = Side.TOP
+    # (side, zoom, view centre in board millimetres), see PCBView.board_view_state().
+    view_state: tuple[Side, float, QPointF] | None = None
+    search_text: str = ""
+    selected_value: str | None = None
+    table_scroll: int = 0
+    # File watcher stamps of the sources, taken when the board was last on screen.
+    watch_stamps: dict[str, dict] = field(default_factory=dict)
+    memory_bytes: int = 0
+
+    @property
+    def title(self) -> str:
+        source = self.gerber_source or self.pnp_path
+        return Path(source).name if source else "New Board"
+
+    @property
+    def resident(self) -> bool:
+        """Whether the board's data is in memory, or it has nothing to load."""
+        board_loaded = self.gerber_source is None or self.board is not None
+        store_loaded = self.pnp_path is None or self.table_model is not None
+        return board_loaded and store_loaded
+
+    def measure(self) -> int:
+        """Estimate what the board holds in this process, its share of the tile cache included.
+
+        The load workers are not counted: they parse layers without keeping
+        them, so they hold nothing per board between loads.
+        """
+        self.memory_bytes = estimate_bytes(
+            self.board, self.layer_paths, self.sides, self.store, self.search_index, self.table_model
+        )
+        if self.sides is not None:
+            self.memory_bytes += side_tile_bytes(self.sides)
+        return self.memory_bytes
+
+    def evict(self):
+        if self.sides is not None:
+            for state in self.sides.values():
+                for item in state.layer_items.values():
+                    item.release_tiles()
+                if state.placement_item is not None:
+                    state.placement_item.release_tiles()
+                state.scene.deleteLater()
+        if self.board is not None:
+            # Parsed only for bounds fallbacks and SVG export, but large.
+            layer_registry.discard(self.board.layers)
+        self.board = None
+        self.layer_paths = {}
+        self.sides = None
+        self.store = ComponentStore.empty()
+        self.search_index = None
+        if self.table_model is not None:
+            self.table_model.deleteLater()
+        self.table_model = None
+        self.memory_bytes = 0
+
+
+class SessionCache:
+    """Open boards in least-recently-viewed order, with a memory budget for the resident ones."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._sessions: OrderedDict[int, BoardSession] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def add(self, session: BoardSession):
+        self._sessions[id(session)] = session
+
+    def remove(self, session: BoardSession):
+        self._sessions.pop(id(session), None)
+
+    def touch(self, session: BoardSession):
+        """Mark ``session`` as the most recently viewed."""
+        self._sessions[id(session)] = session
+        self._sessions.move_to_end(id(session))
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(session.memory_bytes for session in self._sessions.values())
+
+    def enforce_budget(self, keep: BoardSession) -> list[BoardSession]:
+        """Evict the least recently viewed boards other than ``keep`` until the rest fit the budget."""
+        evicted = []
+        for session in list(self._sessions.values()):
+            if self.total_bytes <= self.budget_bytes:
+                break
+            if session is keep or not session.memory_bytes:
+                continue
+            session.evict()
+            evicted.append(session)
+        return evicted
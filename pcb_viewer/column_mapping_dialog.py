@@ -0,0 +1,93 @@
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QFormLayout,
+    QComboBox,
+    QLabel,
+    QVBoxLayout,
+)
+
+from .models import Side
+from .pickplace import FIELDS, UNIT_SCALES, ColumnMapping
+
+# Fields a file must have; the rest may be left unmapped.
+REQUIRED_FIELDS = ("designator", "x", "y")
+_LABELS = {
+    "designator": "Designator",
+    "comment": "Value",
+    "side": "Side",
+    "footprint": "Footprint",
+    "x": "X",
+    "y": "Y",
+    "rotation": "Rotation",
+    "description": "Description",
+}
+# Header names, lower-cased, that preselect a field.
+_GUESSES = {
+    "designator": ("designator", "ref", "refdes", "reference", "part", "name"),
+    "comment": ("value", "val", "comment"),
+    "side": ("side", "layer", "tb"),
+    "footprint": ("footprint", "package", "pattern"),
+    "x": ("x", "xpos", "posx", "pos x", "mid x", "center-x", "center x"),
+    "y": ("y", "ypos", "posy", "pos y", "mid y", "center-y", "center y"),
+    "rotation": ("rotation", "rot", "angle"),
+    "description": ("description", "desc"),
+}
+_NONE = "(none)"
+
+
+class ColumnMappingDialog(QDialog):
+    """Asks which columns of an unrecognised CSV hold each placement field."""
+
+    def __init__(self, file_name: str, columns: list[str], parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Map Placement Columns")
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"{file_name} is not in a known placement format.\nChoose the column of each field:"))
+
+        form = QFormLayout()
+        self._combos: dict[str, QComboBox] = {}
+        lowered = [column.lower() for column in columns]
+        for field in FIELDS:
+            combo = QComboBox()
+            if field not in REQUIRED_FIELDS:
+                combo.addItem(_NONE)
+            combo.addItems(columns)
+            guess = next((lowered.index(name) for name in _GUESSES[field] if name in lowered), None)
+            if guess is not None:
+                combo.setCurrentText(columns[guess])
+            elif field in REQUIRED_FIELDS:
+                combo.setCurrentIndex(-1)
+            combo.currentIndexChanged.connect(self._update_ok)
+            form.addRow(_LABELS[field], combo)
+            self._combos[field] = combo
+
+        self._units = QComboBox()
+        self._units.addItems(list(UNIT_SCALES))
+        form.addRow("Units", self._units)
+        self._default_side = QComboBox()
+        self._default_side.addItems([side.name.capitalize() for side in Side])
+        form.addRow("Side when not given", self._default_side)
+        layout.addLayout(form)
+
+        self._buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self._buttons.accepted.connect(self.accept)
+        self._buttons.rejected.connect(self.reject)
+        layout.addWidget(self._buttons)
+        self._update_ok()
+
+    def _update_ok(self):
+        required = [self._combos[field].currentText() for field in REQUIRED_FIELDS]
+        ok = all(required) and len(set(required)) == len(required)
+        self._buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(ok)
+
+    def mapping(self) -> ColumnMapping:
+        columns = {}
+        for field, combo in self._combos.items():
+            text = combo.currentText()
+            columns[field] = None if text == _NONE else text
+        return ColumnMapping(
+            **columns,
+            units=self._units.currentText(),
+            default_side=list(Side)[self._default_side.currentIndex()],
+        )
@@ -0,0 +1,155 @@
+from array import array
+from typing import Iterable
+
+import numpy as np
+
+from .models import BoundsMM, Component, Side
+
+SIDES = list(Side)
+_SIDE_CODES = {side: code for code, side in enumerate(SIDES)}
+
+
+class TextColumn:
+    """A categorical text column: an int32 code per row into the distinct stripped values."""
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._codes = array("i")
+        # Raw cell -> code. Values, footprints and descriptions repeat heavily
+        # in panelized files, so each distinct cell is stripped once, and
+        # cells differing only in padding share a code.
+        self._by_cell: dict[str, int] = {}
+        self._by_value: dict[str, int] = {}
+
+    def append(self, cell: str):
+        code = self._by_cell.get(cell)
+        if code is None:
+            value = cell.strip()
+            code = self._by_value.get(value)
+            if code is None:
+                code = self._by_value[value] = len(self.values)
+                self.values.append(value)
+            self._by_cell[cell] = code
+        self._codes.append(code)
+
+    def array(self) -> np.ndarray:
+        return np.frombuffer(self._codes, dtype=np.int32).copy()
+
+
+class ComponentStore:
+    """Placement data held column by column.
+
+    Coordinates are float arrays; comment, footprint and description are
+    categorical (an int32 code per row into a list of distinct values) and
+    side is an int8 code into ``SIDES``. Rows are addressed by index.
+    """
+
+    def __init__(
+        self,
+        designators: np.ndarray,
+        comment_codes: np.ndarray,
+        comments: list[str],
+        footprint_codes: np.ndarray,
+        footprints: list[str],
+        description_codes: np.ndarray,
+        descriptions: list[str],
+        sides: np.ndarray,
+        x_mm: np.ndarray,
+        y_mm: np.ndarray,
+        rotation_deg: np.ndarray,
+    ):
+        self.designators = designators
+        self.comment_codes = comment_codes
+        self.comments = comments
+        self.footprint_codes = footprint_codes
+        self.footprints = footprints
+        self.description_codes = description_codes
+        self.descriptions = descriptions
+        self.sides = sides
+        self.x_mm = x_mm
+        self.y_mm = y_mm
+        self.rotation_deg = rotation_deg
+
+    @classmethod
+    def empty(cls) -> "ComponentStore":
+        return cls.from_components([])
+
+    @classmethod
+    def from_components(cls, components: Iterable[Component]) -> "ComponentStore":
+        designators: list[str] = []
+        comments, footprints, descriptions = TextColumn(), TextColumn(), TextColumn()
+        sides = array("b")
+        x, y, rotation = array("d"), array("d"), array("d")
+        for c in components:
+            designators.append(c.designator)
+            comments.append(c.comment)
+            sides.append(_SIDE_CODES[c.side])
+            footprints.append(c.footprint)
+            x.append(c.x_mm)
+            y.append(c.y_mm)
+            rotation.append(c.rotation_deg)
+            descriptions.append(c.description)
+        return cls(
+            designators=np.array(designators, dtype=object),
+            comment_codes=comments.array(),
+            comments=comments.values,
+            footprint_codes=footprints.array(),
+            footprints=footprints.values,
+            description_codes=descriptions.array(),
+            descriptions=descriptions.values,
+            sides=np.frombuffer(sides, dtype=np.int8).copy(),
+            x_mm=np.frombuffer(x, dtype=np.float64).copy(),
+            y_mm=np.frombuffer(y, dtype=np.float64).copy(),
+            rotation_deg=np.frombuffer(rotation, dtype=np.float64).copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.designators)
+
+    def side_mask(self, side: Side) -> np.ndarray:
+        return self.sides == _SIDE_CODES[side]
+
+    def side_indices(self, side: Side) -> np.ndarray:
+        return np.flatnonzero(self.side_mask(side))
+
+    def comment(self, index: int) -> str:
+        return self.comments[self.comment_codes[index]]
+
+    def footprint(self, index: int) -> str:
+        return self.footprints[self.footprint_codes[index]]
+
+    def description(self, index: int) -> str:
+        return self.descriptions[self.description_codes[index]]
+
+    def component(self, index: int) -> Component:
+        return Component(
+            designator=self.designators[index],
+            comment=self.comment(index),
+            side=SIDES[self.sides[index]],
+            footprint=self.footprint(index),
+            x_mm=float(self.x_mm[index]),
+            y_mm=float(self.y_mm[index]),
+            rotation_deg=float(self.rotation_deg[index]),
+            description=self.description(index),
+        )
+
+
+def map_to_scene(
+    x_mm: np.ndarray,
+    y_mm: np.ndarray,
+    bounds: BoundsMM,
+    side: Side,
+    viewbox: tuple[float, float, float, float],
+    item_bounds: tuple[float, float, float, float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Board millimetres to scene coordinates for one side, for whole columns at once."""
+    vb_x, vb_y, vb_w, vb_h = viewbox
+    ib_x, ib_y, ib_w, ib_h = item_bounds
+
+    if side == Side.BOTTOM:
+        x_mm = (bounds.xmin + bounds.xmax) - x_mm
+
+    norm_x = (x_mm - vb_x) / vb_w if vb_w else np.zeros_like(x_mm)
+    norm_y = 1.0 - (y_mm - vb_y) / vb_h if vb_h else np.zeros_like(y_mm)
+
+    return ib_x + norm_x * ib_w, ib_y + norm_y * ib_h
@@ -1,8 +1,11 @@
 import re
+
+import numpy as np
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtWidgets import QTableView, QHeaderView
 
-from .models import Component, Side
+from .models import Side
+from .component_store import ComponentStore
 
 
 def natural_sort_key(designator: str):
@@ -10,18 +13,66 @@ def natural_sort_key(designator: str):
     return [int(p) if p.isdigit() else p.lower() for p in parts]
 
 
+def natural_ranks(values) -> np.ndarray:
+    """Position of each value in natural sort order; the key is computed once per value."""
+    order = sorted(range(len(values)), key=lambda i: natural_sort_key(values[i]))
+    ranks = np.empty(len(values), dtype=np.intp)
+    ranks[order] = np.arange(len(values))
+    return ranks
+
+
 class ComponentGroup:
-    def __init__(self, value: str, components: list[Component]):
+    """Components sharing one value. ``indices`` are store rows in natural designator order."""
+
+    def __init__(self, store: ComponentStore, value: str, indices: np.ndarray, designator_rank: int, value_rank: int):
         self.value = value
-        self.components = sorted(components, key=lambda c: natural_sort_key(c.designator))
+        self.indices = indices
+        self.designator_rank = designator_rank
+        self.value_rank = value_rank
+        self._store = store
+        self._designators: str | None = None
+
+    @property
+    def first_designator(self) -> str:
+        return self._store.designators[self.indices[0]] if len(self.indices) else ""
+
+    @property
+    def designator_list(self) -> list[str]:
+        return list(self._store.designators[self.indices])
 
     @property
     def designators(self) -> str:
-        return ", ".join(c.designator for c in self.components)
+        if self._designators is None:
+            self._designators = ", ".join(self._store.designators[self.indices])
+        return self._designators
 
     @property
     def description(self) -> str:
-        return self.components[0].description if self.components else ""
+        return self._store.description(self.indices[0]) if len(self.indices) else ""
+
+
+class _Grouping:
+    """The groups for one side filter, with lookups kept in step with their order."""
+
+    def __init__(self, groups: list[ComponentGroup], row_count: int):
+        self.groups = groups
+        self.by_value = {group.value: group for group in groups}
+        self.group_of_row = np.full(row_count, -1, dtype=np.intp)
+        self.row_of_value: dict[str, int] = {}
+        self.sort_order: tuple[int, Qt.SortOrder] | None = None
+
+    def sort(self, column: int, order: Qt.SortOrder):
+        if self.sort_order == (column, order):
+            return
+        if column == 0:
+            key = lambda g: g.designator_rank
+        else:
+            key = lambda g: (g.value_rank, g.designator_rank)
+        self.groups.sort(key=key, reverse=order == Qt.SortOrder.DescendingOrder)
+        for i, group in enumerate(self.groups):
+            self.group_of_row[group.indices] = i
+            self.row_of_value[group.value] = i
+        self.sort_order = (column, order)
 
 
 class ComponentsTableModel(QAbstractTableModel):
@@ -29,36 +80,116 @@ class ComponentsTableModel(QAbstractTableModel):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._components: list[Component] = []
-        self._groups: list[ComponentGroup] = []
+        self._store = ComponentStore.empty()
+        self._designator_ranks = np.empty(0, dtype=np.intp)
+        self._value_ranks = np.empty(0, dtype=np.intp)
+        self._groupings: dict[Side | None, _Grouping] = {}
+        self._grouping = _Grouping([], 0)
         self._side_filter: Side | None = None
+        self._row_filter: np.ndarray | None = None
+        self._sort_order: tuple[int, Qt.SortOrder] = (0, Qt.SortOrder.AscendingOrder)
+
+    @property
+    def _groups(self) -> list[ComponentGroup]:
+        return self._grouping.groups
 
-    def set_components(self, components: list[Component]):
+    def set_store(self, store: ComponentStore):
         self.beginResetModel()
-        self._components = components
-        self._apply_filter()
+        self._store = store
+        # Natural-sort keys are computed once per load, then reused as integer ranks.
+        self._designator_ranks = natural_ranks(store.designators)
+        self._value_ranks = natural_ranks(store.comments)
+        self._groupings = {side: self._build_grouping(side) for side in Side}
+        self._row_filter = None
+        self._grouping = self._get_grouping(self._side_filter)
         self.endResetModel()
 
     def set_side_filter(self, side: Side | None):
+        if side == self._side_filter and self._groupings:
+            return
+        # Groupings are built per load, so switching sides only swaps lists.
         self.beginResetModel()
         self._side_filter = side
-        self._apply_filter()
+        self._grouping = self._get_grouping(side)
         self.endResetModel()
 
-    def _apply_filter(self):
-        if self._side_filter is None:
-            filtered = self._components[:]
-        else:
-            filtered = [c for c in self._components if c.side == self._side_filter]
-
-        groups_dict: dict[str, list[Component]] = {}
-        for comp in filtered:
-            if comp.comment not in groups_dict:
-                groups_dict[comp.comment] = []
-            groups_dict[comp.comment].append(comp)
+    def set_row_filter(self, rows: np.ndarray | None):
+        """Show only the given store rows (search results), or everything for None."""
+        self.beginResetModel()
+        self._row_filter = rows
+        self._grouping = self._get_grouping(self._side_filter)
+        self.endResetModel()
 
-        self._groups = [ComponentGroup(value, comps) for value, comps in groups_dict.items()]
-        self._groups.sort(key=lambda g: natural_sort_key(g.components[0].designator) if g.components else [])
+    def _get_grouping(self, side: Side | None) -> _Grouping:
+        grouping = self._groupings.get(side)
+        if grouping is None:
+            grouping = self._groupings[side] = self._build_grouping(side)
+        grouping.sort(*self._sort_order)
+        if self._row_filter is not None:
+            grouping = self._filter_grouping(grouping, self._row_filter)
+            grouping.sort(*self._sort_order)
+        return grouping
+
+    def _filter_grouping(self, base: _Grouping, rows: np.ndarray) -> _Grouping:
+        # Regroup the matching rows under the groups they already belong to,
+        # keeping each group's value rank so sorting stays consistent.
+        group_ids = base.group_of_row[rows]
+        keep = group_ids >= 0
+        rows, group_ids = rows[keep], group_ids[keep]
+        order = np.lexsort((self._designator_ranks[rows], group_ids))
+        rows, group_ids = rows[order], group_ids[order]
+        starts = np.flatnonzero(np.diff(group_ids)) + 1 if len(rows) else np.empty(0, dtype=np.intp)
+
+        groups = []
+        for part_rows in np.split(rows, starts):
+            if not len(part_rows):
+                continue
+            group = base.groups[base.group_of_row[part_rows[0]]]
+            groups.append(
+                ComponentGroup(
+                    self._store, group.value, part_rows, int(self._designator_ranks[part_rows[0]]), group.value_rank
+                )
+            )
+        return _Grouping(groups, len(self._store))
+
+    def _build_grouping(self, side: Side | None) -> _Grouping:
+        store = self._store
+        rows = np.arange(len(store)) if side is None else store.side_indices(side)
+
+        # Sort rows by (comment, designator rank) and split where the comment
+        # changes, leaving every group in natural designator order.
+        codes = store.comment_codes[rows]
+        ranks = self._designator_ranks[rows]
+        order = np.lexsort((ranks, codes))
+        rows, codes, ranks = rows[order], codes[order], ranks[order]
+        starts = np.flatnonzero(np.diff(codes)) + 1 if len(codes) else np.empty(0, dtype=np.intp)
+
+        groups = []
+        for part_rows, part_codes, part_ranks in zip(
+            np.split(rows, starts), np.split(codes, starts), np.split(ranks, starts)
+        ):
+            if not len(part_rows):
+                continue
+            code = part_codes[0]
+            groups.append(
+                ComponentGroup(store, store.comments[code], part_rows, int(part_ranks[0]), int(self._value_ranks[code]))
+            )
+        return _Grouping(groups, len(store))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        moved = [self._groups[index.row()] for index in persistent]
+
+        self._sort_order = (column, order)
+        self._grouping.sort(column, order)
+
+        group_of_row = self._grouping.group_of_row
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(group_of_row[group.indices[0]]), index.column()) for group, index in zip(moved, persistent)],
+        )
+        self.layoutChanged.emit()
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._groups)
@@ -92,11 +223,22 @@ class ComponentsTableModel(QAbstractTableModel):
             return self._groups[row]
         return None
 
-    def get_components_by_value(self, value: str) -> list[Component]:
-        for group in self._groups:
-            if group.value == value:
-                return group.components
-        return []
+    def group_row_of(self, store_row: int) -> int | None:
+        """Table row of the group that holds a component store row, if it is shown."""
+        group_of_row = self._grouping.group_of_row
+        if 0 <= store_row < len(group_of_row) and group_of_row[store_row] >= 0:
+            return int(group_of_row[store_row])
+        return None
+
+    def row_of_value(self, value: str) -> int | None:
+        """Table row of the group with this value, if it is shown."""
+        return self._grouping.row_of_value.get(value)
+
+    def get_indices_by_value(self, value: str) -> np.ndarray:
+        group = self._grouping.by_value.get(value)
+        if group is None:
+            return np.empty(0, dtype=np.intp)
+        return group.indices
 
 
 class ComponentsTableView(QTableView):
@@ -105,6 +247,7 @@ class ComponentsTableView(QTableView):
         self.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.setAlternatingRowColors(True)
+        self.horizontalHeader().setSortIndicator(0, Qt.SortOrder.AscendingOrder)
         self.setSortingEnabled(True)
         self.horizontalHeader().setStretchLastSection(True)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
@@ -0,0 +1,139 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Files whose digests are remembered, least recently hashed dropped first.
+HASH_MEMO_SIZE = 4096
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pcb-viewer"
+
+
+_hash_memo: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+
+
+def content_hash(path) -> str:
+    """Digest of a file's bytes, memoised on mtime and size.
+
+    ``path`` is a ``Path`` or anything with the same ``stat``, ``resolve`` and
+    ``open`` methods, such as an archive member.
+    """
+    if isinstance(path, str):
+        path = Path(path)
+    st = path.stat()
+    key = path.resolve()
+
+    memo = _hash_memo.get(key)
+    if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+        _hash_memo.move_to_end(key)
+        return memo[2]
+
+    h = hashlib.blake2b(digest_size=20)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _hash_memo[key] = (st.st_mtime_ns, st.st_size, digest)
+    _hash_memo.move_to_end(key)
+    while len(_hash_memo) > HASH_MEMO_SIZE:
+        _hash_memo.popitem(last=False)
+    return digest
+
+
+def combine_keys(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"v{CACHE_VERSION}".encode())
+    for part in parts:
+        h.update(b"\0")
+        h.update(part.encode())
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Files under ``root``, one per entry, trimmed to ``max_bytes`` by last use.
+
+    Load workers write to the same directory, so sizes are always read from
+    it rather than counted in one process.
+    """
+
+    def __init__(self, root: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, kind: str, key: str) -> Path:
+        return self.root / f"{key}.{kind}"
+
+    def get(self, kind: str, key: str) -> bytes | None:
+        path = self._entry_path(kind, key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        # Entry mtimes double as the LRU clock.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, kind: str, key: str, data: bytes):
+        path = self._entry_path(kind, key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        try:
+            for p in self.root.iterdir():
+                if p.suffix == ".tmp":
+                    continue
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+        except OSError:
+            pass
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        for _, _, p in self._entries():
+            try:
+                p.unlink()
+            except OSError:
+                pass
+        _hash_memo.clear()
+
+
+disk_cache = DiskCache()
@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+# Exporters write a board as a burst of files; wait for the burst to settle.
+DEBOUNCE_MS = 750
+
+# name -> (mtime_ns, size)
+Fingerprint = dict[str, tuple[int, int]]
+
+
+def fingerprint(path: Path) -> Fingerprint:
+    """Stat stamps of a file, or of every file directly inside a folder."""
+    try:
+        if path.is_dir():
+            with os.scandir(path) as entries:
+                stamps = {}
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        stamps[entry.name] = (stat.st_mtime_ns, stat.st_size)
+                return stamps
+        stat = path.stat()
+        return {path.name: (stat.st_mtime_ns, stat.st_size)}
+    except OSError:
+        # Mid-export the file may be gone for a moment; the next event retries.
+        return {}
+
+
+class FileWatcher(QObject):
+    """Watches named sources (a folder or a file each) and reports debounced changes.
+
+    ``changed`` carries the source name and the paths whose stat stamps
+    differ from the last report, so a burst of writes yields one signal.
+    """
+
+    changed = Signal(str, list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_event)
+        self._watcher.directoryChanged.connect(self._on_event)
+        self._sources: dict[str, Path] = {}
+        self._fingerprints: dict[str, Fingerprint] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self._check)
+
+    def watch(self, name: str, path: str | Path, seen: Fingerprint | None = None):
+        """Start (or restart) watching ``path`` as source ``name``.
+
+        ``seen`` is the state the caller last loaded, as returned by
+        :meth:`stamps`; differences from it are reported right away. Without
+        it the current state counts as seen.
+        """
+        self.unwatch(name)
+        path = Path(path)
+        self._sources[name] = path
+        current = fingerprint(path)
+        self._fingerprints[name] = current if seen is None else seen
+        self._add_paths()
+        if seen is not None and seen != current:
+            self._timer.start()
+
+    def stamps(self, name: str) -> Fingerprint | None:
+        """The last seen state of source ``name``, for a later :meth:`watch`."""
+        stamps = self._fingerprints.get(name)
+        return dict(stamps) if stamps is not None else None
+
+    def unwatch(self, name: str):
+        path = self._sources.pop(name, None)
+        self._fingerprints.pop(name, None)
+        if path is not None:
+            self._remove_paths()
+
+    def clear(self):
+        self._sources.clear()
+        self._fingerprints.clear()
+        self._timer.stop()
+        self._remove_paths()
+
+    def _watched_paths(self) -> set[str]:
+        paths = set()
+        for name, path in self._sources.items():
+            paths.add(str(path))
+            if path.is_dir():
+                # A folder only reports files coming and going, not rewrites.
+                paths.update(str(path / file) for file in self._fingerprints[name])
+            else:
+                # Files saved by rename replace the watched inode; the parent
+                # folder still sees that.
+                paths.add(str(path.parent))
+        return paths
+
+    def _add_paths(self):
+        current = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [path for path in self._watched_paths() - current if os.path.exists(path)]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _remove_paths(self):
+        current = set(self._watcher.files()) | set(self._watcher.directories())
+        unused = list(current - self._watched_paths())
+        if unused:
+            self._watcher.removePaths(unused)
+
+    def _on_event(self, _path: str):
+        self._timer.start()
+
+    def _check(self):
+        for name, path in list(self._sources.items()):
+            old = self._fingerprints[name]
+            new = fingerprint(path)
+            if not new and old:
+                # Deleted or half-written; keep the old state until it is back.
+                continue
+            changed = [path / file if path.is_dir() else path for file in new if new[file] != old.get(file)]
+            changed += [path / file for file in old if file not in new and path.is_dir()]
+            self._fingerprints[name] = new
+            if changed:
+                self.changed.emit(name, changed)
+        # Files new to a watched folder are watched from now on.
+        self._add_paths()
+        self._remove_paths()
@@ -0,0 +1,102 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# Sizes are the (x, y) extent in mm of the part at zero rotation, following
+# the usual library orientation (chips lie along x, dual rows run along y).
+
+# Used when a footprint name gives no size.
+DEFAULT_BODY_MM = (1.0, 1.0)
+
+# Imperial chip codes as used in most libraries ("0603", "R0805", "C_1206").
+CHIP_BODIES_MM = {
+    "01005": (0.4, 0.2),
+    "0201": (0.6, 0.3),
+    "0402": (1.0, 0.5),
+    "0603": (1.6, 0.8),
+    "0805": (2.0, 1.25),
+    "1206": (3.2, 1.6),
+    "1210": (3.2, 2.5),
+    "1812": (4.5, 3.2),
+    "2010": (5.0, 2.5),
+    "2512": (6.4, 3.2),
+}
+
+# Common discrete packages, sized to include their leads.
+PACKAGE_BODIES_MM = {
+    "SOT-23": (2.5, 3.0),
+    "SOT-223": (7.0, 6.5),
+    "SOT-323": (2.1, 2.1),
+    "SOT-363": (2.1, 2.1),
+    "SOD-123": (3.7, 1.6),
+    "SOD-323": (2.5, 1.3),
+    "SOD-523": (1.6, 0.8),
+    "SMA": (5.2, 2.6),
+    "SMB": (5.4, 3.6),
+    "SMC": (7.9, 5.9),
+    "DPAK": (9.9, 6.6),
+    "D2PAK": (15.3, 10.1),
+}
+
+# Lead pitch and lead-to-lead span for dual-row packages sized by pin count.
+PIN_ROW_PACKAGES = {
+    "SOIC": (1.27, 6.0),
+    "SO": (1.27, 6.0),
+    "SSOP": (0.65, 7.8),
+    "TSSOP": (0.65, 6.4),
+    "MSOP": (0.65, 4.9),
+}
+
+_METRIC_RE = re.compile(r"(\d{2})(\d{2})METRIC")
+# IPC-7351 chip names, e.g. CAPC1608X90N or RESC2012X65.
+_IPC_CHIP_RE = re.compile(r"^(?:RES|CAP|IND|DIO|LED)C(\d{2})(\d{2})X")
+_DIMENSIONS_RE = re.compile(r"(\d+(?:\.\d+)?)X(\d+(?:\.\d+)?)(?:X\d+(?:\.\d+)?)?MM")
+_CHIP_RE = re.compile(r"(?<!\d)(01005|0201|0402|0603|0805|1206|1210|1812|2010|2512)(?!\d)")
+_PIN_ROW_RE = re.compile(r"^(SOIC|SO|SSOP|TSSOP|MSOP)-?(\d+)", re.IGNORECASE)
+_NORMALISE_RE = re.compile(r"[\s_]+")
+
+
+@lru_cache(maxsize=4096)
+def footprint_body_mm(footprint: str) -> tuple[float, float]:
+    """Best-guess body size in mm from a footprint name.
+
+    Understands KiCad ``...Metric`` suffixes, explicit ``LxW`` dimensions,
+    imperial chip codes, common discrete packages and pin-count packages
+    such as ``SOIC-8``. Anything else gets :data:`DEFAULT_BODY_MM`.
+    """
+    name = _NORMALISE_RE.sub("-", footprint.strip()).upper()
+
+    match = _METRIC_RE.search(name) or _IPC_CHIP_RE.match(name)
+    if match:
+        return (int(match.group(1)) / 10, int(match.group(2)) / 10)
+
+    match = _DIMENSIONS_RE.search(name)
+    if match:
+        return (float(match.group(1)), float(match.group(2)))
+
+    tokens = name.split("-")
+    for package, body in PACKAGE_BODIES_MM.items():
+        parts = package.split("-")
+        joined = "".join(parts)
+        for i, token in enumerate(tokens):
+            if token == joined or tokens[i:i + len(parts)] == parts:
+                return body
+
+    match = _PIN_ROW_RE.match(name)
+    if match:
+        pitch, span = PIN_ROW_PACKAGES[match.group(1).upper()]
+        return (span, int(match.group(2)) // 2 * pitch)
+
+    match = _CHIP_RE.search(name)
+    if match:
+        return CHIP_BODIES_MM[match.group(1)]
+
+    return DEFAULT_BODY_MM
+
+
+def footprint_bodies_mm(footprints: list[str]) -> np.ndarray:
+    """``(n, 2)`` array of body sizes, one row per distinct footprint (category code)."""
+    if not footprints:
+        return np.empty((0, 2))
+    return np.array([footprint_body_mm(name) for name in footprints], dtype=np.float64)
@@ -0,0 +1,263 @@
+import math
+import re
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from .gerber_loader import ArchiveMember
+
+MM_PER_INCH = 25.4
+READ_CHUNK_SIZE = 1 << 20
+
+_WORD_RE = re.compile(r"([GXYIJD])([+-]?[\d.]+)")
+_APERTURE_RE = re.compile(r"ADD(\d+)([A-Za-z_.$][\w.$-]*)(?:,(.*))?", re.DOTALL)
+_FORMAT_RE = re.compile(r"FS([LTD]?)([AI])X(\d)(\d)Y(\d)(\d)")
+_STEP_REPEAT_RE = re.compile(r"SRX(\d+)Y(\d+)")
+
+
+class UnsupportedGerber(Exception):
+    """Raised for constructs the scanner cannot size without a full parse."""
+
+
+def _statements(stream: TextIO) -> Iterator[tuple[bool, str]]:
+    """Yield ``(extended, statement)`` pairs from Gerber text, reading it in chunks.
+
+    Statements inside ``%...%`` blocks are yielded one by one with ``extended`` set.
+    """
+    buf = ""
+    for chunk in iter(lambda: stream.read(READ_CHUNK_SIZE), ""):
+        buf += chunk
+        pos = 0
+        while True:
+            start = pos
+            while start < len(buf) and buf[start] in " \t\r\n":
+                start += 1
+            if start >= len(buf):
+                pos = start
+                break
+
+            if buf[start] == "%":
+                end = buf.find("%", start + 1)
+                if end < 0:
+                    break
+                for part in buf[start + 1:end].split("*"):
+                    part = "".join(part.split())
+                    if part:
+                        yield True, part
+                pos = end + 1
+            else:
+                end = buf.find("*", start)
+                if end < 0:
+                    break
+                yield False, buf[start:end].strip()
+                pos = end + 1
+        buf = buf[pos:]
+
+
+def _arc_extents(x1, y1, x2, y2, cx, cy, clockwise) -> tuple[float, float, float, float]:
+    r = math.hypot(x1 - cx, y1 - cy)
+    if math.isclose(x1, x2) and math.isclose(y1, y2):
+        return (cx - r, cy - r, cx + r, cy + r)
+
+    a1 = math.atan2(y1 - cy, x1 - cx)
+    a2 = math.atan2(y2 - cy, x2 - cx)
+    if clockwise:
+        a1, a2 = a2, a1
+    # Counter-clockwise sweep from a1 to a2.
+    sweep = (a2 - a1) % (2 * math.pi)
+
+    xmin, xmax = min(x1, x2), max(x1, x2)
+    ymin, ymax = min(y1, y2), max(y1, y2)
+    for k, (dx, dy) in enumerate(((1, 0), (0, 1), (-1, 0), (0, -1))):
+        if (k * math.pi / 2 - a1) % (2 * math.pi) < sweep:
+            xmin, xmax = min(xmin, cx + dx * r), max(xmax, cx + dx * r)
+            ymin, ymax = min(ymin, cy + dy * r), max(ymax, cy + dy * r)
+    return (xmin, ymin, xmax, ymax)
+
+
+class _Aperture:
+    def __init__(self, shape: str, params: list[float]):
+        self.shape = shape
+        self.params = params
+
+    def flash_extents(self) -> tuple[float, float, float, float]:
+        p = self.params
+        if self.shape == "C":
+            r = p[0] / 2
+            return (-r, -r, r, r)
+        if self.shape in ("R", "O"):
+            return (-p[0] / 2, -p[1] / 2, p[0] / 2, p[1] / 2)
+        if self.shape == "P":
+            r, n = p[0] / 2, int(p[1])
+            rotation = math.radians(p[2]) if len(p) > 2 else 0.0
+            xs = [r * math.cos(rotation + 2 * math.pi * i / n) for i in range(n)]
+            ys = [r * math.sin(rotation + 2 * math.pi * i / n) for i in range(n)]
+            return (min(xs), min(ys), max(xs), max(ys))
+        raise UnsupportedGerber(f"aperture macro {self.shape!r}")
+
+    def stroke_radius(self) -> float:
+        # Non-circular apertures are swept with their diagonal, as gerbonara does.
+        p = self.params
+        if self.shape == "C":
+            return p[0] / 2
+        if self.shape in ("R", "O"):
+            return math.hypot(p[0], p[1]) / 2
+        raise UnsupportedGerber(f"interpolation with aperture {self.shape!r}")
+
+
+class _Scanner:
+    def __init__(self):
+        self.scale = 1.0  # file units to mm
+        self.int_digits = (2, 2)
+        self.dec_digits = (4, 4)
+        self.trailing = False
+        self.incremental = False
+        self.apertures: dict[int, _Aperture] = {}
+        self.aperture: _Aperture | None = None
+        self.x = self.y = 0.0
+        self.interpolation = 1
+        self.multi_quadrant = True
+        self.in_region = False
+        self.bounds = [math.inf, math.inf, -math.inf, -math.inf]
+
+    def add(self, xmin, ymin, xmax, ymax):
+        b = self.bounds
+        b[0], b[1] = min(b[0], xmin), min(b[1], ymin)
+        b[2], b[3] = max(b[2], xmax), max(b[3], ymax)
+
+    def coordinate(self, value: str, axis: int) -> float:
+        if "." in value:
+            return float(value) * self.scale
+        decimals = self.dec_digits[axis]
+        if self.trailing:
+            sign = value[0] if value[0] in "+-" else ""
+            digits = value.lstrip("+-").ljust(self.int_digits[axis] + decimals, "0")
+            value = sign + digits
+        return int(value) / 10 ** decimals * self.scale
+
+    def extended(self, statement: str):
+        code = statement[:2]
+        if code == "FS":
+            match = _FORMAT_RE.match(statement)
+            if match is None:
+                raise UnsupportedGerber(f"format {statement!r}")
+            zeros, notation, xi, xd, yi, yd = match.groups()
+            self.trailing = zeros == "T"
+            self.incremental = notation == "I"
+            self.int_digits = (int(xi), int(yi))
+            self.dec_digits = (int(xd), int(yd))
+        elif code == "MO":
+            self.scale = MM_PER_INCH if statement[2:4] == "IN" else 1.0
+        elif code == "AD":
+            match = _APERTURE_RE.match(statement)
+            if match is None:
+                raise UnsupportedGerber(f"aperture {statement!r}")
+            number, shape, params = match.groups()
+            values = [float(v) for v in params.split("X")] if params else []
+            if shape in ("C", "R", "O"):
+                values = [v * self.scale for v in values]
+            elif shape == "P":
+                values[0] *= self.scale
+            self.apertures[int(number)] = _Aperture(shape, values)
+        elif code == "SR":
+            repeats = _STEP_REPEAT_RE.match(statement)
+            if repeats is not None and (int(repeats.group(1)) > 1 or int(repeats.group(2)) > 1):
+                raise UnsupportedGerber("step and repeat")
+        elif code in ("AB", "LR", "LS", "LM"):
+            if statement not in ("LR0", "LS1", "LMN"):
+                raise UnsupportedGerber(f"{code} transformations")
+
+    def word(self, statement: str):
+        if statement.startswith(("G04", "G4 ", "G4\t")) or statement == "G4":
+            return
+        if statement in ("G36", "G37"):
+            self.in_region = statement == "G36"
+            return
+        if statement in ("G70", "G71"):
+            self.scale = MM_PER_INCH if statement == "G70" else 1.0
+            return
+
+        x, y = self.x, self.y
+        i = j = 0.0
+        operation = None
+        for letter, value in _WORD_RE.findall(statement):
+            if letter == "G":
+                code = int(float(value))
+                if code in (1, 2, 3):
+                    self.interpolation = code
+                elif code == 74:
+                    self.multi_quadrant = False
+                elif code == 75:
+                    self.multi_quadrant = True
+            elif letter == "X":
+                x = self.coordinate(value, 0) + (self.x if self.incremental else 0.0)
+            elif letter == "Y":
+                y = self.coordinate(value, 1) + (self.y if self.incremental else 0.0)
+            elif letter == "I":
+                i = self.coordinate(value, 0)
+            elif letter == "J":
+                j = self.coordinate(value, 1)
+            elif letter == "D":
+                code = int(value)
+                if code >= 10:
+                    self.aperture = self.apertures.get(code)
+                else:
+                    operation = code
+
+        if operation == 1:
+            self.interpolate(x, y, i, j)
+        elif operation == 3:
+            if self.aperture is None:
+                raise UnsupportedGerber("flash without aperture")
+            xmin, ymin, xmax, ymax = self.aperture.flash_extents()
+            self.add(x + xmin, y + ymin, x + xmax, y + ymax)
+        self.x, self.y = x, y
+
+    def interpolate(self, x: float, y: float, i: float, j: float):
+        if self.in_region:
+            r = 0.0
+        elif self.aperture is None:
+            raise UnsupportedGerber("interpolation without aperture")
+        else:
+            r = self.aperture.stroke_radius()
+
+        if self.interpolation == 1:
+            xmin, ymin = min(self.x, x), min(self.y, y)
+            xmax, ymax = max(self.x, x), max(self.y, y)
+        elif self.multi_quadrant:
+            xmin, ymin, xmax, ymax = _arc_extents(
+                self.x, self.y, x, y, self.x + i, self.y + j, self.interpolation == 2
+            )
+        else:
+            # Single-quadrant offsets are unsigned; the full circle is a safe cover.
+            radius = math.hypot(i, j)
+            xmin = min(self.x, x) - radius
+            ymin = min(self.y, y) - radius
+            xmax = max(self.x, x) + radius
+            ymax = max(self.y, y) + radius
+        self.add(xmin - r, ymin - r, xmax + r, ymax + r)
+
+
+def scan_gerber_bounds(path: str | Path | ArchiveMember) -> tuple[float, float, float, float] | None:
+    """Board-space extents of one Gerber file in mm, read straight from its command stream.
+
+    Only coordinates, aperture sizes and arc extents are tracked, which is far
+    cheaper than building gerbonara's object model. Returns ``None`` for empty
+    files and raises :class:`UnsupportedGerber` for features it cannot size
+    (aperture macros, step and repeat, block apertures).
+    """
+    scanner = _Scanner()
+    if isinstance(path, str):
+        path = Path(path)
+    with path.open("r", encoding="ascii", errors="replace", newline="") as stream:
+        for extended, statement in _statements(stream):
+            if extended:
+                scanner.extended(statement)
+            elif statement.startswith("M0"):
+                break
+            else:
+                scanner.word(statement)
+
+    xmin, ymin, xmax, ymax = scanner.bounds
+    if xmin > xmax:
+        return None
+    return (xmin, ymin, xmax, ymax)
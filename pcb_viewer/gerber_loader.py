@@ -1,42 +1,260 @@
+import io
+import os
+import re
+import zipfile
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Union
+
+
+@lru_cache(maxsize=8)
+def _open_archive(path: Path, mtime_ns: int) -> zipfile.ZipFile:
+    # One open archive per file version and process; the mtime in the key
+    # makes a rewritten archive open afresh.
+    return zipfile.ZipFile(path)
+
+
+def _archive(path: Path) -> zipfile.ZipFile:
+    return _open_archive(path, path.stat().st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class _MemberStat:
+    st_mtime_ns: int
+    st_size: int
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    """A layer file inside a .zip archive, usable where a layer ``Path`` is expected.
+
+    Implements the handful of ``Path`` methods the loaders rely on; the
+    member is read straight from the archive and never extracted to disk.
+    """
+    archive: Path
+    member: str
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self.member).name
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.member).suffix
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.member).stem
+
+    def exists(self) -> bool:
+        try:
+            return self.member in _archive(self.archive).NameToInfo
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+    def is_file(self) -> bool:
+        return self.exists()
+
+    def stat(self) -> _MemberStat:
+        info = _archive(self.archive).getinfo(self.member)
+        return _MemberStat(self.archive.stat().st_mtime_ns, info.file_size)
+
+    def resolve(self) -> "ArchiveMember":
+        return ArchiveMember(self.archive.resolve(), self.member)
+
+    def open(self, mode: str = "r", encoding: str | None = None, errors: str | None = None, newline: str | None = None):
+        stream = _archive(self.archive).open(self.member)
+        if "b" in mode:
+            return stream
+        return io.TextIOWrapper(stream, encoding=encoding or "utf-8", errors=errors, newline=newline)
+
+    def read_bytes(self) -> bytes:
+        return _archive(self.archive).read(self.member)
+
+    def read_text(self, encoding: str | None = None, errors: str | None = None) -> str:
+        return self.read_bytes().decode(encoding or "utf-8", errors or "strict")
+
+    def __str__(self) -> str:
+        return f"{self.archive}/{self.member}"
+
+
+LayerFile = Union[Path, ArchiveMember]
 
 
 @dataclass
 class GerberSet:
-    gtl: Path | None = None  # Top copper
-    gbl: Path | None = None  # Bottom copper
-    gto: Path | None = None  # Top silkscreen
-    gbo: Path | None = None  # Bottom silkscreen
-    gts: Path | None = None  # Top soldermask
-    gbs: Path | None = None  # Bottom soldermask
-    outline: Path | None = None  # Board outline (GM, GM1, GKO, etc.)
+    gtl: LayerFile | None = None  # Top copper
+    gbl: LayerFile | None = None  # Bottom copper
+    gto: LayerFile | None = None  # Top silkscreen
+    gbo: LayerFile | None = None  # Bottom silkscreen
+    gts: LayerFile | None = None  # Top soldermask
+    gbs: LayerFile | None = None  # Bottom soldermask
+    gtp: LayerFile | None = None  # Top paste
+    gbp: LayerFile | None = None  # Bottom paste
+    outline: LayerFile | None = None  # Board outline (GM, GM1, GKO, etc.)
+    drill: LayerFile | None = None  # Excellon drill (DRL, XLN, DRD, TXT)
+
+
+DRILL_EXTENSIONS = ["DRL", "XLN", "DRD", "TXT"]
+# Only this much of each file is read to look for X2 attributes.
+HEAD_BYTES = 2048
+
+# Extension -> (layer, rank); lower ranks win when several files claim a layer.
+# Altium/Protel names first, then Eagle's legacy CAM processor names.
+LAYER_EXTENSIONS = {
+    "GTL": ("gtl", 0), "GBL": ("gbl", 0),
+    "GTO": ("gto", 0), "GBO": ("gbo", 0),
+    "GTS": ("gts", 0), "GBS": ("gbs", 0),
+    "GTP": ("gtp", 0), "GBP": ("gbp", 0),
+    "GM1": ("outline", 0), "GM": ("outline", 1), "GKO": ("outline", 2), "GML": ("outline", 3),
+    "DRL": ("drill", 0), "XLN": ("drill", 1), "DRD": ("drill", 2), "TXT": ("drill", 3),
+    "CMP": ("gtl", 5), "SOL": ("gbl", 5),
+    "PLC": ("gto", 5), "PLS": ("gbo", 5),
+    "STC": ("gts", 5), "STS": ("gbs", 5),
+    "CRC": ("gtp", 5), "CRS": ("gbp", 5),
+    "DIM": ("outline", 5),
+}
+
+# KiCad, Eagle CAM and generic file names, matched as whole words of the
+# lower-cased stem with separators folded to "_".
+_NAME_PATTERNS = [
+    ("gtl", r"f_cu|copper_top|top_copper|cu_top|top_cu|top_layer"),
+    ("gbl", r"b_cu|copper_bot(?:tom)?|bot(?:tom)?_copper|cu_bot(?:tom)?|bot(?:tom)?_cu|bot(?:tom)?_layer"),
+    ("gto", r"f_silks(?:creen)?|silk(?:screen)?_top|top_silk(?:screen)?|legend_top|top_legend"),
+    ("gbo", r"b_silks(?:creen)?|silk(?:screen)?_bot(?:tom)?|bot(?:tom)?_silk(?:screen)?|legend_bot(?:tom)?|bot(?:tom)?_legend"),
+    ("gts", r"f_mask|(?:solder)?mask_top|top_(?:solder)?mask"),
+    ("gbs", r"b_mask|(?:solder)?mask_bot(?:tom)?|bot(?:tom)?_(?:solder)?mask"),
+    ("gtp", r"f_paste|(?:solder)?paste_top|top_(?:solder)?paste|cream_top"),
+    ("gbp", r"b_paste|(?:solder)?paste_bot(?:tom)?|bot(?:tom)?_(?:solder)?paste|cream_bot(?:tom)?"),
+    ("outline", r"edge_cuts|profile|(?:board_)?outline|dimension"),
+    ("drill", r"n?pth|drills?"),
+]
+_NAME_RES = [(layer, re.compile(rf"(?:^|_)(?:{pattern})(?:_|$)")) for layer, pattern in _NAME_PATTERNS]
+_SEPARATORS_RE = re.compile(r"[\s.\-_]+")
+# Gerber X2 (and KiCad's X1-compatible "G04 #@! TF." and Excellon "; #@! TF.") attribute.
+_FILE_FUNCTION_RE = re.compile(r"TF\.FileFunction,([^*\r\n%]*)")
+_EXCELLON_RE = re.compile(r"^\s*M48\b", re.MULTILINE)
+_IGNORED_SUFFIXES = {
+    ".zip", ".pdf", ".png", ".jpg", ".jpeg", ".csv", ".xls", ".xlsx", ".doc", ".docx",
+    ".html", ".htm", ".json", ".gbrjob", ".pos", ".bom", ".step", ".stp", ".svg",
+}
+NAME_RANK = 10
+X2_RANK = -10
+
+
+def is_drill_file(path: LayerFile) -> bool:
+    if path.suffix.upper().lstrip(".") in DRILL_EXTENSIONS:
+        return True
+    # Drill files renamed to anything else are still recognisable by their header.
+    try:
+        with path.open("rb") as f:
+            head = f.read(HEAD_BYTES)
+    except OSError:
+        return False
+    return _EXCELLON_RE.search(head.decode("ascii", errors="replace")) is not None
+
+
+def _x2_layer(function: str) -> tuple[str, float] | None:
+    fields = [field.strip() for field in function.split(",")]
+    kind = fields[0].lower()
+    top = any(field == "Top" for field in fields[1:])
+    bottom = any(field == "Bot" for field in fields[1:])
+    sided = {"copper": ("gtl", "gbl"), "legend": ("gto", "gbo"), "soldermask": ("gts", "gbs"), "paste": ("gtp", "gbp")}
+    if kind in sided and (top or bottom):
+        return sided[kind][0 if top else 1], X2_RANK
+    if kind == "profile":
+        return "outline", X2_RANK
+    if kind == "plated":
+        return "drill", X2_RANK
+    if kind == "nonplated":
+        return "drill", X2_RANK + 1
+    return None
+
+
+def classify_layer(name: str, head: str) -> tuple[str, float] | None:
+    """GerberSet field and rank for one file, from its X2 header, extension or name.
+
+    ``head`` is the start of the file. A ``TF.FileFunction`` attribute is
+    authoritative; then come known extensions, then naming patterns. Lower
+    ranks win when several files claim the same layer.
+    """
+    match = _FILE_FUNCTION_RE.search(head)
+    if match:
+        # A file with a function we do not show (inner copper, fab notes) is not
+        # claimed by its name either.
+        return _x2_layer(match.group(1))
+
+    path = PurePosixPath(name)
+    excellon = _EXCELLON_RE.search(head) is not None
+    words = _SEPARATORS_RE.sub("_", path.stem.lower()).strip("_")
+    # Plated holes before non-plated when both come as separate files.
+    drill_rank = 0.5 if "npth" in words.split("_") else 0.0
+
+    layer = LAYER_EXTENSIONS.get(path.suffix.upper().lstrip("."))
+    # Plain .txt files are only drill files if they look like one.
+    if layer is not None and (path.suffix.upper() != ".TXT" or excellon):
+        role, rank = layer
+        return role, rank + drill_rank if role == "drill" else rank
+
+    for role, pattern in _NAME_RES:
+        if pattern.search(words) and (role != "drill" or excellon):
+            return role, NAME_RANK + drill_rank if role == "drill" else NAME_RANK
+    if excellon:
+        return "drill", NAME_RANK + 5 + drill_rank
+    return None
+
+
+def _is_candidate(name: str) -> bool:
+    path = PurePosixPath(name)
+    return not path.name.startswith(".") and path.suffix.lower() not in _IGNORED_SUFFIXES
+
+
+def _folder_files(folder: Path) -> list[tuple[LayerFile, str]]:
+    files = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.is_file() or not _is_candidate(entry.name):
+                continue
+            with open(entry.path, "rb") as f:
+                head = f.read(HEAD_BYTES)
+            files.append((Path(entry.path), head.decode("ascii", errors="replace")))
+    return files
+
+
+def _archive_files(path: Path) -> list[tuple[LayerFile, str]]:
+    archive = _archive(path)
+    files = []
+    for info in archive.infolist():
+        if info.is_dir() or info.filename.startswith("__MACOSX/") or not _is_candidate(info.filename):
+            continue
+        # Only the first block of each member is decompressed here.
+        with archive.open(info) as f:
+            head = f.read(HEAD_BYTES)
+        files.append((ArchiveMember(path, info.filename), head.decode("ascii", errors="replace")))
+    return files
 
 
 def discover_gerbers(folder: str | Path) -> GerberSet:
+    """Find the layer files of a Gerber folder or .zip archive in one scan."""
     folder = Path(folder)
-    if not folder.is_dir():
+    if folder.is_file() and zipfile.is_zipfile(folder):
+        files = _archive_files(folder)
+    elif folder.is_dir():
+        files = _folder_files(folder)
+    else:
         raise ValueError(f"Gerber folder does not exist: {folder}")
 
-    def find_ext(ext: str) -> Path | None:
-        for p in folder.iterdir():
-            if p.suffix.upper() == f".{ext.upper()}":
-                return p
-        return None
-
-    def find_outline() -> Path | None:
-        for ext in ["GM1", "GM", "GKO", "GML"]:
-            result = find_ext(ext)
-            if result:
-                return result
-        return None
-
-    return GerberSet(
-        gtl=find_ext("GTL"),
-        gbl=find_ext("GBL"),
-        gto=find_ext("GTO"),
-        gbo=find_ext("GBO"),
-        gts=find_ext("GTS"),
-        gbs=find_ext("GBS"),
-        outline=find_outline(),
-    )
+    best: dict[str, tuple[float, str, LayerFile]] = {}
+    for file, head in files:
+        layer = classify_layer(file.name, head)
+        if layer is None:
+            continue
+        role, rank = layer
+        # Ties go to the first name in sort order, so the result does not
+        # depend on directory order.
+        candidate = (rank, str(file), file)
+        if role not in best or candidate[:2] < best[role][:2]:
+            best[role] = candidate
+
+    return GerberSet(**{role: file for role, (_, _, file) in best.items()})
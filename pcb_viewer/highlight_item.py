@@ -0,0 +1,190 @@
+import math
+
+import numpy as np
+
+from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QFontMetricsF, QPixmap, QTransform
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+PULSE_AMPLITUDE = 0.3
+# Marker radius and crosshair reach in marker-size units, before the pulse.
+MARKER_RADIUS = 4.0
+CROSSHAIR_REACH = 1.5
+# Label top-left relative to the marker centre, in marker-size units.
+LABEL_OFFSET = QPointF(9.0, -8.5)
+# Labels smaller than this on screen are skipped.
+MIN_LABEL_PIXELS = 4.0
+# Above this on-screen radius markers are drawn as paths instead of a sprite.
+MAX_SPRITE_RADIUS = 128.0
+
+
+def _unit_marker() -> QPainterPath:
+    path = QPainterPath()
+    path.addEllipse(QPointF(0, 0), 1.0, 1.0)
+    path.moveTo(-CROSSHAIR_REACH, 0)
+    path.lineTo(CROSSHAIR_REACH, 0)
+    path.moveTo(0, -CROSSHAIR_REACH)
+    path.lineTo(0, CROSSHAIR_REACH)
+    return path
+
+
+MARKER_PEN = QColor("#ff0000")
+MARKER_FILL = QColor(255, 255, 0, 80)
+LABEL_COLOR = QColor("#ffff00")
+
+
+def draw_markers(painter: QPainter, points: np.ndarray, radius: float, pen_width: float):
+    """Ring and crosshair at every point, ``radius`` and ``pen_width`` in painter units."""
+    path = _unit_marker()
+    pen = QPen(MARKER_PEN)
+    # The pen is drawn in unit-marker space, so its width is divided back out.
+    pen.setWidthF(pen_width / radius)
+    base = painter.worldTransform()
+
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setPen(pen)
+    painter.setBrush(QBrush(MARKER_FILL))
+    for x, y in points.tolist():
+        painter.setTransform(QTransform(radius, 0, 0, radius, x, y) * base)
+        painter.drawPath(path)
+    painter.restore()
+
+
+class HighlightItem(QGraphicsItem):
+    """All highlight markers of one selection, painted in a single pass.
+
+    Every marker is the same ring and crosshair, so it is rendered once into
+    a sprite at the current on-screen size and stamped at each position. The
+    marker size and the pulse only change that size, so changing either is a
+    repaint rather than a rebuild.
+    """
+
+    def __init__(self, positions: np.ndarray, labels: list[str], marker_size: float):
+        super().__init__()
+        self._positions = positions
+        self._labels = labels
+        self._marker_size = marker_size
+        self._pulse = 1.0
+        self._path = _unit_marker()
+        self._pen = QPen(MARKER_PEN)
+        self._brush = QBrush(MARKER_FILL)
+        self._sprite: QPixmap | None = None
+        self._sprite_key: tuple[float, float, float] | None = None
+
+        self._font = QFont()
+        metrics = QFontMetricsF(self._font)
+        self._label_ascent = metrics.ascent()
+        self._label_size = (
+            max((metrics.horizontalAdvance(label) for label in labels), default=0.0),
+            metrics.height(),
+        )
+        if len(positions):
+            self._extent = (*positions.min(axis=0), *positions.max(axis=0))
+        else:
+            self._extent = (0.0, 0.0, 0.0, 0.0)
+        self._bounds = QRectF()
+        self._update_bounds()
+        self.setZValue(15)
+        # paint() culls markers by the exposed rect, which Qt only fills in with this flag.
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def _margin(self, pulse: float) -> float:
+        """Scene distance from a marker centre that covers its shape and label."""
+        size = self._marker_size
+        label_width, label_height = self._label_size
+        return size * max(
+            MARKER_RADIUS * pulse * CROSSHAIR_REACH + 1.0,
+            LABEL_OFFSET.x() + label_width,
+            -LABEL_OFFSET.y(),
+            label_height + LABEL_OFFSET.y(),
+        )
+
+    def _update_bounds(self):
+        margin = self._margin(1.0 + PULSE_AMPLITUDE)
+        x0, y0, x1, y1 = self._extent
+        self._bounds = QRectF(x0 - margin, y0 - margin, x1 - x0 + 2 * margin, y1 - y0 + 2 * margin)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def set_marker_size(self, marker_size: float):
+        self.prepareGeometryChange()
+        self._marker_size = marker_size
+        self._update_bounds()
+        self.update()
+
+    def set_pulse(self, pulse: float):
+        self._pulse = pulse
+        self.update()
+
+    def first_position(self) -> QPointF | None:
+        if not len(self._positions):
+            return None
+        return QPointF(*self._positions[0])
+
+    def _marker_sprite(self, radius_px: float, pen_px: float, ratio: float) -> QPixmap:
+        key = (round(radius_px, 1), round(pen_px, 2), ratio)
+        if key != self._sprite_key:
+            reach = radius_px * CROSSHAIR_REACH + pen_px
+            side = math.ceil(2 * reach * ratio) + 2
+            sprite = QPixmap(side, side)
+            sprite.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.translate(side / 2, side / 2)
+            painter.scale(radius_px * ratio, radius_px * ratio)
+            self._pen.setWidthF(pen_px / radius_px)
+            painter.setPen(self._pen)
+            painter.setBrush(self._brush)
+            painter.drawPath(self._path)
+            painter.end()
+            sprite.setDevicePixelRatio(ratio)
+            self._sprite = sprite
+            self._sprite_key = key
+        return self._sprite
+
+    def paint(self, painter, option, widget=None):
+        margin = self._margin(self._pulse)
+        exposed = option.exposedRect.adjusted(-margin, -margin, margin, margin)
+        xy = self._positions
+        visible = np.flatnonzero(
+            (xy[:, 0] >= exposed.left())
+            & (xy[:, 0] <= exposed.right())
+            & (xy[:, 1] >= exposed.top())
+            & (xy[:, 1] <= exposed.bottom())
+        )
+        if not len(visible):
+            return
+
+        size = self._marker_size
+        radius = size * MARKER_RADIUS * self._pulse
+        base = painter.worldTransform()
+        pixels_per_unit = QStyleOptionGraphicsItem.levelOfDetailFromTransform(base)
+        points = xy[visible]
+
+        painter.save()
+        if radius * pixels_per_unit <= MAX_SPRITE_RADIUS and not base.isRotating():
+            ratio = painter.device().devicePixelRatioF()
+            sprite = self._marker_sprite(radius * pixels_per_unit, size * pixels_per_unit, ratio)
+            half = sprite.width() / ratio / 2
+            screen_x = points[:, 0] * base.m11() + points[:, 1] * base.m21() + base.dx() - half
+            screen_y = points[:, 0] * base.m12() + points[:, 1] * base.m22() + base.dy() - half
+            painter.resetTransform()
+            for x, y in zip(screen_x.tolist(), screen_y.tolist()):
+                painter.drawPixmap(QPointF(x, y), sprite)
+        else:
+            draw_markers(painter, points, radius, size)
+
+        if self._label_size[1] * size * pixels_per_unit >= MIN_LABEL_PIXELS:
+            # Labels are drawn in marker-size units, so one transform serves them all.
+            painter.setTransform(QTransform(size, 0, 0, size, 0, 0) * base)
+            painter.setFont(self._font)
+            painter.setPen(LABEL_COLOR)
+            label_x = points[:, 0] / size + LABEL_OFFSET.x()
+            label_y = points[:, 1] / size + LABEL_OFFSET.y() + self._label_ascent
+            labels = self._labels
+            for i, x, y in zip(visible.tolist(), label_x.tolist(), label_y.tolist()):
+                painter.drawText(QPointF(x, y), labels[i])
+
+        painter.restore()
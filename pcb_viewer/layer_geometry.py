@@ -0,0 +1,360 @@
+import math
+import pickle
+from array import array
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import gerbonara
+from gerbonara import GerberFile, ExcellonFile
+from gerbonara import graphic_primitives as gp
+from gerbonara.utils import MM, approximate_arc
+
+from .disk_cache import disk_cache, content_hash, combine_keys
+from .gerber_loader import LayerFile
+from .layer_registry import parse_layer
+from .tracing import tracer
+
+GEOMETRY_VERSION = 2
+ARC_MAX_ERROR_MM = 0.01
+HAIRLINE_WIDTH_MM = 0.01
+# Tolerances of the precomputed simplified copies of each layer, finest first.
+SIMPLIFY_TOLERANCES_MM = (0.0125, 0.025, 0.05, 0.1, 0.2, 0.4)
+# A simplified level is kept only if it has at most this share of the
+# vertices of the next finer level kept.
+SIMPLIFY_MIN_GAIN = 0.8
+# Polygons and polylines with at most this many vertices are not decimated.
+DECIMATE_MIN_POINTS = 8
+
+
+@dataclass
+class GeometryRun:
+    """Consecutive primitives of one polarity, flattened to plain coordinate arrays.
+
+    Polygons are flat ``x0, y0, x1, y1, ...`` arrays wound with positive signed
+    area, circles are ``x, y, r`` triples and strokes are round-capped polylines
+    grouped by width.
+    """
+    dark: bool
+    polygons: list[array] = field(default_factory=list)
+    circles: array = field(default_factory=lambda: array("d"))
+    strokes: dict[float, list[array]] = field(default_factory=dict)
+
+    @property
+    def primitive_count(self) -> int:
+        return (
+            len(self.polygons)
+            + len(self.circles) // 3
+            + sum(len(lines) for lines in self.strokes.values())
+        )
+
+
+    @property
+    def vertex_count(self) -> int:
+        return (
+            sum(len(poly) for poly in self.polygons) // 2
+            + len(self.circles) // 3
+            + sum(len(line) for lines in self.strokes.values() for line in lines) // 2
+        )
+
+
+@dataclass
+class LayerGeometry:
+    """A layer flattened to runs, plus coarser copies of the runs for zoomed-out drawing.
+
+    ``levels`` holds ``(tolerance_mm, runs)`` pairs, finest first; each
+    differs from the full geometry by at most its tolerance.
+    """
+    runs: list[GeometryRun] = field(default_factory=list)
+    bounds: tuple[float, float, float, float] | None = None
+    levels: list[tuple[float, list[GeometryRun]]] = field(default_factory=list)
+
+    @property
+    def has_clear_runs(self) -> bool:
+        return any(not run.dark for run in self.runs)
+
+    @property
+    def primitive_count(self) -> int:
+        return sum(run.primitive_count for run in self.runs)
+
+
+def _polygon(points) -> array:
+    flat = array("d")
+    for x, y in points:
+        flat.append(x)
+        flat.append(y)
+
+    area = 0.0
+    n = len(flat)
+    for i in range(0, n, 2):
+        x1, y1 = flat[i], flat[i + 1]
+        x2, y2 = flat[(i + 2) % n], flat[(i + 3) % n]
+        area += x1 * y2 - x2 * y1
+
+    # Match the winding of QPainterPath.addEllipse so overlapping shapes
+    # stay filled under the winding fill rule.
+    if area < 0:
+        reversed_flat = array("d")
+        for i in range(n - 2, -1, -2):
+            reversed_flat.append(flat[i])
+            reversed_flat.append(flat[i + 1])
+        return reversed_flat
+    return flat
+
+
+def _arc_poly_points(prim: gp.ArcPoly) -> list[tuple[float, float]]:
+    points = []
+    for (x1, y1), (x2, y2), (clockwise, (cx, cy)) in prim.segments:
+        if clockwise is None:
+            points.append((x1, y1))
+        else:
+            arc = list(approximate_arc(cx, cy, x1, y1, x2, y2, clockwise, max_error=ARC_MAX_ERROR_MM))
+            points.extend(arc[:-1])
+    return points
+
+
+def _rectangle_points(prim: gp.Rectangle) -> list[tuple[float, float]]:
+    cos, sin = math.cos(prim.rotation), math.sin(prim.rotation)
+    hw, hh = prim.w / 2, prim.h / 2
+    return [
+        (prim.x + dx * cos - dy * sin, prim.y + dx * sin + dy * cos)
+        for dx, dy in ((-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh))
+    ]
+
+
+def build_layer_geometry(gf: GerberFile | ExcellonFile) -> LayerGeometry:
+    geometry = LayerGeometry()
+    run: GeometryRun | None = None
+    polyline: array | None = None
+    polyline_width = 0.0
+
+    for obj in gf.objects:
+        for prim in obj.to_primitives(unit=MM):
+            if run is None or prim.polarity_dark != run.dark:
+                run = GeometryRun(dark=prim.polarity_dark)
+                geometry.runs.append(run)
+                polyline = None
+
+            if isinstance(prim, (gp.Line, gp.Arc)):
+                width = prim.width or HAIRLINE_WIDTH_MM
+                if isinstance(prim, gp.Line):
+                    points = ((prim.x1, prim.y1), (prim.x2, prim.y2))
+                else:
+                    points = approximate_arc(
+                        prim.cx, prim.cy, prim.x1, prim.y1, prim.x2, prim.y2,
+                        prim.clockwise, max_error=ARC_MAX_ERROR_MM,
+                    )
+
+                # Chain connected segments of equal width into one polyline,
+                # the same way gerbonara's own SVG export does.
+                if (
+                    polyline is not None
+                    and width == polyline_width
+                    and polyline[-2] == prim.x1
+                    and polyline[-1] == prim.y1
+                ):
+                    points = iter(points)
+                    next(points)
+                else:
+                    polyline = array("d")
+                    polyline_width = width
+                    run.strokes.setdefault(width, []).append(polyline)
+                for x, y in points:
+                    polyline.append(x)
+                    polyline.append(y)
+                continue
+
+            polyline = None
+            if isinstance(prim, gp.Circle):
+                run.circles.extend((prim.x, prim.y, prim.r))
+            elif isinstance(prim, gp.Rectangle):
+                run.polygons.append(_polygon(_rectangle_points(prim)))
+            elif isinstance(prim, gp.ArcPoly):
+                points = _arc_poly_points(prim)
+                if len(points) >= 3:
+                    run.polygons.append(_polygon(points))
+
+    geometry.runs = [run for run in geometry.runs if run.primitive_count]
+    geometry.bounds = geometry_bounds(geometry)
+    return geometry
+
+
+def decimate(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker: drop the points of an ``(n, 2)`` polyline closer than ``tolerance`` to the result.
+
+    The first and last point are always kept; pass a ring with its first point
+    repeated at the end to simplify a closed polygon.
+    """
+    n = len(points)
+    if n <= 2:
+        return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = points[first]
+        direction = points[last] - start
+        offsets = points[first + 1:last] - start
+        length = math.hypot(direction[0], direction[1])
+        if length == 0.0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(direction[0] * offsets[:, 1] - direction[1] * offsets[:, 0]) / length
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return points[keep]
+
+
+def _simplify_polygon(poly: array, tolerance: float) -> array | None:
+    points = np.frombuffer(poly, dtype=np.float64).reshape(-1, 2)
+    if np.ptp(points, axis=0).max() < tolerance:
+        return None
+    if len(points) <= DECIMATE_MIN_POINTS:
+        return poly
+    ring = decimate(np.vstack((points, points[:1])), tolerance)[:-1]
+    if len(ring) < 3:
+        return None
+    return array("d", ring.ravel().tobytes()) if len(ring) < len(points) else poly
+
+
+def _simplify_polyline(line: array, width: float, tolerance: float) -> array | None:
+    points = np.frombuffer(line, dtype=np.float64).reshape(-1, 2)
+    if np.ptp(points, axis=0).max() + width < tolerance:
+        return None
+    if len(points) <= DECIMATE_MIN_POINTS:
+        return line
+    simplified = decimate(points, tolerance)
+    return array("d", simplified.ravel().tobytes()) if len(simplified) < len(points) else line
+
+
+def merge_circles(circles: array, tolerance: float) -> array:
+    """Replace flashes whose centres share a ``tolerance`` grid cell by one circle covering them all.
+
+    Circles smaller than ``tolerance`` across are dropped afterwards.
+    """
+    if not circles:
+        return circles
+    xyr = np.frombuffer(circles, dtype=np.float64).reshape(-1, 3)
+    cells = np.floor(xyr[:, :2] / tolerance).astype(np.int64)
+    _, group, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    group = group.ravel()
+    if len(counts) < len(xyr):
+        centers = np.zeros((len(counts), 2))
+        np.add.at(centers, group, xyr[:, :2])
+        centers /= counts[:, None]
+        # Each merged circle reaches the far edge of its farthest member.
+        reach = np.hypot(*(xyr[:, :2] - centers[group]).T) + xyr[:, 2]
+        radii = np.zeros(len(counts))
+        np.maximum.at(radii, group, reach)
+        xyr = np.column_stack((centers, radii))
+    xyr = xyr[2 * xyr[:, 2] >= tolerance]
+    return array("d", xyr.ravel().tobytes())
+
+
+def simplify_runs(runs: list[GeometryRun], tolerance: float) -> list[GeometryRun]:
+    """A copy of ``runs`` that differs from them by at most about ``tolerance``.
+
+    Polygons and polylines are decimated, flashes closer than the tolerance
+    merged, and features smaller than it dropped.
+    """
+    simplified = []
+    for run in runs:
+        out = GeometryRun(dark=run.dark)
+        for poly in run.polygons:
+            poly = _simplify_polygon(poly, tolerance)
+            if poly is not None:
+                out.polygons.append(poly)
+        out.circles = merge_circles(run.circles, tolerance)
+        for width, lines in run.strokes.items():
+            kept = [line for line in (_simplify_polyline(line, width, tolerance) for line in lines) if line is not None]
+            if kept:
+                out.strokes[width] = kept
+        if out.primitive_count:
+            simplified.append(out)
+    return simplified
+
+
+def simplification_levels(geometry: LayerGeometry) -> list[tuple[float, list[GeometryRun]]]:
+    """Simplified copies of the geometry at :data:`SIMPLIFY_TOLERANCES_MM`, skipping those that save little."""
+    levels = []
+    vertices = sum(run.vertex_count for run in geometry.runs)
+    for tolerance in SIMPLIFY_TOLERANCES_MM:
+        runs = simplify_runs(geometry.runs, tolerance)
+        count = sum(run.vertex_count for run in runs)
+        if count <= vertices * SIMPLIFY_MIN_GAIN:
+            levels.append((tolerance, runs))
+            vertices = count
+    return levels
+
+
+def geometry_bounds(geometry: LayerGeometry) -> tuple[float, float, float, float] | None:
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+
+    for run in geometry.runs:
+        if not run.dark:
+            continue
+        for poly in run.polygons:
+            xs, ys = poly[0::2], poly[1::2]
+            xmin, xmax = min(xmin, min(xs)), max(xmax, max(xs))
+            ymin, ymax = min(ymin, min(ys)), max(ymax, max(ys))
+        circles = run.circles
+        for i in range(0, len(circles), 3):
+            x, y, r = circles[i], circles[i + 1], circles[i + 2]
+            xmin, xmax = min(xmin, x - r), max(xmax, x + r)
+            ymin, ymax = min(ymin, y - r), max(ymax, y + r)
+        for width, lines in run.strokes.items():
+            r = width / 2
+            for line in lines:
+                xs, ys = line[0::2], line[1::2]
+                xmin, xmax = min(xmin, min(xs) - r), max(xmax, max(xs) + r)
+                ymin, ymax = min(ymin, min(ys) - r), max(ymax, max(ys) + r)
+
+    if xmin > xmax:
+        return None
+    return (xmin, ymin, xmax, ymax)
+
+
+def _geometry_cache_key(path: LayerFile) -> str:
+    return combine_keys(
+        content_hash(path), f"geometry-v{GEOMETRY_VERSION}", getattr(gerbonara, "__version__", "")
+    )
+
+
+def cached_layer_geometry(path: LayerFile) -> LayerGeometry | None:
+    data = disk_cache.get("geom", _geometry_cache_key(path))
+    if data is None:
+        return None
+    try:
+        return pickle.loads(data)
+    except Exception:
+        return None
+
+
+def load_layer_geometry(path: LayerFile) -> LayerGeometry:
+    with tracer.span("cached geometry", file=path.name) as span:
+        geometry = cached_layer_geometry(path)
+        span.set(hit=geometry is not None)
+    if geometry is not None:
+        return geometry
+
+    # Only the flattened geometry is kept: registering or caching the parsed
+    # layer would hold it in every pool worker and store it twice on disk.
+    with tracer.span("parse", file=path.name) as span:
+        gf = parse_layer(path)
+        span.set(objects=len(gf.objects))
+    with tracer.span("flatten", file=path.name) as span:
+        geometry = build_layer_geometry(gf)
+        span.set(primitives=geometry.primitive_count)
+    with tracer.span("simplify", file=path.name) as span:
+        geometry.levels = simplification_levels(geometry)
+        span.set(levels=len(geometry.levels))
+    disk_cache.put("geom", _geometry_cache_key(path), pickle.dumps(geometry, protocol=pickle.HIGHEST_PROTOCOL))
+    return geometry
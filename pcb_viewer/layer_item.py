@@ -0,0 +1,410 @@
+import threading
+from functools import partial
+from typing import Callable
+
+from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QPainterPathStroker, QBrush, QColor, QTransform
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem
+
+from .models import BoundsMM, Side
+from .layer_geometry import LayerGeometry, GeometryRun
+from .tiles import (
+    MIN_LEVEL,
+    TileKey,
+    new_source_id,
+    tile_cache,
+    tile_level,
+    tile_range,
+    tile_rect,
+    tile_renderer,
+)
+
+# Scene units per millimetre. Matches the 90 dpi user units QSvgRenderer gives
+# the SVG backend, so markers and zoom behave the same with either backend.
+SCENE_UNITS_PER_MM = 90.0 / 25.4
+CURVE_THRESHOLD_MM = 0.002
+# Screen-space error, in pixels, allowed for a simplified level of a layer.
+# Under a quarter pixel the difference is lost in antialiasing.
+SIMPLIFY_MAX_ERROR_PX = 0.25
+
+
+def board_transform(bounds: BoundsMM, side: Side) -> QTransform:
+    k = SCENE_UNITS_PER_MM
+    if side == Side.TOP:
+        return QTransform(k, 0, 0, -k, -bounds.xmin * k, bounds.ymax * k)
+    return QTransform(-k, 0, 0, -k, bounds.xmax * k, bounds.ymax * k)
+
+
+def board_scene_rect(bounds: BoundsMM) -> QRectF:
+    k = SCENE_UNITS_PER_MM
+    return QRectF(0, 0, bounds.width * k, bounds.height * k)
+
+
+def _run_fill_path(run: GeometryRun) -> QPainterPath:
+    path = QPainterPath()
+    path.setFillRule(Qt.FillRule.WindingFill)
+    for poly in run.polygons:
+        path.moveTo(poly[0], poly[1])
+        for i in range(2, len(poly), 2):
+            path.lineTo(poly[i], poly[i + 1])
+        path.closeSubpath()
+    circles = run.circles
+    for i in range(0, len(circles), 3):
+        r = circles[i + 2]
+        path.addEllipse(QPointF(circles[i], circles[i + 1]), r, r)
+    return path
+
+
+def _run_stroke_outlines(run: GeometryRun, stroker: QPainterPathStroker) -> QPainterPath:
+    outlines = QPainterPath()
+    outlines.setFillRule(Qt.FillRule.WindingFill)
+    for width, lines in run.strokes.items():
+        path = QPainterPath()
+        for line in lines:
+            path.moveTo(line[0], line[1])
+            for i in range(2, len(line), 2):
+                path.lineTo(line[i], line[i + 1])
+        stroker.setWidth(width)
+        outlines.addPath(stroker.createStroke(path))
+    return outlines
+
+
+def _layer_stroker(curve_threshold: float = CURVE_THRESHOLD_MM) -> QPainterPathStroker:
+    stroker = QPainterPathStroker()
+    stroker.setCapStyle(Qt.PenCapStyle.RoundCap)
+    stroker.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+    # The default threshold is in path units (mm here) and turns sub-mm
+    # round caps into visible polygons once tiles are rendered zoomed in.
+    stroker.setCurveThreshold(curve_threshold)
+    return stroker
+
+
+def _run_paths(runs: list[GeometryRun], curve_threshold: float = CURVE_THRESHOLD_MM) -> list[tuple[bool, QPainterPath]]:
+    stroker = _layer_stroker(curve_threshold)
+    # Polygons, circles and stroke outlines all share one winding
+    # direction, so each run merges into one path without boolean ops.
+    paths = []
+    for run in runs:
+        path = _run_fill_path(run)
+        path.addPath(_run_stroke_outlines(run, stroker))
+        paths.append((run.dark, path))
+    return paths
+
+
+class LayerPaths:
+    """Per-run fill paths for one layer, built once from its geometry and shared by every item drawing it.
+
+    The simplified levels of the geometry are turned into paths on first use,
+    by whichever tile thread needs them.
+    """
+
+    def __init__(self, geometry: LayerGeometry):
+        self.runs: list[tuple[bool, QPainterPath]] = _run_paths(geometry.runs)
+        self._fill: QPainterPath | None = None
+        self._levels = geometry.levels
+        self._level_runs: dict[float, list[tuple[bool, QPainterPath]]] = {}
+        self._level_lock = threading.Lock()
+
+        if geometry.bounds is not None:
+            xmin, ymin, xmax, ymax = geometry.bounds
+            self.bounding_rect = QRectF(xmin, ymin, xmax - xmin, ymax - ymin)
+        else:
+            self.bounding_rect = QRectF()
+
+    @property
+    def has_clear_runs(self) -> bool:
+        return any(not dark for dark, _ in self.runs)
+
+    def runs_for_scale(self, pixels_per_mm: float) -> list[tuple[bool, QPainterPath]]:
+        """The coarsest runs that stay within :data:`SIMPLIFY_MAX_ERROR_PX` at this scale."""
+        if pixels_per_mm <= 0:
+            return self.runs
+        max_error_mm = SIMPLIFY_MAX_ERROR_PX / pixels_per_mm
+        chosen = None
+        for tolerance, runs in self._levels:
+            if tolerance > max_error_mm:
+                break
+            chosen = tolerance, runs
+        if chosen is None:
+            return self.runs
+
+        tolerance, runs = chosen
+        with self._level_lock:
+            paths = self._level_runs.get(tolerance)
+            if paths is None:
+                # Round caps and joins may be as coarse as the rest of the level.
+                paths = self._level_runs[tolerance] = _run_paths(runs, max(CURVE_THRESHOLD_MM, tolerance))
+        return paths
+
+    @property
+    def fill(self) -> QPainterPath:
+        """The whole layer as a single path, with clear runs cut out."""
+        if self._fill is None:
+            self._fill = self._combine_runs()
+        return self._fill
+
+    def _combine_runs(self) -> QPainterPath:
+        if not self.has_clear_runs:
+            combined = QPainterPath()
+            combined.setFillRule(Qt.FillRule.WindingFill)
+            for _, path in self.runs:
+                combined.addPath(path)
+            return combined
+
+        # Clear polarity can only be honoured in a single path with boolean
+        # operations. They flatten curves, so this is kept for vector output
+        # and tiles draw the runs one by one instead.
+        combined: QPainterPath | None = None
+        for dark, path in self.runs:
+            if dark:
+                combined = path if combined is None else combined.united(path)
+            elif combined is not None:
+                combined = combined.subtracted(path)
+
+        # Boolean results carry their own fill rule, so leave it untouched.
+        return combined if combined is not None else QPainterPath()
+
+
+def draw_layer_paths(painter: QPainter, paths: LayerPaths, color: QColor):
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.fillPath(paths.fill, QBrush(color))
+
+
+def draw_layer_runs(painter: QPainter, paths: LayerPaths, color: QColor):
+    """Draw runs in order, erasing clear ones; only valid on a surface holding this layer alone.
+
+    Runs come from the simplified level that matches the painter's scale.
+    """
+    brush = QBrush(color)
+    painter.setPen(Qt.PenStyle.NoPen)
+    scale = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+    for dark, path in paths.runs_for_scale(scale):
+        painter.setCompositionMode(
+            QPainter.CompositionMode.CompositionMode_SourceOver
+            if dark
+            else QPainter.CompositionMode.CompositionMode_Clear
+        )
+        painter.fillPath(path, brush)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+
+class TiledItem(QGraphicsItem):
+    """Base for items drawn on screen from a pyramid of background-rendered raster tiles.
+
+    Subclasses provide ``boundingRect``, ``draw_vectors`` for off-screen
+    rendering and ``tile_draw``, a thread-safe callable that paints the item
+    in item coordinates onto a tile.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source_id = new_source_id()
+        self._instances: list[TiledInstance] = []
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def draw_vectors(self, painter: QPainter):
+        raise NotImplementedError
+
+    def tile_draw(self) -> Callable[[QPainter], None]:
+        raise NotImplementedError
+
+    @property
+    def source_id(self) -> int:
+        """Key prefix of this item's tiles in the tile cache."""
+        return self._source_id
+
+    def release_tiles(self):
+        """Drop this item's cached and pending tiles; call when it leaves the scene."""
+        self._release_tiles(self._source_id)
+
+    def _invalidate_tiles(self):
+        # Tiles are baked, so new content means a new tile source.
+        old_source_id = self._source_id
+        self._source_id = new_source_id()
+        self._release_tiles(old_source_id)
+        self.update()
+        for instance in self._instances:
+            instance._follow_source()
+
+    def _prepare_geometry_change(self):
+        self.prepareGeometryChange()
+        for instance in self._instances:
+            instance.prepareGeometryChange()
+
+    @staticmethod
+    def _release_tiles(source_id: int):
+        tile_renderer().cancel_where(lambda key: key[0] == source_id)
+        tile_cache.discard_source(source_id)
+
+    def paint(self, painter, option, widget=None):
+        # Off-screen rendering (exports, QGraphicsScene.render) has no viewport
+        # widget and wants the exact vectors rather than whatever tiles exist.
+        if widget is None:
+            self.draw_vectors(painter)
+            return
+
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+
+        level = tile_level(QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform()))
+        source_id = self._source_id
+        renderer = tile_renderer()
+        renderer.cancel_where(lambda key: key[0] == source_id and key[1] != level)
+        draw = self.tile_draw()
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+
+        tx0, ty0, tx1, ty1 = tile_range(exposed, level)
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                key = (source_id, level, tx, ty)
+                rect = tile_rect(level, tx, ty)
+                image = tile_cache.get(key)
+                if image is not None:
+                    painter.drawImage(rect, image)
+                    continue
+                renderer.request(key, draw, self._on_tile_ready)
+                self._draw_fallback(painter, key, rect)
+
+        painter.restore()
+
+    def prefetch(self, pixels_per_unit: float):
+        """Queue every tile this item needs at the given scale, behind on-screen requests."""
+        self.request_tiles(self.boundingRect(), tile_level(pixels_per_unit), priority=-1)
+
+    def request_tiles(
+        self,
+        rect: QRectF,
+        level: int,
+        on_ready: Callable[[TileKey], None] | None = None,
+        priority: int = 0,
+    ) -> list[TileKey]:
+        """Queue the uncached tiles covering ``rect`` (item coordinates) at ``level``.
+
+        Returns their keys; ``on_ready`` is told about each one as it lands in
+        the cache, in addition to the item repainting it.
+        """
+        rect = rect.intersected(self.boundingRect())
+        if rect.isEmpty():
+            return []
+        draw = self.tile_draw()
+        renderer = tile_renderer()
+
+        keys = []
+        tx0, ty0, tx1, ty1 = tile_range(rect, level)
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                key = (self._source_id, level, tx, ty)
+                if tile_cache.get(key) is not None:
+                    continue
+                renderer.request(key, draw, self._on_tile_ready, priority)
+                if on_ready is not None:
+                    renderer.request(key, draw, on_ready, priority)
+                keys.append(key)
+        return keys
+
+    def _draw_fallback(self, painter: QPainter, key: TileKey, rect: QRectF):
+        source_id, level, tx, ty = key
+
+        # Prefer a scaled-up piece of a coarser tile that is already cached.
+        for coarse_level in range(level - 1, MIN_LEVEL - 1, -1):
+            shift = level - coarse_level
+            ctx, cty = tx >> shift, ty >> shift
+            image = tile_cache.get((source_id, coarse_level, ctx, cty))
+            if image is None:
+                continue
+            coarse = tile_rect(coarse_level, ctx, cty)
+            scale = image.width() / coarse.width()
+            source = QRectF(
+                (rect.x() - coarse.x()) * scale,
+                (rect.y() - coarse.y()) * scale,
+                rect.width() * scale,
+                rect.height() * scale,
+            )
+            painter.drawImage(rect, image, source)
+            return
+
+        # When zooming out, the four finer tiles may still be around.
+        for dy in (0, 1):
+            for dx in (0, 1):
+                fine_key = (source_id, level + 1, tx * 2 + dx, ty * 2 + dy)
+                image = tile_cache.get(fine_key)
+                if image is not None:
+                    painter.drawImage(tile_rect(*fine_key[1:]), image)
+
+    def _on_tile_ready(self, key: TileKey):
+        self.update(tile_rect(*key[1:]))
+
+
+class TiledInstance(TiledItem):
+    """Another copy of a tiled item, placed by its own transform and drawn from the same tiles.
+
+    Tiles are keyed in item coordinates, so every copy shown at the same
+    scale reuses the tiles rendered for the others. The copy is a child of
+    its source, whose visibility, opacity and stacking it follows, and the
+    source keeps ownership of the tiles.
+    """
+
+    def __init__(self, source: TiledItem, transform: QTransform):
+        super().__init__(source)
+        self._source = source
+        self._source_id = source._source_id
+        self.setTransform(transform)
+        source._instances.append(self)
+
+    def boundingRect(self) -> QRectF:
+        return self._source.boundingRect()
+
+    def draw_vectors(self, painter: QPainter):
+        self._source.draw_vectors(painter)
+
+    def tile_draw(self) -> Callable[[QPainter], None]:
+        return self._source.tile_draw()
+
+    def release_tiles(self):
+        """Nothing to drop: the tiles belong to the source and are released with it."""
+
+    def _follow_source(self):
+        self._source_id = self._source._source_id
+        self.update()
+
+
+class LayerItem(TiledItem):
+    """One board layer, drawn on screen from a pyramid of background-rendered raster tiles."""
+
+    def __init__(self, paths: LayerPaths, color: str | QColor, parent=None):
+        super().__init__(parent)
+        self._paths = paths
+        self._color = QColor(color)
+
+    def boundingRect(self) -> QRectF:
+        return self._paths.bounding_rect
+
+    def color(self) -> QColor:
+        return QColor(self._color)
+
+    def set_color(self, color: str | QColor):
+        color = QColor(color)
+        if color == self._color:
+            return
+        self._color = color
+
+        # Tiles are baked in one colour; the geometry itself is reused as is.
+        self._invalidate_tiles()
+
+    def set_paths(self, paths: LayerPaths):
+        """Swap in reloaded geometry, keeping colour, opacity and visibility."""
+        if paths is self._paths:
+            return
+        self._prepare_geometry_change()
+        self._paths = paths
+        self._invalidate_tiles()
+
+    def draw_vectors(self, painter: QPainter):
+        draw_layer_paths(painter, self._paths, self._color)
+
+    def tile_draw(self) -> Callable[[QPainter], None]:
+        return partial(draw_layer_runs, paths=self._paths, color=QColor(self._color))
@@ -0,0 +1,77 @@
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget, QGridLayout, QCheckBox, QPushButton, QSlider, QColorDialog
+
+from .render_board import LayerStyle
+
+
+class LayerPanel(QWidget):
+    """One row per layer in the stack: visibility, colour and opacity."""
+
+    visibility_changed = Signal(str, bool)
+    opacity_changed = Signal(str, float)
+    color_changed = Signal(str, str)
+
+    def __init__(self, styles: list[LayerStyle], parent=None):
+        super().__init__(parent)
+        self._styles = {style.key: style for style in styles}
+        self._checkboxes: dict[str, QCheckBox] = {}
+        self._color_buttons: dict[str, QPushButton] = {}
+        self._opacity_sliders: dict[str, QSlider] = {}
+
+        layout = QGridLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Top of the stack first, the way layer lists usually read.
+        for row, style in enumerate(reversed(styles)):
+            checkbox = QCheckBox(style.label)
+            checkbox.setChecked(style.visible)
+            checkbox.toggled.connect(lambda checked, key=style.key: self._on_visibility_toggled(key, checked))
+            layout.addWidget(checkbox, row, 0)
+
+            color_button = QPushButton()
+            color_button.setFixedSize(24, 18)
+            color_button.clicked.connect(lambda _=False, key=style.key: self._on_color_clicked(key))
+            layout.addWidget(color_button, row, 1)
+
+            slider = QSlider(Qt.Orientation.Horizontal)
+            slider.setRange(0, 100)
+            slider.setValue(round(style.opacity * 100))
+            slider.valueChanged.connect(lambda value, key=style.key: self._on_opacity_changed(key, value))
+            layout.addWidget(slider, row, 2)
+
+            self._checkboxes[style.key] = checkbox
+            self._color_buttons[style.key] = color_button
+            self._opacity_sliders[style.key] = slider
+            self._update_color_button(style.key)
+
+        layout.setColumnStretch(2, 1)
+
+    def set_available(self, keys: set[str]):
+        for key, checkbox in self._checkboxes.items():
+            enabled = key in keys
+            checkbox.setEnabled(enabled)
+            self._color_buttons[key].setEnabled(enabled)
+            self._opacity_sliders[key].setEnabled(enabled)
+
+    def _update_color_button(self, key: str):
+        self._color_buttons[key].setStyleSheet(
+            f"background-color: {self._styles[key].color}; border: 1px solid #808080;"
+        )
+
+    def _on_visibility_toggled(self, key: str, checked: bool):
+        self._styles[key].visible = checked
+        self.visibility_changed.emit(key, checked)
+
+    def _on_opacity_changed(self, key: str, value: int):
+        self._styles[key].opacity = value / 100.0
+        self.opacity_changed.emit(key, value / 100.0)
+
+    def _on_color_clicked(self, key: str):
+        style = self._styles[key]
+        color = QColorDialog.getColor(QColor(style.color), self, f"{style.label} Colour")
+        if not color.isValid():
+            return
+        style.color = color.name()
+        self._update_color_button(key)
+        self.color_changed.emit(key, style.color)
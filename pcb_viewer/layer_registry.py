@@ -0,0 +1,83 @@
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+
+import gerbonara
+from gerbonara import GerberFile, ExcellonFile
+
+from .disk_cache import disk_cache, content_hash, combine_keys
+from .gerber_loader import LayerFile, is_drill_file
+
+
+@dataclass
+class RegistryStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class LayerRegistry:
+    def __init__(self):
+        self._layers: dict[Path, tuple[int, GerberFile | ExcellonFile]] = {}
+        self.stats = RegistryStats()
+
+    def open(self, path: str | LayerFile) -> GerberFile | ExcellonFile:
+        if isinstance(path, str):
+            path = Path(path)
+        key = path.resolve()
+        mtime = path.stat().st_mtime_ns
+
+        entry = self._layers.get(key)
+        if entry is not None and entry[0] == mtime:
+            self.stats.hits += 1
+            return entry[1]
+
+        self.stats.misses += 1
+        gf = _load_layer(path)
+        self._layers[key] = (mtime, gf)
+        return gf
+
+    def discard(self, paths):
+        """Forget the parsed layers of these files, e.g. when their board is unloaded."""
+        for path in paths:
+            if isinstance(path, str):
+                path = Path(path)
+            self._layers.pop(path.resolve(), None)
+
+    def clear(self):
+        self._layers.clear()
+        self.stats = RegistryStats()
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+
+def _load_layer(path: LayerFile) -> GerberFile | ExcellonFile:
+    cache_key = combine_keys(content_hash(path), getattr(gerbonara, "__version__", ""))
+
+    data = disk_cache.get("layer", cache_key)
+    if data is not None:
+        try:
+            return pickle.loads(data)
+        except Exception:
+            pass
+
+    gf = parse_layer(path)
+    try:
+        disk_cache.put("layer", cache_key, pickle.dumps(gf, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        pass
+    return gf
+
+
+def parse_layer(path: LayerFile) -> GerberFile | ExcellonFile:
+    """Parse a layer file, bypassing both the registry and the disk cache."""
+    if not isinstance(path, Path):
+        # Archive members are parsed from memory.
+        kind = ExcellonFile if is_drill_file(path) else GerberFile
+        return kind.from_string(path.read_text(errors="replace"), filename=Path(path.name))
+    if is_drill_file(path):
+        return ExcellonFile.open(path)
+    return GerberFile.open(path)
+
+
+layer_registry = LayerRegistry()
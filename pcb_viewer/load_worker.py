@@ -0,0 +1,285 @@
+import multiprocessing
+import os
+import queue
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from .models import BoundsMM, Side
+from .gerber_loader import GerberSet, LayerFile, discover_gerbers
+from .layer_geometry import LayerGeometry
+from .render_board import (
+    LoadedLayer,
+    bounds_layers,
+    side_layers,
+    load_layer,
+    merge_bounds,
+    cached_board_bounds,
+    store_board_bounds,
+)
+from .tracing import Span, tracer
+
+
+def create_load_executor() -> Executor | None:
+    # Spawned workers import only the Qt-free render modules, which is safe
+    # next to a running QApplication where fork() is not.
+    try:
+        return ProcessPoolExecutor(
+            max_workers=max(1, min(os.cpu_count() or 1, 8)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    except (OSError, NotImplementedError):
+        return None
+
+
+def board_layer_paths(gerber_set: GerberSet) -> list[LayerFile]:
+    paths: dict[LayerFile, None] = {}
+    for side in Side:
+        for path in side_layers(gerber_set, side).values():
+            paths[path] = None
+    for path in bounds_layers(gerber_set):
+        paths[path] = None
+    return list(paths)
+
+
+# (mtime_ns, size) of a layer file when it was read; None if it could not be stat'ed.
+LayerStamp = tuple[int, int] | None
+
+
+def layer_stamp(path: LayerFile) -> LayerStamp:
+    try:
+        stat = path.stat()
+    except (OSError, KeyError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class GerberLoadResult:
+    folder: str
+    gerber_set: GerberSet
+    bounds: BoundsMM
+    layers: dict[LayerFile, LayerGeometry] = field(default_factory=dict)
+    # Stamps taken before the layers were read, so a write racing the load
+    # still shows up as a change next time.
+    stamps: dict[LayerFile, LayerStamp] = field(default_factory=dict)
+    # Set on reloads: the layers that were read again rather than kept.
+    reloaded: set[LayerFile] | None = None
+    # Layers that could not be read, with the reason; they are empty in ``layers``.
+    errors: dict[LayerFile, str] = field(default_factory=dict)
+
+
+def unchanged_layers(
+    previous: GerberLoadResult | None, stamps: dict[LayerFile, LayerStamp]
+) -> dict[LayerFile, LayerGeometry]:
+    """Geometry from ``previous`` for the layers whose files still carry the same stamp."""
+    if previous is None:
+        return {}
+    return {
+        path: geometry
+        for path, geometry in previous.layers.items()
+        if path in stamps and stamps[path] is not None and previous.stamps.get(path) == stamps[path]
+    }
+
+
+def reusable_layers(
+    gerber_set: GerberSet, previous: GerberLoadResult | None
+) -> tuple[dict[LayerFile, LayerGeometry], dict[LayerFile, LayerStamp]]:
+    """Layers that need no worker because they are unchanged since ``previous``, and the stamps of all.
+
+    Only file stamps are compared here. Hashing files and unpickling cached
+    geometry is left to :func:`load_layer`, which checks the disk cache
+    before parsing, so it stays off the GUI thread.
+    """
+    stamps = {path: layer_stamp(path) for path in board_layer_paths(gerber_set)}
+    return unchanged_layers(previous, stamps), stamps
+
+
+def _reloaded(previous: GerberLoadResult | None, layers: dict[LayerFile, LayerGeometry]) -> set[LayerFile] | None:
+    if previous is None:
+        return None
+    return {path for path, geometry in layers.items() if previous.layers.get(path) is not geometry}
+
+
+def board_bounds(gerber_set: GerberSet, layers: dict[LayerFile, LayerGeometry]) -> BoundsMM:
+    with tracer.span("board bounds"):
+        return _board_bounds(gerber_set, layers)
+
+
+def _board_bounds(gerber_set: GerberSet, layers: dict[LayerFile, LayerGeometry]) -> BoundsMM:
+    bounds = cached_board_bounds(gerber_set)
+    if bounds is None:
+        bounds = merge_bounds([layers[p].bounds for p in bounds_layers(gerber_set)])
+        store_board_bounds(gerber_set, bounds)
+    return bounds
+
+
+def load_board(
+    folder: str | Path, executor: Executor | None = None, previous: GerberLoadResult | None = None
+) -> GerberLoadResult:
+    """Discover and load a whole Gerber folder, blocking; layers not on disk go to ``executor``.
+
+    With ``previous``, layers whose files are unchanged since that load are kept as they are.
+    """
+    with tracer.span("discover"):
+        gerber_set = discover_gerbers(folder)
+    layers, stamps = reusable_layers(gerber_set, previous)
+    missing = [path for path in board_layer_paths(gerber_set) if path not in layers]
+    errors = {}
+
+    with tracer.span("load layers", count=len(missing)) as span:
+        load = partial(load_layer, trace=tracer.enabled)
+        loaded = executor.map(load, missing) if executor is not None else map(load, missing)
+        for result in loaded:
+            layers[result.path] = result.geometry
+            if result.error is not None:
+                errors[result.path] = result.error
+            tracer.extend(result.spans, span)
+
+    bounds = board_bounds(gerber_set, layers)
+    return GerberLoadResult(str(folder), gerber_set, bounds, layers, stamps, _reloaded(previous, layers), errors)
+
+
+class GerberLoadJob(QObject):
+    progress = Signal(int, int)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    _futures_ready = Signal()
+
+    def __init__(
+        self,
+        folder: str,
+        executor: Executor | None,
+        parent=None,
+        trace_parent: Span | None = None,
+        previous: GerberLoadResult | None = None,
+    ):
+        super().__init__(parent)
+        self._folder = folder
+        self._previous = previous
+        self._trace_parent = trace_parent
+        self._discover_span = self._layers_span = None
+        self._executor = executor
+        self._futures: list[Future] = []
+        self._cancelled = False
+        self._gerber_set: GerberSet | None = None
+        self._layers: dict[LayerFile, LayerGeometry] = {}
+        self._stamps: dict[LayerFile, LayerStamp] = {}
+        self._errors: dict[LayerFile, str] = {}
+        self._pending = 0
+        self._total = 0
+        self._done_queue: queue.SimpleQueue[Future] = queue.SimpleQueue()
+        self._futures_ready.connect(self._drain_done_queue)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def start(self):
+        if self._executor is None:
+            self._run_synchronously()
+            return
+        self.progress.emit(0, 1)
+        self._discover_span = tracer.start_span("discover", self._trace_parent)
+        self._submit(discover_gerbers, self._folder)
+
+    def cancel(self):
+        self._cancelled = True
+        for future in self._futures:
+            future.cancel()
+        self._futures.clear()
+
+    def _submit(self, fn, *args):
+        future = self._executor.submit(fn, *args)
+        self._futures.append(future)
+        # Done-callbacks run on an executor thread. Finished futures are handed
+        # over through a queue and an argument-less signal wakes the GUI
+        # thread to collect them.
+        future.add_done_callback(self._on_future_callback)
+
+    def _on_future_callback(self, future: Future):
+        if not self._cancelled:
+            self._done_queue.put(future)
+            self._futures_ready.emit()
+
+    def _drain_done_queue(self):
+        while not self._cancelled:
+            try:
+                future = self._done_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._on_future_done(future)
+
+    def _on_future_done(self, future: Future):
+        if self._cancelled or future.cancelled():
+            return
+        if future in self._futures:
+            self._futures.remove(future)
+
+        error = future.exception()
+        if error is not None:
+            self.cancel()
+            self.failed.emit(str(error))
+            return
+
+        result = future.result()
+        if isinstance(result, GerberSet):
+            self._on_discovered(result)
+        elif isinstance(result, LoadedLayer):
+            self._layers[result.path] = result.geometry
+            if result.error is not None:
+                self._errors[result.path] = result.error
+            tracer.extend(result.spans, self._layers_span)
+            self._pending -= 1
+            self.progress.emit(self._total - self._pending, self._total)
+            if self._pending == 0:
+                self._finish()
+
+    def _on_discovered(self, gerber_set: GerberSet):
+        self._discover_span.finish()
+        self._gerber_set = gerber_set
+
+        self._layers, self._stamps = reusable_layers(gerber_set, self._previous)
+        missing = [path for path in board_layer_paths(gerber_set) if path not in self._layers]
+
+        if not missing:
+            self._finish()
+            return
+
+        self._layers_span = tracer.start_span("load layers", self._trace_parent, count=len(missing))
+        self._total = self._pending = len(missing)
+        self.progress.emit(0, self._total)
+        for path in missing:
+            self._submit(load_layer, path, tracer.enabled)
+
+    def _finish(self):
+        if self._layers_span is not None:
+            self._layers_span.finish()
+        gerber_set = self._gerber_set
+        with tracer.within(self._trace_parent):
+            bounds = board_bounds(gerber_set, self._layers)
+        layers = dict(self._layers)
+        self.finished.emit(
+            GerberLoadResult(
+                self._folder,
+                gerber_set,
+                bounds,
+                layers,
+                dict(self._stamps),
+                _reloaded(self._previous, layers),
+                dict(self._errors),
+            )
+        )
+
+    def _run_synchronously(self):
+        try:
+            with tracer.within(self._trace_parent):
+                result = load_board(self._folder, previous=self._previous)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(result)
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 
 from PySide6.QtWidgets import QApplication
@@ -6,6 +7,13 @@ from .main_window import MainWindow
 
 
 def main():
+    multiprocessing.freeze_support()
+
+    if len(sys.argv) > 1 and sys.argv[1] == "sheets":
+        from .batch import main as sheets_main
+
+        sys.exit(sheets_main(sys.argv[2:]))
+
     app = QApplication(sys.argv)
     app.setApplicationName("PCB Viewer")
 
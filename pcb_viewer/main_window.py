@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -16,14 +16,46 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QSlider,
     QSizePolicy,
+    QProgressBar,
+    QLineEdit,
+    QCheckBox,
+    QDockWidget,
+    QTabBar,
+    QSpinBox,
+    QDialog,
 )
 
-from .models import Component, BoundsMM, Side
-from .pickplace import parse_pickplace_csv
-from .gerber_loader import discover_gerbers, GerberSet
-from .render_board import render_gerber_to_svg, get_board_bounds
+from .models import BoundsMM, Side
+from .pickplace import (
+    ColumnMapping,
+    UnknownPlacementFormat,
+    csv_header,
+    file_filter,
+    load_pickplace_store,
+    sniff_format,
+)
+from .component_store import ComponentStore
+from .search_index import SearchIndex
+from .gerber_loader import GerberSet, LayerFile
+from .render_board import render_gerber_to_svg, side_layers, default_layer_styles
+from .load_worker import GerberLoadJob, GerberLoadResult, create_load_executor
+from .layer_geometry import LayerGeometry
+from .layer_item import LayerPaths
+from .tiles import tile_renderer
+from .file_watcher import FileWatcher
+from .board_session import BoardSession, SessionCache, DEFAULT_BUDGET_BYTES, estimate_bytes
+from .layer_panel import LayerPanel
+from .timing_panel import TimingPanel
+from .tracing import NULL_SPAN, tracer
 from .components_table import ComponentsTableModel, ComponentsTableView
+from .column_mapping_dialog import ColumnMappingDialog
+from .panel import PanelLayout
+from .panel_dialog import PanelDialog
 from .pcb_view import PCBView
+from .disk_cache import disk_cache
+from .layer_registry import layer_registry
+
+MB = 1024 * 1024
 
 
 class MainWindow(QMainWindow):
@@ -32,14 +64,37 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("PCB Viewer")
         self.setMinimumSize(1200, 800)
 
-        self._components: list[Component] = []
+        self._store = ComponentStore.empty()
+        self._search_index = SearchIndex(self._store)
         self._gerber_set: GerberSet | None = None
         self._bounds: BoundsMM | None = None
         self._current_side: Side = Side.TOP
-        self._svg_cache: dict[Side, bytes] = {}
+        self._layer_geometry: dict[LayerFile, LayerGeometry] = {}
+        self._layer_paths: dict[LayerFile, LayerPaths] = {}
+        self._layer_styles = default_layer_styles()
+        self._load_executor = None
+        self._load_job: GerberLoadJob | None = None
+        self._load_span = NULL_SPAN
+        self._load_is_reload = False
+        # The last finished board load, kept so a reload can reuse unchanged layers.
+        self._board: GerberLoadResult | None = None
+        self._gerber_source: str | None = None
+        self._pnp_path: str | None = None
+        # How to read a Pick & Place file that is in no known format.
+        self._pnp_mapping: ColumnMapping | None = None
+        # Step-and-repeat layout the board is shown in, or None for a single board.
+        self._panel: PanelLayout | None = None
+        self._watcher = FileWatcher(self)
+        # Open boards in tab order; the one on screen lives in the fields above.
+        self._sessions: list[BoardSession] = []
+        self._session_cache = SessionCache()
+        self._session: BoardSession | None = None
+        # Where to put the view once an evicted board has been loaded again.
+        self._pending_view_state = None
 
         self._setup_ui()
         self._connect_signals()
+        self._add_session(BoardSession())
 
     def _setup_ui(self):
         toolbar = QToolBar("Main Toolbar")
@@ -49,7 +104,10 @@ class MainWindow(QMainWindow):
         self._load_gerber_btn = QPushButton("Load Gerber Folder...")
         toolbar.addWidget(self._load_gerber_btn)
 
-        self._load_pnp_btn = QPushButton("Load Pick && Place CSV...")
+        self._load_gerber_zip_btn = QPushButton("Load Gerber Zip...")
+        toolbar.addWidget(self._load_gerber_zip_btn)
+
+        self._load_pnp_btn = QPushButton("Load Pick && Place...")
         toolbar.addWidget(self._load_pnp_btn)
 
         toolbar.addSeparator()
@@ -60,17 +118,43 @@ class MainWindow(QMainWindow):
         self._side_combo.addItem("Bottom", Side.BOTTOM)
         toolbar.addWidget(self._side_combo)
 
+        self._placements_check = QCheckBox("Show Placements")
+        toolbar.addWidget(self._placements_check)
+
+        self._panel_btn = QPushButton("Panel...")
+        self._panel_btn.setToolTip("Show the board as a step-and-repeat panel")
+        toolbar.addWidget(self._panel_btn)
+
         toolbar.addSeparator()
 
         self._zoom_fit_btn = QPushButton("Zoom to Fit")
         toolbar.addWidget(self._zoom_fit_btn)
 
+        self._export_svg_btn = QPushButton("Export SVG...")
+        toolbar.addWidget(self._export_svg_btn)
+
         toolbar.addWidget(QLabel("  Marker Size: "))
         self._marker_size_slider = QSlider(Qt.Orientation.Horizontal)
         self._marker_size_slider.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
         self._marker_size_slider.setValue(50)
         toolbar.addWidget(self._marker_size_slider)
 
+        toolbar.addSeparator()
+
+        self._watch_check = QCheckBox("Watch Files")
+        self._watch_check.setToolTip("Reload changed Gerber layers and the Pick && Place file when they are re-exported")
+        toolbar.addWidget(self._watch_check)
+
+        self._clear_cache_btn = QPushButton("Clear Cache")
+        toolbar.addWidget(self._clear_cache_btn)
+
+        self._timing_dock = QDockWidget("Timing", self)
+        self._timing_dock.setObjectName("timing_dock")
+        self._timing_dock.setWidget(TimingPanel())
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._timing_dock)
+        self._timing_dock.hide()
+        toolbar.addAction(self._timing_dock.toggleViewAction())
+
         central = QWidget()
         self.setCentralWidget(central)
         layout = QHBoxLayout(central)
@@ -85,6 +169,11 @@ class MainWindow(QMainWindow):
         table_group = QGroupBox("Components")
         table_layout = QVBoxLayout(table_group)
 
+        self._search_edit = QLineEdit()
+        self._search_edit.setPlaceholderText("Search designator, value, footprint… (C47, 100nF 0402, R10-R40)")
+        self._search_edit.setClearButtonEnabled(True)
+        table_layout.addWidget(self._search_edit)
+
         self._table_model = ComponentsTableModel()
         self._table_view = ComponentsTableView()
         self._table_view.setModel(self._table_model)
@@ -92,24 +181,76 @@ class MainWindow(QMainWindow):
 
         left_layout.addWidget(table_group)
 
+        layers_group = QGroupBox("Layers")
+        layers_layout = QVBoxLayout(layers_group)
+        self._layer_panel = LayerPanel(list(self._layer_styles.values()))
+        self._layer_panel.set_available(set())
+        layers_layout.addWidget(self._layer_panel)
+        left_layout.addWidget(layers_group)
+
         self._pcb_view = PCBView()
 
+        board_panel = QWidget()
+        board_layout = QVBoxLayout(board_panel)
+        board_layout.setContentsMargins(0, 0, 0, 0)
+        board_layout.setSpacing(0)
+        tabs_row = QHBoxLayout()
+        self._board_tabs = QTabBar()
+        self._board_tabs.setTabsClosable(True)
+        self._board_tabs.setExpanding(False)
+        self._board_tabs.setDocumentMode(True)
+        tabs_row.addWidget(self._board_tabs, 1)
+        self._new_board_btn = QPushButton("New Board")
+        tabs_row.addWidget(self._new_board_btn)
+        self._memory_label = QLabel()
+        tabs_row.addWidget(self._memory_label)
+        self._memory_budget_spin = QSpinBox()
+        self._memory_budget_spin.setRange(64, 1024 * 1024)
+        self._memory_budget_spin.setSingleStep(256)
+        self._memory_budget_spin.setSuffix(" MB")
+        self._memory_budget_spin.setValue(DEFAULT_BUDGET_BYTES // MB)
+        self._memory_budget_spin.setToolTip("Memory for open boards; the least recently viewed are unloaded beyond it")
+        tabs_row.addWidget(self._memory_budget_spin)
+        board_layout.addLayout(tabs_row)
+        board_layout.addWidget(self._pcb_view, 1)
+
         splitter.addWidget(left_panel)
-        splitter.addWidget(self._pcb_view)
+        splitter.addWidget(board_panel)
         splitter.setSizes([300, 900])
 
-        self._status_label = QLabel("Load Gerber folder and Pick & Place CSV to begin")
+        self._status_label = QLabel("Load Gerber folder and Pick & Place file to begin")
         self.statusBar().addWidget(self._status_label)
 
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setMaximumWidth(200)
+        self._progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self._progress_bar)
+
     def _connect_signals(self):
         self._load_gerber_btn.clicked.connect(self._on_load_gerber)
+        self._load_gerber_zip_btn.clicked.connect(self._on_load_gerber_zip)
         self._load_pnp_btn.clicked.connect(self._on_load_pnp)
         self._side_combo.currentIndexChanged.connect(self._on_side_changed)
+        self._placements_check.toggled.connect(self._pcb_view.set_placements_visible)
+        self._panel_btn.clicked.connect(self._on_panel)
         self._zoom_fit_btn.clicked.connect(self._pcb_view.zoom_to_fit)
+        self._export_svg_btn.clicked.connect(self._on_export_svg)
         self._table_view.selectionModel().selectionChanged.connect(
             self._on_table_selection_changed
         )
+        self._board_tabs.currentChanged.connect(self._on_board_tab_changed)
+        self._board_tabs.tabCloseRequested.connect(self._on_board_tab_close_requested)
+        self._new_board_btn.clicked.connect(lambda: self._add_session(BoardSession()))
+        self._memory_budget_spin.valueChanged.connect(self._on_memory_budget_changed)
         self._marker_size_slider.valueChanged.connect(self._on_marker_size_changed)
+        self._search_edit.textChanged.connect(self._on_search_changed)
+        self._pcb_view.component_clicked.connect(self._on_component_clicked)
+        self._clear_cache_btn.clicked.connect(self._on_clear_cache)
+        self._watch_check.toggled.connect(self._on_watch_toggled)
+        self._watcher.changed.connect(self._on_watched_files_changed)
+        self._layer_panel.visibility_changed.connect(self._pcb_view.set_layer_visible)
+        self._layer_panel.opacity_changed.connect(self._pcb_view.set_layer_opacity)
+        self._layer_panel.color_changed.connect(self._pcb_view.set_layer_color)
 
     def _on_load_gerber(self):
         folder = QFileDialog.getExistingDirectory(
@@ -117,65 +258,392 @@ class MainWindow(QMainWindow):
         )
         if not folder:
             return
+        self._open_gerbers(folder)
+
+    def _on_load_gerber_zip(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Select Gerber Archive", "", "Zip Archives (*.zip);;All Files (*)"
+        )
+        if not file_path:
+            return
+        self._open_gerbers(file_path)
+
+    def _open_gerbers(self, folder: str):
+        """Load a board into the current tab if it has none yet, otherwise into a new one."""
+        if self._gerber_source is not None:
+            self._add_session(BoardSession())
+        self._start_gerber_load(folder)
+
+    def _start_gerber_load(self, folder: str, reload: bool = False):
+        """Load a Gerber folder or .zip archive in the background.
+
+        A ``reload`` of the board on screen re-reads only the layers whose
+        files changed and keeps the view as it is.
+        """
+        self._cancel_gerber_load()
+        if self._load_executor is None:
+            self._load_executor = create_load_executor()
+
+        previous = self._board if reload and self._board is not None and self._board.folder == folder else None
+        self._gerber_source = folder
+        self._session.gerber_source = folder
+        self._update_board_tab(self._session)
+        if self._watch_check.isChecked():
+            self._watcher.watch("board", folder)
+
+        self._load_is_reload = previous is not None
+        self._load_span = tracer.start_span("reload gerbers" if previous else "load gerbers", file=folder)
+        job = GerberLoadJob(folder, self._load_executor, self, self._load_span, previous)
+        job.progress.connect(self._on_gerber_load_progress)
+        job.finished.connect(self._on_gerber_loaded)
+        job.failed.connect(self._on_gerber_load_failed)
+        self._load_job = job
+
+        self._status_label.setText(f"Loading Gerbers from: {folder}")
+        self._progress_bar.setRange(0, 0)
+        self._progress_bar.setVisible(True)
+        job.start()
+
+    def _cancel_gerber_load(self):
+        if self._load_job is not None:
+            self._load_job.cancel()
+            self._load_job.deleteLater()
+            self._load_job = None
+        self._load_span.set(cancelled=True)
+        self._load_span.finish()
+        self._load_span = NULL_SPAN
+        self._progress_bar.setVisible(False)
+
+    def _on_gerber_load_progress(self, done: int, total: int):
+        self._progress_bar.setRange(0, total)
+        self._progress_bar.setValue(done)
+
+    def _on_gerber_loaded(self, result: GerberLoadResult):
+        span, self._load_span = self._load_span, NULL_SPAN
+        self._cancel_gerber_load()
 
         try:
-            self._gerber_set = discover_gerbers(folder)
-            self._bounds = get_board_bounds(self._gerber_set)
-            self._svg_cache.clear()
-            self._render_current_side()
-            self._update_component_markers()
-            self._status_label.setText(f"Loaded Gerbers from: {folder}")
+            if result.reloaded is not None and self._gerber_set is not None:
+                with tracer.within(span):
+                    self._apply_board_reload(result)
+                span.set(layers=len(result.layers), reloaded=len(result.reloaded), failed_layers=len(result.errors))
+                return
+
+            self._board = result
+            self._gerber_set = result.gerber_set
+            self._bounds = result.bounds
+            self._layer_geometry = dict(result.layers)
+            self._layer_paths.clear()
+            self._update_available_layers()
+            with tracer.within(span), tracer.span("build scene"):
+                self._pcb_view.clear_board()
+                self._render_side(self._current_side)
+                self._pcb_view.show_side(self._current_side)
+                self._pcb_view.zoom_to_fit()
+                if self._pending_view_state is not None:
+                    self._pcb_view.restore_board_view_state(self._pending_view_state)
+                    self._pending_view_state = None
+                    self._restore_highlights()
+            span.set(layers=len(result.layers), failed_layers=len(result.errors))
+            self._status_label.setText(f"Loaded Gerbers from: {result.folder}{self._layer_errors_text(result)}")
+            # Build the other side once this one has been painted, so a flip
+            # only has to swap scenes.
+            QTimer.singleShot(0, self._prerender_other_side)
+            self._update_memory()
         except Exception as e:
+            span.set(error=str(e))
             QMessageBox.critical(self, "Error", f"Failed to load Gerbers: {e}")
+        finally:
+            span.finish()
 
-    def _on_load_pnp(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Pick & Place CSV", "", "CSV Files (*.csv);;All Files (*)"
+    def _on_panel(self):
+        if self._bounds is None:
+            return
+        dialog = PanelDialog(self._panel, self._bounds, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self._panel = dialog.panel()
+        self._pcb_view.set_panel(self._panel)
+
+        # Both sides are rebuilt for the new layout; the board itself is reused.
+        with tracer.span("build scene", panel=self._panel.count if self._panel else 1):
+            self._pcb_view.clear_board()
+            self._render_side(self._current_side)
+            self._pcb_view.show_side(self._current_side)
+            self._pcb_view.zoom_to_fit()
+            self._restore_highlights()
+        QTimer.singleShot(0, self._prerender_other_side)
+        if self._panel is None:
+            self._status_label.setText("Showing a single board")
+        else:
+            self._status_label.setText(f"Showing a panel of {self._panel.rows} × {self._panel.columns} boards")
+        self._update_memory()
+
+    @staticmethod
+    def _layer_errors_text(result: GerberLoadResult) -> str:
+        """Status bar suffix naming the layers that could not be read; they are shown empty."""
+        if not result.errors:
+            return ""
+        failed = "; ".join(f"{path.name}: {error}" for path, error in result.errors.items())
+        return f" (could not read {len(result.errors)} layer(s), shown empty: {failed})"
+
+    def _update_available_layers(self):
+        roles = {role for side in Side for role in side_layers(self._gerber_set, side)}
+        self._layer_panel.set_available(
+            {style.key for style in self._layer_styles.values() if style.role in roles}
         )
-        if not file_path:
+
+    def _apply_board_reload(self, result: GerberLoadResult):
+        """Show a reloaded board, touching only the layer items whose files changed."""
+        old_set, old_bounds = self._gerber_set, self._bounds
+        self._board = result
+        self._gerber_set = result.gerber_set
+        self._bounds = result.bounds
+        self._layer_geometry = dict(result.layers)
+        for path in list(self._layer_paths):
+            if path in result.reloaded or path not in result.layers:
+                del self._layer_paths[path]
+        self._update_available_layers()
+
+        old_roles = {side: side_layers(old_set, side) for side in Side}
+        new_roles = {side: side_layers(self._gerber_set, side) for side in Side}
+        same_layout = self._bounds == old_bounds and all(
+            old_roles[side].keys() == new_roles[side].keys() for side in Side
+        )
+
+        if same_layout:
+            with tracer.span("update layers", count=len(result.reloaded)):
+                for side in Side:
+                    if not self._pcb_view.has_side(side):
+                        continue
+                    for role, path in new_roles[side].items():
+                        if path in self._layer_geometry and (path in result.reloaded or old_roles[side][role] != path):
+                            paths = self._get_layer_paths(path)
+                            for style in self._layer_styles.values():
+                                if style.role == role:
+                                    self._pcb_view.set_layer_paths(side, style.key, paths)
+        else:
+            # The board outline or the layer set changed: rebuild, but stay on
+            # the same spot of the board at the same zoom.
+            with tracer.span("build scene"):
+                view_state = self._pcb_view.board_view_state()
+                self._pcb_view.clear_board()
+                self._render_side(self._current_side)
+                self._pcb_view.show_side(self._current_side)
+                self._pcb_view.zoom_to_fit()
+                self._pcb_view.restore_board_view_state(view_state)
+                self._restore_highlights()
+            QTimer.singleShot(0, self._prerender_other_side)
+
+        self._status_label.setText(
+            f"Reloaded {len(result.reloaded)} changed layer(s) from: {result.folder}{self._layer_errors_text(result)}"
+        )
+        self._update_memory()
+
+    def _on_gerber_load_failed(self, message: str):
+        span, self._load_span = self._load_span, NULL_SPAN
+        span.set(error=message)
+        span.finish()
+        self._cancel_gerber_load()
+        if self._load_is_reload:
+            # Most likely caught mid-export; the finished write triggers another reload.
+            self._status_label.setText(f"Failed to reload Gerbers: {message}")
             return
+        self._status_label.setText("Failed to load Gerbers")
+        QMessageBox.critical(self, "Error", f"Failed to load Gerbers: {message}")
 
+    def _on_load_pnp(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Pick & Place File", "", file_filter())
+        if not file_path:
+            return
+        mapping = None
         try:
-            self._components = parse_pickplace_csv(file_path)
-            self._table_model.set_components(self._components)
-            self._table_model.set_side_filter(self._current_side)
-            self._update_component_markers()
-            self._status_label.setText(
-                f"Loaded {len(self._components)} components from: {file_path}"
-            )
-            self._table_view.resizeColumnsToContents()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load Pick & Place: {e}")
+            sniff_format(file_path)
+        except UnknownPlacementFormat:
+            mapping = self._ask_column_mapping(file_path)
+            if mapping is None:
+                return
+        except OSError:
+            # Reported by the load itself.
+            pass
+        self._pnp_mapping = mapping
+        self._load_pickplace(file_path)
+
+    def _ask_column_mapping(self, file_path: str) -> ColumnMapping | None:
+        columns = [column for column in csv_header(file_path) if column]
+        if len(columns) < 3:
+            QMessageBox.critical(self, "Error", f"{Path(file_path).name} is not a recognised Pick & Place file.")
+            return None
+        dialog = ColumnMappingDialog(Path(file_path).name, columns, self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return None
+        return dialog.mapping()
+
+    def _load_pickplace(self, file_path: str, reload: bool = False):
+        """Load a Pick & Place file; a ``reload`` keeps the selected group and the table scroll position."""
+        selected = self._selected_group_value() if reload else None
+        scroll = self._table_view.verticalScrollBar().value()
+        self._pnp_path = file_path
+        self._session.pnp_path = file_path
+        self._update_board_tab(self._session)
+        if self._watch_check.isChecked():
+            self._watcher.watch("pickplace", file_path)
+
+        name = "reload pick & place" if reload else "load pick & place"
+        with tracer.span(name, file=Path(file_path).name) as span:
+            try:
+                with tracer.span("parse placements", file=Path(file_path).name) as parse_span:
+                    self._store = load_pickplace_store(file_path, self._pnp_mapping)
+                    parse_span.set(rows=len(self._store))
+                with tracer.span("search index"):
+                    self._search_index = SearchIndex(self._store)
+                with tracer.span("table model") as table_span:
+                    self._table_model.set_store(self._store)
+                    self._table_model.set_side_filter(self._current_side)
+                    if reload:
+                        self._table_model.set_row_filter(self._search_index.search(self._search_edit.text()))
+                    else:
+                        self._apply_search()
+                    table_span.set(groups=self._table_model.rowCount())
+                with tracer.span("markers"):
+                    self._update_component_markers()
+                if reload:
+                    self._select_group_value(selected)
+                    self._table_view.verticalScrollBar().setValue(scroll)
+                    self._restore_highlights()
+                    self._status_label.setText(
+                        f"Reloaded {len(self._store)} components from: {file_path}"
+                    )
+                else:
+                    self._status_label.setText(
+                        f"Loaded {len(self._store)} components from: {file_path}"
+                    )
+                    with tracer.span("resize columns"):
+                        self._table_view.resizeColumnsToContents()
+                self._update_memory()
+            except Exception as e:
+                span.set(error=str(e))
+                if reload:
+                    # Most likely caught mid-export; the finished write triggers another reload.
+                    self._status_label.setText(f"Failed to reload Pick & Place: {e}")
+                else:
+                    QMessageBox.critical(self, "Error", f"Failed to load Pick & Place: {e}")
+
+    def _selected_group_value(self) -> str | None:
+        indexes = self._table_view.selectionModel().selectedRows()
+        group = self._table_model.get_group(indexes[0].row()) if indexes else None
+        return group.value if group is not None else None
+
+    def _select_group_value(self, value: str | None):
+        row = self._table_model.row_of_value(value) if value is not None else None
+        if row is None:
+            return
+        # The highlight is restored separately, without moving the view.
+        selection_model = self._table_view.selectionModel()
+        blocked = selection_model.blockSignals(True)
+        self._table_view.selectRow(row)
+        selection_model.blockSignals(blocked)
+
+    def _restore_highlights(self):
+        """Re-apply the selection or search highlight after a reload, leaving the view where it is."""
+        value = self._selected_group_value()
+        if value is not None:
+            self._pcb_view.highlight_components(self._table_model.get_indices_by_value(value), center=False)
+            return
+        rows = self._search_index.search(self._search_edit.text())
+        if rows is None:
+            self._pcb_view.clear_highlights()
+        else:
+            self._pcb_view.highlight_components(rows, center=False)
+
+    def _on_watch_toggled(self, checked: bool):
+        if not checked:
+            self._watcher.clear()
+            return
+        if self._gerber_source is not None:
+            self._watcher.watch("board", self._gerber_source)
+        if self._pnp_path is not None:
+            self._watcher.watch("pickplace", self._pnp_path)
+
+    def _on_watched_files_changed(self, name: str, paths: list):
+        if name == "board" and self._gerber_source is not None:
+            self._start_gerber_load(self._gerber_source, reload=True)
+        elif name == "pickplace" and self._pnp_path is not None:
+            self._load_pickplace(self._pnp_path, reload=True)
 
     def _on_side_changed(self, index: int):
-        self._current_side = self._side_combo.itemData(index)
+        self._current_side = Side(self._side_combo.itemData(index))
         self._table_model.set_side_filter(self._current_side)
-        self._pcb_view.clear_highlights()
-        self._render_current_side()
-        self._update_component_markers()
+        if self._gerber_set is not None and not self._pcb_view.has_side(self._current_side):
+            self._render_side(self._current_side)
+        self._pcb_view.show_side(self._current_side)
+        self._apply_search()
+
+    def _prerender_other_side(self):
+        if self._gerber_set is None or self._bounds is None:
+            return
+        other = Side.BOTTOM if self._current_side == Side.TOP else Side.TOP
+        if self._pcb_view.has_side(other):
+            return
+        with tracer.span("prerender side", side=other.name.lower()):
+            self._render_side(other)
+            self._pcb_view.prerender_side(other)
+        self._update_memory()
 
-    def _render_current_side(self):
+    def _render_side(self, side: Side):
         if self._gerber_set is None or self._bounds is None:
             return
 
-        if self._current_side not in self._svg_cache:
-            svg_data = render_gerber_to_svg(
-                self._gerber_set, self._current_side, self._bounds
-            )
-            self._svg_cache[self._current_side] = svg_data
+        with tracer.span("render side", side=side.name.lower()):
+            paths_by_role = {
+                role: self._get_layer_paths(path)
+                for role, path in side_layers(self._gerber_set, side).items()
+                if path in self._layer_geometry
+            }
+            layers = [
+                (style, paths_by_role[style.role])
+                for style in self._layer_styles.values()
+                if style.role in paths_by_role
+            ]
+
+            with tracer.span("scene setup", layers=len(layers)):
+                self._pcb_view.set_board_layers(layers, self._bounds, side)
+            with tracer.span("components", rows=len(self._store)):
+                self._pcb_view.set_components(self._store, self._bounds, side)
+
+    def _get_layer_paths(self, path: LayerFile) -> LayerPaths:
+        paths = self._layer_paths.get(path)
+        if paths is None:
+            geometry = self._layer_geometry[path]
+            with tracer.span("layer paths", file=path.name, primitives=geometry.primitive_count):
+                paths = LayerPaths(geometry)
+            self._layer_paths[path] = paths
+        return paths
+
+    def _on_export_svg(self):
+        if self._gerber_set is None or self._bounds is None:
+            return
 
-        self._pcb_view.set_board_svg(
-            self._svg_cache[self._current_side], self._bounds
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export SVG", "", "SVG Files (*.svg);;All Files (*)"
         )
-        self._pcb_view.zoom_to_fit()
+        if not file_path:
+            return
+
+        try:
+            with tracer.span("export svg", file=Path(file_path).name):
+                svg_data = render_gerber_to_svg(self._gerber_set, self._current_side, self._bounds, self._panel)
+            Path(file_path).write_bytes(svg_data)
+            self._status_label.setText(f"Exported SVG to: {file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export SVG: {e}")
 
     def _update_component_markers(self):
         if self._bounds is None:
             return
 
-        self._pcb_view.set_components(
-            self._components, self._bounds, self._current_side
-        )
+        for side in Side:
+            self._pcb_view.set_components(self._store, self._bounds, side)
 
     def _on_table_selection_changed(self, selected, deselected):
         indexes = self._table_view.selectionModel().selectedRows()
@@ -188,9 +656,221 @@ class MainWindow(QMainWindow):
         if group is None:
             return
 
-        designators = [c.designator for c in group.components]
-        self._pcb_view.highlight_components(designators)
+        self._pcb_view.highlight_components(group.indices)
+
+    def _on_search_changed(self, text: str):
+        self._apply_search()
+
+    def _apply_search(self):
+        rows = self._search_index.search(self._search_edit.text())
+        self._table_model.set_row_filter(rows)
+        if rows is None:
+            self._pcb_view.clear_highlights()
+        else:
+            self._pcb_view.highlight_components(rows)
+
+    def _on_component_clicked(self, store_row: int):
+        row = self._table_model.group_row_of(store_row)
+        if row is None:
+            return
+        # The part was clicked on the board, so highlight its group where it is.
+        selection_model = self._table_view.selectionModel()
+        blocked = selection_model.blockSignals(True)
+        self._table_view.selectRow(row)
+        selection_model.blockSignals(blocked)
+        self._table_view.scrollTo(self._table_model.index(row, 0))
+        self._pcb_view.highlight_components(self._table_model.get_group(row).indices, center=False)
 
     def _on_marker_size_changed(self, new_value):
         val_lin = ((new_value + 20.0) / 140.0) * 2.0
-        self._pcb_view.set_marker_size(val_lin * val_lin)
\ No newline at end of file
+        self._pcb_view.set_marker_size(val_lin * val_lin)
+
+    def _add_session(self, session: BoardSession):
+        """Open a tab for ``session`` and switch to it."""
+        self._sessions.append(session)
+        self._session_cache.add(session)
+        blocked = self._board_tabs.blockSignals(True)
+        index = self._board_tabs.addTab(session.title)
+        self._board_tabs.blockSignals(blocked)
+        self._update_board_tab(session)
+        if self._session is None:
+            self._board_tabs.setCurrentIndex(index)
+            self._activate_session(session)
+        else:
+            # currentChanged stashes the board on screen and activates this one.
+            self._board_tabs.setCurrentIndex(index)
+
+    def _on_board_tab_changed(self, index: int):
+        if not 0 <= index < len(self._sessions) or self._sessions[index] is self._session:
+            return
+        if self._session is not None:
+            self._stash_session(self._session)
+        self._activate_session(self._sessions[index])
+
+    def _on_board_tab_close_requested(self, index: int):
+        session = self._sessions[index]
+        if session is self._session:
+            self._cancel_gerber_load()
+            self._watcher.clear()
+            self._stash_session(session)
+            self._session = None
+        session.evict()
+        self._session_cache.remove(session)
+        del self._sessions[index]
+        # Removing the tab moves the current index; skip that signal and
+        # activate the new current board explicitly.
+        blocked = self._board_tabs.blockSignals(True)
+        self._board_tabs.removeTab(index)
+        self._board_tabs.blockSignals(blocked)
+        if not self._sessions:
+            self._add_session(BoardSession())
+        elif self._session is None:
+            self._activate_session(self._sessions[self._board_tabs.currentIndex()])
+        self._update_memory()
+
+    def _stash_session(self, session: BoardSession):
+        """Move the board on screen, scenes and table included, into ``session``."""
+        reload_pending = self._load_job is not None and self._load_is_reload
+        self._cancel_gerber_load()
+        session.gerber_source = self._gerber_source
+        session.pnp_path = self._pnp_path
+        session.pnp_mapping = self._pnp_mapping
+        session.panel = self._panel
+        session.current_side = self._current_side
+        session.search_text = self._search_edit.text()
+        session.selected_value = self._selected_group_value()
+        session.table_scroll = self._table_view.verticalScrollBar().value()
+        if self._board is not None:
+            session.view_state = self._pcb_view.board_view_state()
+        session.watch_stamps = {name: self._watcher.stamps(name) for name in ("board", "pickplace")}
+        if reload_pending:
+            # The interrupted reload is redone when the board comes back.
+            session.watch_stamps["board"] = {}
+        self._watcher.clear()
+
+        # A board still loading is dropped and loaded again when it comes back.
+        session.board = self._board
+        session.layer_paths = self._layer_paths
+        session.sides = self._pcb_view.take_sides() if self._board is not None else None
+        if session.sides is None:
+            self._pcb_view.clear_board()
+        session.store = self._store
+        session.search_index = self._search_index
+        session.table_model = self._table_model if len(self._store) or self._pnp_path is None else None
+        session.measure()
+
+    def _activate_session(self, session: BoardSession):
+        """Put ``session`` on screen, loading it again if it was evicted."""
+        self._session = session
+        self._session_cache.touch(session)
+
+        self._gerber_source = session.gerber_source
+        self._pnp_path = session.pnp_path
+        self._pnp_mapping = session.pnp_mapping
+        self._panel = session.panel
+        self._pcb_view.set_panel(self._panel)
+        self._board = session.board
+        self._gerber_set = session.board.gerber_set if session.board is not None else None
+        self._bounds = session.board.bounds if session.board is not None else None
+        self._layer_geometry = dict(session.board.layers) if session.board is not None else {}
+        self._layer_paths = session.layer_paths
+        self._store = session.store
+        self._search_index = session.search_index or SearchIndex(self._store)
+        if session.table_model is None:
+            session.table_model = ComponentsTableModel()
+        self._set_table_model(session.table_model)
+
+        self._current_side = session.current_side
+        blocked = self._side_combo.blockSignals(True)
+        self._side_combo.setCurrentIndex(self._side_combo.findData(session.current_side))
+        self._side_combo.blockSignals(blocked)
+        self._table_model.set_side_filter(self._current_side)
+        blocked = self._search_edit.blockSignals(True)
+        self._search_edit.setText(session.search_text)
+        self._search_edit.blockSignals(blocked)
+
+        if self._gerber_set is not None:
+            self._update_available_layers()
+        else:
+            self._layer_panel.set_available(set())
+
+        if session.sides is not None and self._bounds is not None:
+            self._pcb_view.put_sides(session.sides, self._bounds, self._store, self._current_side)
+            # Layer styles and overlay settings may have changed while the board was away.
+            for style in self._layer_styles.values():
+                self._pcb_view.set_layer_visible(style.key, style.visible)
+                self._pcb_view.set_layer_opacity(style.key, style.opacity)
+                self._pcb_view.set_layer_color(style.key, style.color)
+            self._pcb_view.set_placements_visible(self._placements_check.isChecked())
+        session.sides = None
+
+        if self._pnp_path is not None and not len(self._store):
+            self._load_pickplace(self._pnp_path)
+        self._select_group_value(session.selected_value)
+        self._table_view.verticalScrollBar().setValue(session.table_scroll)
+        self._restore_highlights()
+
+        if self._gerber_source is not None and self._board is None:
+            self._pending_view_state = session.view_state
+            self._start_gerber_load(self._gerber_source)
+        elif self._board is not None:
+            self._status_label.setText(f"Showing: {session.title}")
+
+        if self._watch_check.isChecked():
+            for name, path in (("board", self._gerber_source), ("pickplace", self._pnp_path)):
+                if path is not None:
+                    self._watcher.watch(name, path, session.watch_stamps.get(name))
+        self._update_memory()
+
+    def _set_table_model(self, model: ComponentsTableModel):
+        if model is self._table_model and self._table_view.model() is model:
+            return
+        self._table_model = model
+        self._table_view.setModel(model)
+        # Every model comes with its own selection model.
+        self._table_view.selectionModel().selectionChanged.connect(self._on_table_selection_changed)
+
+    def _update_board_tab(self, session: BoardSession):
+        index = self._sessions.index(session)
+        self._board_tabs.setTabText(index, session.title)
+        sources = [source for source in (session.gerber_source, session.pnp_path) if source]
+        tooltip = "\n".join(sources) or "No board loaded"
+        if not session.resident and session is not self._session:
+            tooltip += "\nUnloaded to stay within the memory budget; reloads when selected"
+        self._board_tabs.setTabToolTip(index, tooltip)
+        resident = session.resident or session is self._session
+        self._board_tabs.setTabTextColor(index, self.palette().text().color() if resident else Qt.GlobalColor.gray)
+
+    def _update_memory(self):
+        """Measure the board on screen, unload the least recently viewed ones over budget and show the total."""
+        if self._session is None:
+            return
+        # Worker memory is not counted; see BoardSession.measure().
+        self._session.memory_bytes = estimate_bytes(
+            self._board, self._layer_paths, self._pcb_view, self._store, self._search_index, self._table_model
+        ) + self._pcb_view.tile_bytes()
+        for session in self._session_cache.enforce_budget(keep=self._session):
+            self._update_board_tab(session)
+        resident = sum(1 for session in self._sessions if session.memory_bytes)
+        self._memory_label.setText(
+            f"  {resident} board(s) in memory: {self._session_cache.total_bytes / MB:.0f} MB of  "
+        )
+
+    def _on_memory_budget_changed(self, value: int):
+        self._session_cache.budget_bytes = value * MB
+        self._update_memory()
+
+    def closeEvent(self, event):
+        self._watcher.clear()
+        self._cancel_gerber_load()
+        if self._load_executor is not None:
+            self._load_executor.shutdown(wait=False, cancel_futures=True)
+            self._load_executor = None
+        tile_renderer().shutdown()
+        super().closeEvent(event)
+
+    def _on_clear_cache(self):
+        freed = disk_cache.size()
+        disk_cache.clear()
+        layer_registry.clear()
+        self._status_label.setText(f"Cleared cache ({freed / (1024 * 1024):.1f} MB)")
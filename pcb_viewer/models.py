@@ -7,7 +7,7 @@ class Side(str, Enum):
     BOTTOM = "BottomLayer"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Component:
     designator: str
     comment: str
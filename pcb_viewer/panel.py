@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .models import BoundsMM
+
+
+@dataclass(frozen=True)
+class PanelLayout:
+    """Step-and-repeat arrangement of identical boards.
+
+    Boards are laid out in ``rows`` by ``columns``, ``pitch_x_mm`` and
+    ``pitch_y_mm`` apart, centre to centre, and each is turned by
+    ``rotation_deg`` counter-clockwise about its own centre. The board at
+    row 0, column 0 keeps its position in the Gerber coordinates.
+    """
+    rows: int = 1
+    columns: int = 1
+    pitch_x_mm: float = 0.0
+    pitch_y_mm: float = 0.0
+    rotation_deg: float = 0.0
+
+    def __post_init__(self):
+        if self.rows < 1 or self.columns < 1:
+            raise ValueError("a panel needs at least one row and one column")
+
+    @property
+    def count(self) -> int:
+        return self.rows * self.columns
+
+    def transforms(self, bounds: BoundsMM) -> np.ndarray:
+        """``(count, 2, 3)`` affine matrices taking board millimetres to panel millimetres, row by row."""
+        cx = (bounds.xmin + bounds.xmax) / 2
+        cy = (bounds.ymin + bounds.ymax) / 2
+        angle = np.radians(self.rotation_deg)
+        cos, sin = np.cos(angle), np.sin(angle)
+
+        row, column = np.divmod(np.arange(self.count), self.columns)
+        matrices = np.empty((self.count, 2, 3))
+        matrices[:, 0, :2] = (cos, -sin)
+        matrices[:, 1, :2] = (sin, cos)
+        # Turn about the board centre, then step to the instance's place.
+        matrices[:, 0, 2] = cx - (cos * cx - sin * cy) + column * self.pitch_x_mm
+        matrices[:, 1, 2] = cy - (sin * cx + cos * cy) + row * self.pitch_y_mm
+        return matrices
+
+    def bounds(self, bounds: BoundsMM) -> BoundsMM:
+        """Bounds of the whole panel, given those of one board."""
+        corners_x = np.array([bounds.xmin, bounds.xmax, bounds.xmax, bounds.xmin])
+        corners_y = np.array([bounds.ymin, bounds.ymin, bounds.ymax, bounds.ymax])
+        x, y = place_points(self.transforms(bounds), corners_x, corners_y)
+        return BoundsMM(xmin=float(x.min()), xmax=float(x.max()), ymin=float(y.min()), ymax=float(y.max()))
+
+
+def place_points(transforms: np.ndarray, x_mm: np.ndarray, y_mm: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Every point on every board of a panel, as ``(instances, points)`` arrays, in one broadcast."""
+    a, b, tx = (transforms[:, 0, i, None] for i in range(3))
+    c, d, ty = (transforms[:, 1, i, None] for i in range(3))
+    return a * x_mm + b * y_mm + tx, c * x_mm + d * y_mm + ty
@@ -0,0 +1,78 @@
+from PySide6.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QDoubleSpinBox,
+    QFormLayout,
+    QLabel,
+    QSpinBox,
+    QVBoxLayout,
+)
+
+from .models import BoundsMM
+from .panel import PanelLayout
+
+# Gap between boards proposed when no panel has been set up yet.
+DEFAULT_GAP_MM = 2.0
+MAX_BOARDS_PER_AXIS = 100
+
+
+class PanelDialog(QDialog):
+    """Asks for the step-and-repeat layout of a panel; one row and one column is a single board."""
+
+    def __init__(self, panel: PanelLayout | None, bounds: BoundsMM, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Panel")
+        if panel is None:
+            panel = PanelLayout(pitch_x_mm=bounds.width + DEFAULT_GAP_MM, pitch_y_mm=bounds.height + DEFAULT_GAP_MM)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Board: {bounds.width:.2f} × {bounds.height:.2f} mm"))
+        form = QFormLayout()
+        self._rows = self._count_spin(panel.rows)
+        form.addRow("Rows", self._rows)
+        self._columns = self._count_spin(panel.columns)
+        form.addRow("Columns", self._columns)
+        self._pitch_x = self._mm_spin(panel.pitch_x_mm)
+        form.addRow("Column pitch", self._pitch_x)
+        self._pitch_y = self._mm_spin(panel.pitch_y_mm)
+        form.addRow("Row pitch", self._pitch_y)
+        self._rotation = QDoubleSpinBox()
+        self._rotation.setRange(-360.0, 360.0)
+        self._rotation.setSingleStep(90.0)
+        self._rotation.setSuffix("°")
+        self._rotation.setValue(panel.rotation_deg)
+        form.addRow("Board rotation", self._rotation)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    @staticmethod
+    def _count_spin(value: int) -> QSpinBox:
+        spin = QSpinBox()
+        spin.setRange(1, MAX_BOARDS_PER_AXIS)
+        spin.setValue(value)
+        return spin
+
+    @staticmethod
+    def _mm_spin(value: float) -> QDoubleSpinBox:
+        spin = QDoubleSpinBox()
+        spin.setRange(-10000.0, 10000.0)
+        spin.setDecimals(3)
+        spin.setSuffix(" mm")
+        spin.setValue(value)
+        return spin
+
+    def panel(self) -> PanelLayout | None:
+        """The layout entered, or None for a single board."""
+        if self._rows.value() == 1 and self._columns.value() == 1:
+            return None
+        return PanelLayout(
+            rows=self._rows.value(),
+            columns=self._columns.value(),
+            pitch_x_mm=self._pitch_x.value(),
+            pitch_y_mm=self._pitch_y.value(),
+            rotation_deg=self._rotation.value(),
+        )
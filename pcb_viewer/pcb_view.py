@@ -1,67 +1,77 @@
 import math
+from dataclasses import dataclass, field
 
-from PySide6.QtCore import Qt, QRectF, QTimer, QElapsedTimer, QPointF, QLineF
-from PySide6.QtGui import QPen, QBrush, QColor, QWheelEvent, QMouseEvent, QPainter
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsItemGroup, QGraphicsLineItem
+import numpy as np
+
+from PySide6.QtCore import Qt, QRectF, QTimer, QElapsedTimer, QPoint, QPointF, QLineF, Signal
+from PySide6.QtGui import QBrush, QColor, QWheelEvent, QMouseEvent, QPaintEvent, QPainter, QPixmap, QTransform
+from PySide6.QtWidgets import QApplication, QToolTip, QGraphicsView, QGraphicsScene, QStyleOptionGraphicsItem
 from PySide6.QtSvgWidgets import QGraphicsSvgItem
 from PySide6.QtSvg import QSvgRenderer
 
-from .models import Component, BoundsMM, Side
-
-
-class PulsingMarker(QGraphicsItemGroup):
-    def __init__(self, center_x: float, center_y: float, marker_size: float, marker_size_mult: float, designator: str):
-        super().__init__()
-        self._center = QPointF(center_x, center_y)
-        self._center_x = center_x
-        self._center_y = center_y
-        self._marker_size = marker_size
-        self._marker_size_mult = marker_size_mult
-        self._designator = designator
-        
-        self._circle = QGraphicsEllipseItem()
-        self._circle.setPen(QPen(QColor("#ff0000"), marker_size))
-        self._circle.setBrush(QBrush(QColor(255, 255, 0, 80)))
-        self.addToGroup(self._circle)
-        
-        crosshair_pen = QPen(QColor("#ff0000"), marker_size)
-        self._h_line = QGraphicsLineItem()
-        self._h_line.setPen(crosshair_pen)
-        self.addToGroup(self._h_line)
-        
-        self._v_line = QGraphicsLineItem()
-        self._v_line.setPen(crosshair_pen)
-        self.addToGroup(self._v_line)
-        
-        self.setZValue(15)
-        self._update_geometry()
-
-        self._label = QGraphicsTextItem(designator)
-        self._label.setDefaultTextColor(QColor("#ffff00"))
-        self._label.setScale(marker_size)
-        self._label.setPos(center_x + 5.0 * marker_size, center_y - 12.5 * marker_size)
-        self._label.setZValue(20)
-        self.addToGroup(self._label)
-
-    def _update_geometry(self):
-        cx, cy = self._center.x(), self._center.y()
-        r = self._marker_size * 4.0 * self._marker_size_mult
-        
-        self._circle.setRect(cx - r, cy - r, r * 2, r * 2)
-        
-        crosshair_size = r * 1.5
-        self._h_line.setLine(cx - crosshair_size, cy, cx + crosshair_size, cy)
-        self._v_line.setLine(cx, cy - crosshair_size, cx, cy + crosshair_size)
-
-    def pulse_step(self, marker_size_mult):
-        self._marker_size_mult = marker_size_mult
-        self._update_geometry()
+from .models import BoundsMM, Side
+from .component_store import ComponentStore, map_to_scene
+from .spatial_index import GridIndex
+from .render_board import LayerStyle
+from .highlight_item import HighlightItem, PULSE_AMPLITUDE
+from .placement_item import PlacementItem, placement_corners
+from .footprints import footprint_bodies_mm
+from .layer_item import (
+    LayerItem,
+    LayerPaths,
+    TiledInstance,
+    TiledItem,
+    SCENE_UNITS_PER_MM,
+    board_transform,
+    board_scene_rect,
+)
+from .panel import PanelLayout, place_points
+from .tiles import TileKey, tile_cache, tile_level, tile_renderer
+from .tracing import tracer
+
+
+@dataclass
+class SideScene:
+    """Everything PCBView keeps per board side, so flipping sides only swaps scenes."""
+    scene: QGraphicsScene
+    layer_items: dict[str, LayerItem] = field(default_factory=dict)
+    # Scene (x, y) per panel instance and store row; NaN for rows on the other side.
+    component_positions: np.ndarray | None = None
+    spatial_index: GridIndex | None = None
+    placement_item: PlacementItem | None = None
+    view_transform: QTransform | None = None
+    view_center: QPointF | None = None
+
+
+def side_tile_bytes(sides: dict[Side, SideScene]) -> int:
+    """Bytes of the tile cache taken by the layers and placements of these scenes."""
+    source_ids = set()
+    for state in sides.values():
+        source_ids.update(item.source_id for item in state.layer_items.values())
+        if state.placement_item is not None:
+            source_ids.add(state.placement_item.source_id)
+    return tile_cache.source_bytes(source_ids)
+
+
+def _affine_qtransform(matrix: np.ndarray) -> QTransform:
+    (a, b, tx), (c, d, ty) = matrix.tolist()
+    return QTransform(a, c, b, d, tx, ty)
 
 
 class PCBView(QGraphicsView):
+    component_clicked = Signal(int)
+
+    # Screen-space radius, in pixels, within which a placement counts as under the cursor.
+    PICK_RADIUS_PX = 12
+    # Quiet time after the last wheel step or drag move before tiles for the new scale are rendered.
+    SHARPEN_DELAY_MS = 150
+    # Give up waiting for those tiles after this long and let them stream in as usual.
+    SHARPEN_TIMEOUT_MS = 3000
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._scene = QGraphicsScene(self)
+        self._sides = {side: SideScene(QGraphicsScene(self)) for side in Side}
+        self._current_side: Side = Side.TOP
         self.setScene(self._scene)
 
         self.setRenderHints(
@@ -72,38 +82,85 @@ class PCBView(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
         self.setBackgroundBrush(QBrush(QColor("#1a1a1a")))
+        self.viewport().setMouseTracking(True)
 
         self._svg_item: QGraphicsSvgItem | None = None
         self._svg_renderer: QSvgRenderer | None = None
-        self._component_positions: dict[str, tuple[float, float]] = {}
-        self._highlight_markers: list[PulsingMarker] = []
+        self._highlight: HighlightItem | None = None
+        self._store: ComponentStore | None = None
+        self._press_pos: QPoint | None = None
+        self._hover_row: int | None = None
         self._bounds: BoundsMM | None = None
-        self._current_side: Side = Side.TOP
         self._zoom_factor = 1.0
         self._svg_viewbox: tuple[float, float, float, float] | None = None
         self._item_bounds: tuple[float, float, float, float] = (0, 0, 1, 1)
         self._marker_size = 0.5
-        self._marker_size_mult = 1.0
+        self._placements_visible = False
+        self._panel: PanelLayout | None = None
 
+        # Runs only while something is highlighted.
         self._pulse_timer_elapsed = QElapsedTimer()
         self._pulse_timer = QTimer(self)
         self._pulse_timer.timeout.connect(self._on_pulse_tick)
         self._pulse_timer.setInterval(30)
-        self._pulse_timer.start()
-        self._pulse_timer_elapsed.start()
+
+        # While zooming and panning the view shows a scaled pixmap of what was
+        # on screen when the interaction began; see _begin_interaction().
+        self._snapshot: QPixmap | None = None
+        self._snapshot_transform = QTransform()
+        self._sharpen_keys: set[TileKey] = set()
+        self._sharpen_timer = QTimer(self)
+        self._sharpen_timer.setSingleShot(True)
+        self._sharpen_timer.setInterval(self.SHARPEN_DELAY_MS)
+        self._sharpen_timer.timeout.connect(self._sharpen)
+        self._sharpen_deadline = QTimer(self)
+        self._sharpen_deadline.setSingleShot(True)
+        self._sharpen_deadline.setInterval(self.SHARPEN_TIMEOUT_MS)
+        self._sharpen_deadline.timeout.connect(self._show_sharp)
+
+    @property
+    def _scene(self) -> QGraphicsScene:
+        return self._sides[self._current_side].scene
+
+    @property
+    def _component_positions(self) -> np.ndarray | None:
+        return self._sides[self._current_side].component_positions
+
+    @property
+    def current_side(self) -> Side:
+        return self._current_side
+
+    def has_side(self, side: Side) -> bool:
+        return bool(self._sides[side].layer_items)
 
     def _on_pulse_tick(self):
-        self._marker_size_mult = math.sin(self._pulse_timer_elapsed.elapsed() / 300.0) * 0.3 + 1.0
-        for marker in self._highlight_markers:
-            marker.pulse_step(self._marker_size_mult)
+        if self._highlight is None:
+            self._pulse_timer.stop()
+            return
+        self._highlight.set_pulse(math.sin(self._pulse_timer_elapsed.elapsed() / 300.0) * PULSE_AMPLITUDE + 1.0)
+
+    def set_panel(self, panel: PanelLayout | None):
+        """Show every board of a step-and-repeat panel, or a single board for None.
+
+        Takes effect for the sides and components set from now on.
+        """
+        self._panel = panel
+
+    def _scene_bounds(self, bounds: BoundsMM) -> BoundsMM:
+        return bounds if self._panel is None else self._panel.bounds(bounds)
+
+    def _instance_transforms(self, bounds: BoundsMM) -> np.ndarray:
+        if self._panel is None:
+            return np.array([[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]])
+        return self._panel.transforms(bounds)
 
     def set_board_svg(self, svg_data: bytes, bounds: BoundsMM):
         self._bounds = bounds
         self.clear_highlights()
-        self._scene.clear()
-        self._component_positions.clear()
+        self._reset_side(self._sides[self._current_side])
 
-        self._svg_renderer = QSvgRenderer(svg_data)
+        with tracer.span("QSvgRenderer", bytes=len(svg_data)):
+            self._svg_renderer = QSvgRenderer(svg_data)
         self._svg_item = QGraphicsSvgItem()
         self._svg_item.setSharedRenderer(self._svg_renderer)
         self._scene.addItem(self._svg_item)
@@ -116,64 +173,321 @@ class PCBView(QGraphicsView):
 
         self._scene.setSceneRect(self._svg_item.boundingRect())
 
-    def set_components(self, components: list[Component], bounds: BoundsMM, side: Side):
+    def set_board_layers(self, layers: list[tuple[LayerStyle, LayerPaths]], bounds: BoundsMM, side: Side):
+        """Build the scene for one side; it is shown only once that side is current."""
         self._bounds = bounds
-        self._current_side = side
-        self._component_positions.clear()
+        state = self._sides[side]
+        if side == self._current_side:
+            self.clear_highlights()
+        self._reset_side(state)
+        self._svg_item = None
+        self._svg_renderer = None
+
+        # The first board of a panel is the layer item itself; the others are
+        # instances placed relative to it that draw from its tiles.
+        first, *others = (_affine_qtransform(matrix) for matrix in self._instance_transforms(bounds))
+        to_first, _ = first.inverted()
+        placements = [other * to_first for other in others]
+        transform = first * board_transform(self._scene_bounds(bounds), side)
+        for z, (style, paths) in enumerate(layers):
+            item = LayerItem(paths, style.color)
+            item.setTransform(transform)
+            item.setOpacity(style.opacity)
+            item.setVisible(style.visible)
+            item.setZValue(z)
+            for placement in placements:
+                TiledInstance(item, placement)
+            state.scene.addItem(item)
+            state.layer_items[style.key] = item
+
+        self._set_layer_bounds(bounds)
+        state.scene.setSceneRect(board_scene_rect(self._bounds))
+
+    def _set_layer_bounds(self, bounds: BoundsMM):
+        bounds = self._scene_bounds(bounds)
+        self._bounds = bounds
+        rect = board_scene_rect(bounds)
+        self._svg_viewbox = (bounds.xmin, bounds.ymin, bounds.width, bounds.height)
+        self._item_bounds = (rect.x(), rect.y(), rect.width(), rect.height())
 
-        for comp in components:
-            if comp.side != side:
-                continue
-            self._store_component_position(comp)
+    def tile_bytes(self) -> int:
+        """Bytes of the tile cache taken by the board on screen, both sides."""
+        return side_tile_bytes(self._sides)
 
-    def _store_component_position(self, comp: Component):
-        if self._bounds is None or self._svg_viewbox is None:
+    def take_sides(self) -> dict[Side, SideScene]:
+        """Detach the scenes of both sides, view state included, leaving the view empty."""
+        self.clear_highlights()
+        self._save_view_state()
+        sides = self._sides
+        self._sides = {side: SideScene(QGraphicsScene(self)) for side in Side}
+        self._hover_row = None
+        self._store = None
+        self._bounds = None
+        self._svg_viewbox = None
+        self.setScene(self._scene)
+        return sides
+
+    def put_sides(self, sides: dict[Side, SideScene], bounds: BoundsMM, store: ComponentStore, side: Side):
+        """Show scenes taken earlier with :meth:`take_sides`, as they were left."""
+        self.clear_highlights()
+        for state in self._sides.values():
+            self._reset_side(state)
+            state.scene.deleteLater()
+        self._sides = sides
+        self._set_layer_bounds(bounds)
+        self._store = store
+        self._hover_row = None
+        # Force show_side to switch scenes and restore the side's saved view.
+        self._current_side = side
+        self.setScene(None)
+        self.show_side(side)
+
+    def set_layer_paths(self, side: Side, key: str, paths: LayerPaths) -> bool:
+        """Replace the geometry of one layer item in place; False if the side has no such item."""
+        self._drop_snapshot()
+        item = self._sides[side].layer_items.get(key)
+        if item is None:
+            return False
+        item.set_paths(paths)
+        return True
+
+    def board_view_state(self) -> tuple[Side, float, QPointF] | None:
+        """The current side, zoom and view centre in board millimetres, which survive a rebuild."""
+        if self._bounds is None:
+            return None
+        center = self.mapToScene(self.viewport().rect().center())
+        inverse, invertible = board_transform(self._bounds, self._current_side).inverted()
+        if not invertible:
+            return None
+        return self._current_side, self.transform().m11(), inverse.map(center)
+
+    def restore_board_view_state(self, state: tuple[Side, float, QPointF] | None):
+        if state is None or self._bounds is None or state[0] != self._current_side:
             return
+        side, zoom, center_mm = state
+        self.setTransform(QTransform.fromScale(zoom, zoom))
+        self._zoom_factor = zoom
+        self.centerOn(board_transform(self._bounds, side).map(center_mm))
 
-        vb_x, vb_y, vb_w, vb_h = self._svg_viewbox
-        ib_x, ib_y, ib_w, ib_h = self._item_bounds
+    def clear_board(self):
+        self.clear_highlights()
+        for state in self._sides.values():
+            self._reset_side(state)
+
+    def _reset_side(self, state: SideScene):
+        for item in state.layer_items.values():
+            item.release_tiles()
+        state.layer_items.clear()
+        state.component_positions = None
+        state.spatial_index = None
+        if state.placement_item is not None:
+            state.placement_item.release_tiles()
+            state.placement_item = None
+        state.scene.clear()
+        state.view_transform = None
+        state.view_center = None
+
+    def show_side(self, side: Side):
+        if side == self._current_side and self.scene() is self._scene:
+            return
 
-        x_mm = comp.x_mm
-        y_mm = comp.y_mm
+        self.clear_highlights()
+        if self.scene() is not None:
+            self._save_view_state()
+        self._current_side = side
+        self._hover_row = None
+        self.setScene(self._scene)
 
-        if self._current_side == Side.BOTTOM:
-            x_mm = self._bounds.xmin + self._bounds.xmax - x_mm
+        state = self._sides[side]
+        if state.view_transform is None:
+            self.zoom_to_fit()
+        else:
+            self.setTransform(state.view_transform)
+            self.centerOn(state.view_center)
+            self._zoom_factor = state.view_transform.m11()
+
+    def _save_view_state(self):
+        state = self._sides[self._current_side]
+        state.view_transform = self.transform()
+        state.view_center = self.mapToScene(self.viewport().rect().center())
+
+    def prerender_side(self, side: Side):
+        """Queue tiles for the zoom-to-fit view of a side that is not on screen yet."""
+        state = self._sides[side]
+        rect = state.scene.sceneRect()
+        viewport = self.viewport().rect()
+        if rect.isEmpty() or viewport.isEmpty():
+            return
 
-        norm_x = (x_mm - vb_x) / vb_w if vb_w else 0
-        norm_y = 1.0 - ((y_mm - vb_y) / vb_h) if vb_h else 0
+        scale = min(viewport.width() / rect.width(), viewport.height() / rect.height())
+        for item in state.layer_items.values():
+            if item.isVisible():
+                item.prefetch(scale * SCENE_UNITS_PER_MM)
+
+    def set_layer_visible(self, key: str, visible: bool):
+        self._drop_snapshot()
+        for state in self._sides.values():
+            item = state.layer_items.get(key)
+            if item is not None:
+                item.setVisible(visible)
+
+    def set_layer_opacity(self, key: str, opacity: float):
+        self._drop_snapshot()
+        for state in self._sides.values():
+            item = state.layer_items.get(key)
+            if item is not None:
+                item.setOpacity(opacity)
+
+    def set_layer_color(self, key: str, color: str | QColor):
+        self._drop_snapshot()
+        for state in self._sides.values():
+            item = state.layer_items.get(key)
+            if item is not None:
+                item.set_color(color)
+
+    def set_components(self, store: ComponentStore, bounds: BoundsMM, side: Side):
+        """Map every component on ``side`` to scene coordinates in one vectorized pass.
+
+        On a panel every component is placed once per board, so positions
+        have an instance axis in front of the store row.
+        """
+        self._drop_snapshot()
+        transforms = self._instance_transforms(bounds)
+        bounds = self._bounds = self._scene_bounds(bounds)
+        self._store = store
+        state = self._sides[side]
+        state.component_positions = None
+        state.spatial_index = None
+        if state.placement_item is not None:
+            state.placement_item.release_tiles()
+            state.scene.removeItem(state.placement_item)
+            state.placement_item = None
+        if self._svg_viewbox is None:
+            return
 
-        item_x = ib_x + norm_x * ib_w
-        item_y = ib_y + norm_y * ib_h
+        instances = len(transforms)
+        with tracer.span("spatial index", rows=len(store), instances=instances):
+            x_mm, y_mm = place_points(transforms, store.x_mm, store.y_mm)
+            x, y = map_to_scene(x_mm, y_mm, bounds, side, self._svg_viewbox, self._item_bounds)
+            positions = np.stack((x, y), axis=-1)
+            on_side = store.side_mask(side)
+            positions[:, ~on_side] = np.nan
+            state.component_positions = positions
+            # Every instance of a part answers with the same store row.
+            rows = np.tile(np.arange(len(store)), instances)
+            state.spatial_index = GridIndex(positions.reshape(-1, 2), rows)
+
+        with tracer.span("placement overlay", placements=int(on_side.sum()) * instances):
+            # Body sizes are looked up once per distinct footprint, then spread by code.
+            scene_per_mm = self._item_bounds[2] / self._svg_viewbox[2] if self._svg_viewbox[2] else 1.0
+            sizes = footprint_bodies_mm(store.footprints)[store.footprint_codes[on_side]] * scene_per_mm
+            rotation = store.rotation_deg[on_side]
+            if self._panel is not None:
+                rotation = rotation + self._panel.rotation_deg
+            centers = positions[:, on_side].reshape(-1, 2)
+            corners = placement_corners(
+                centers, np.tile(sizes, (instances, 1)), np.tile(rotation, instances), side == Side.BOTTOM
+            )
+            state.placement_item = PlacementItem(centers, corners)
+        state.placement_item.setVisible(self._placements_visible)
+        state.scene.addItem(state.placement_item)
+
+    def set_placements_visible(self, visible: bool):
+        self._drop_snapshot()
+        self._placements_visible = visible
+        for state in self._sides.values():
+            if state.placement_item is not None:
+                state.placement_item.setVisible(visible)
+
+    def component_at(self, view_pos: QPoint) -> int | None:
+        """Store row of the placement nearest to a viewport position, if one is close enough."""
+        index = self._sides[self._current_side].spatial_index
+        if index is None or len(index) == 0:
+            return None
+        scene_pos = self.mapToScene(view_pos)
+        radius = self.PICK_RADIUS_PX / max(abs(self.transform().m11()), 1e-9)
+        return index.nearest(scene_pos.x(), scene_pos.y(), radius)
+
+    def components_in_rect(self, rect: QRectF) -> np.ndarray:
+        index = self._sides[self._current_side].spatial_index
+        if index is None:
+            return np.empty(0, dtype=np.intp)
+        return index.query_rect(rect.left(), rect.top(), rect.right(), rect.bottom())
+
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._press_pos = event.position().toPoint()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        super().mouseReleaseEvent(event)
+        press_pos, self._press_pos = self._press_pos, None
+        if event.button() != Qt.MouseButton.LeftButton or press_pos is None:
+            return
 
-        self._component_positions[comp.designator] = (item_x, item_y)
+        # A press and release without a drag in between is a click, not a pan.
+        pos = event.position().toPoint()
+        if (pos - press_pos).manhattanLength() >= QApplication.startDragDistance():
+            return
+        row = self.component_at(pos)
+        if row is not None:
+            self.component_clicked.emit(row)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        press_pos = self._press_pos
+        if press_pos is not None and (
+            (event.position().toPoint() - press_pos).manhattanLength() >= QApplication.startDragDistance()
+        ):
+            self._begin_interaction()
+        super().mouseMoveEvent(event)
+        if event.buttons() != Qt.MouseButton.NoButton:
+            return
 
-    def highlight_components(self, designators: list[str]):
+        row = self.component_at(event.position().toPoint())
+        if row == self._hover_row:
+            return
+        self._hover_row = row
+        if row is None or self._store is None:
+            QToolTip.hideText()
+            return
+
+        store = self._store
+        QToolTip.showText(
+            event.globalPosition().toPoint(),
+            f"{store.designators[row]}\n{store.comment(row)}\n{store.footprint(row)}",
+            self.viewport(),
+        )
+
+    def highlight_components(self, indices: np.ndarray, center: bool = True):
         self.clear_highlights()
 
-        first_pos = None
-        for designator in designators:
-            pos = self._component_positions.get(designator)
-            if pos:
-                svg_x, svg_y = pos
-                if first_pos is None:
-                    first_pos = pos
-
-                marker = PulsingMarker(
-                    svg_x, 
-                    svg_y, 
-                    self._marker_size, 
-                    self._marker_size_mult, 
-                    designator)
-                self._scene.addItem(marker)
-                self._highlight_markers.append(marker)
-
-        if first_pos:
-            self.centerOn(QPointF(first_pos[0], first_pos[1]))
+        positions = self._component_positions
+        if positions is None or self._store is None:
+            return
+
+        indices = np.asarray(indices, dtype=np.intp)
+        on_side = ~np.isnan(positions[0, indices, 0])
+        if not on_side.any():
+            return
+        indices = indices[on_side]
+        # One marker per part on every board of a panel.
+        points = positions[:, indices].reshape(-1, 2)
+        labels = list(self._store.designators[indices]) * len(positions)
+
+        self._highlight = HighlightItem(points, labels, self._marker_size)
+        self._scene.addItem(self._highlight)
+        self._pulse_timer_elapsed.start()
+        self._pulse_timer.start()
+
+        if center:
+            self.centerOn(self._highlight.first_position())
 
     def clear_highlights(self):
-        for marker in self._highlight_markers:
-            self._scene.removeItem(marker)
-        self._highlight_markers.clear()
+        self._drop_snapshot()
+        self._pulse_timer.stop()
+        if self._highlight is not None and self._highlight.scene() is not None:
+            self._highlight.scene().removeItem(self._highlight)
+        self._highlight = None
 
     def zoom_to_fit(self):
         self.fitInView(self._scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
@@ -188,19 +502,85 @@ class PCBView(QGraphicsView):
         else:
             zoom_factor = zoom_out_factor
 
+        self._begin_interaction()
         self._zoom_factor *= zoom_factor
         self.scale(zoom_factor, zoom_factor)
 
+    @property
+    def is_interacting(self) -> bool:
+        """Whether the view is showing its scaled snapshot rather than the scene."""
+        return self._snapshot is not None
+
+    def _begin_interaction(self):
+        """Show a pixmap of the current frame, scaled to follow zoom and pan, until interaction is idle.
+
+        Every call restarts the idle delay and cancels tiles still rendering
+        for an earlier stop, so a burst of wheel steps costs one repaint.
+        """
+        self._cancel_sharpen()
+        if self._snapshot is None and not self.viewport().rect().isEmpty():
+            self._snapshot = self.viewport().grab()
+            self._snapshot_transform = self.viewportTransform()
+        self._sharpen_timer.start()
+
+    def _sharpen(self):
+        """Queue the visible tiles at the current scale; the snapshot stays up until they are all ready."""
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        viewport_transform = self.viewportTransform()
+        keys = set()
+        for item in self._scene.items(visible):
+            if not isinstance(item, TiledItem) or not item.isVisible() or item.effectiveOpacity() <= 0:
+                continue
+            scale = QStyleOptionGraphicsItem.levelOfDetailFromTransform(item.deviceTransform(viewport_transform))
+            keys.update(item.request_tiles(item.mapRectFromScene(visible), tile_level(scale), self._on_sharpen_tile))
+        self._sharpen_keys = keys
+        if keys:
+            self._sharpen_deadline.start()
+        else:
+            self._show_sharp()
+
+    def _on_sharpen_tile(self, key: TileKey):
+        if key not in self._sharpen_keys:
+            return
+        # Tiles cancelled elsewhere will not arrive; stop waiting for them.
+        renderer = tile_renderer()
+        self._sharpen_keys = {other for other in self._sharpen_keys if renderer.is_pending(other)}
+        if not self._sharpen_keys:
+            self._show_sharp()
+
+    def _cancel_sharpen(self):
+        self._sharpen_deadline.stop()
+        keys, self._sharpen_keys = self._sharpen_keys, set()
+        if keys:
+            tile_renderer().cancel_where(keys.__contains__)
+
+    def _show_sharp(self):
+        self._sharpen_deadline.stop()
+        self._sharpen_keys = set()
+        if self._snapshot is not None:
+            self._snapshot = None
+            self.viewport().update()
+
+    def _drop_snapshot(self):
+        """Go back to painting the scene now; the snapshot no longer shows what it holds."""
+        self._sharpen_timer.stop()
+        self._cancel_sharpen()
+        self._show_sharp()
+
+    def paintEvent(self, event: QPaintEvent):
+        if self._snapshot is None:
+            super().paintEvent(event)
+            return
+        # Map the snapshot from the transform it was taken at to the current one.
+        # No smoothing: this runs on every wheel step and drag move.
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), self.backgroundBrush())
+        inverse, _ = self._snapshot_transform.inverted()
+        painter.setTransform(inverse * self.viewportTransform())
+        painter.drawPixmap(0, 0, self._snapshot)
+        painter.end()
+
     def set_marker_size(self, _marker_size):
         self._marker_size = _marker_size
-        highlight_markers_clone = self._highlight_markers[:]
-        self.clear_highlights()
-        for highlight_marker in highlight_markers_clone:
-            marker = PulsingMarker(
-                highlight_marker._center_x, 
-                highlight_marker._center_y, 
-                _marker_size, 
-                highlight_marker._marker_size_mult, 
-                highlight_marker._designator)
-            self._scene.addItem(marker)
-            self._highlight_markers.append(marker)
\ No newline at end of file
+        if self._highlight is not None:
+            self._highlight.set_marker_size(_marker_size)
\ No newline at end of file
@@ -1,80 +1,636 @@
+import codecs
 import csv
+import re
+from array import array
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable, Iterator, Sequence, TextIO
+
+import numpy as np
 
 from .models import Component, Side
+from .component_store import SIDES, ComponentStore, TextColumn
 
+SNIFF_BYTES = 4096
+MIL_TO_MM = 0.0254
+INCH_TO_MM = 25.4
+UNIT_SCALES = {"mm": 1.0, "mil": MIL_TO_MM, "in": INCH_TO_MM}
 
-def parse_pickplace_csv(path: str | Path) -> list[Component]:
-    components: list[Component] = []
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
 
-    encodings = ["utf-8-sig", "utf-8", "utf-16", "cp1252", "latin-1"]
-    lines = None
 
-    for encoding in encodings:
-        try:
-            with open(path, "r", encoding=encoding, newline="") as f:
-                lines = f.readlines()
-            break
-        except (UnicodeDecodeError, UnicodeError):
-            continue
+class PickPlaceError(ValueError):
+    def __init__(self, path: str | Path, line: int, message: str):
+        super().__init__(f"{Path(path).name}, line {line}: {message}")
+        self.path = Path(path)
+        self.line = line
 
-    if lines is None:
-        raise ValueError(f"Could not decode file with any supported encoding")
 
-    header_idx = None
-    for i, line in enumerate(lines):
-        if line.strip().startswith('"Designator"'):
-            header_idx = i
-            break
+class UnknownPlacementFormat(PickPlaceError):
+    """No registered format claims the file; it can still be read with a :class:`ColumnMapping`."""
 
-    if header_idx is None:
-        raise ValueError("Could not find header row with 'Designator' column")
+    def __init__(self, path: str | Path):
+        names = ", ".join(fmt.name for fmt in PLACEMENT_FORMATS)
+        super().__init__(path, 1, f"not a recognised placement file ({names}); map its columns to read it as CSV")
 
-    csv_content = "".join(lines[header_idx:])
-    reader = csv.DictReader(csv_content.splitlines())
 
-    fieldnames = reader.fieldnames or []
-    units_mm = "Center-X(mm)" in fieldnames
-    x_col = "Center-X(mm)" if units_mm else "Center-X(mil)"
-    y_col = "Center-Y(mm)" if units_mm else "Center-Y(mil)"
+def _decode_sample(sample: bytes) -> str:
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
 
-    for row in reader:
-        if not row.get("Designator"):
-            continue
+    # ASCII text saved as UTF-16 without a BOM has a NUL in every other byte.
+    if len(sample) >= 2:
+        if sample[1::2].count(0) > len(sample) // 4 and sample[0::2].count(0) == 0:
+            return "utf-16-le"
+        if sample[0::2].count(0) > len(sample) // 4 and sample[1::2].count(0) == 0:
+            return "utf-16-be"
+
+    try:
+        # The sample may end in the middle of a multi-byte sequence.
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        sample.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def detect_encoding(path: str | Path) -> str:
+    """Guess a text encoding from the BOM and the first few KB of the file."""
+    with open(path, "rb") as f:
+        return _decode_sample(f.read(SNIFF_BYTES))
+
+
+def read_head(path: str | Path) -> tuple[str, str]:
+    """The encoding and decoded text of the first few KB of a file; all that format detection reads."""
+    with open(path, "rb") as f:
+        sample = f.read(SNIFF_BYTES)
+    encoding = _decode_sample(sample)
+    # A cut multi-byte sequence at the end is replaced, not fatal.
+    head = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final=False)
+    return encoding, head
+
+
+# Row fields in Component order: designator, comment, side, footprint, x_mm,
+# y_mm, rotation_deg, description.
+PickPlaceRecord = tuple[str, str, Side, str, float, float, float, str]
+FIELDS = ("designator", "comment", "side", "footprint", "x", "y", "rotation", "description")
+
+
+@dataclass
+class PlacementRows:
+    """The data rows of a file whose header has been read, as an iterator of cell lists.
+
+    ``columns`` gives the cell index of each of :data:`FIELDS`, or None for
+    a field the file does not have. ``scale`` converts coordinates without a
+    unit suffix to millimetres. ``side_of`` maps a side cell to a board side,
+    or None to skip the row; it is called once per distinct cell. Rows with
+    fewer than ``width`` cells are skipped if blank or starting with
+    ``comment`` and are an error otherwise. ``line_of`` gives the line number
+    of a row by index, for error messages.
+    """
+    rows: Iterator[list[str]]
+    columns: tuple[int | None, ...]
+    width: int
+    scale: float
+    side_of: Callable[[str], Side | None]
+    line_of: Callable[[int], int]
+    comment: str | None = None
+
+
+class PlacementFormat:
+    """One placement file format.
+
+    ``sniff`` claims a file from its name and the start of its text (at most
+    :data:`SNIFF_BYTES`); ``read`` parses the header from the open file and
+    returns the remaining rows, which code shared between all formats turns
+    into a :class:`ComponentStore`.
+    """
+    name = ""
+    # Glob patterns for file dialogs.
+    patterns: tuple[str, ...] = ()
+
+    def sniff(self, name: str, head: str) -> bool:
+        raise NotImplementedError
+
+    def read(self, path: Path, f: TextIO) -> PlacementRows:
+        raise NotImplementedError
+
+
+def _lines(head: str, limit: int = 40) -> list[str]:
+    # The last line of the sample may be cut short.
+    return head.splitlines()[:-1][:limit] or head.splitlines()[:1]
+
+
+def _parse_side(text: str) -> Side | None:
+    text = text.strip().lower()
+    if text.startswith("t"):
+        return Side.TOP
+    if text.startswith("b"):
+        return Side.BOTTOM
+    return None
+
+
+def _csv_line_of(f: TextIO, header_line: int, *args, **kwargs) -> Callable[[int], int]:
+    """Line numbers of the data rows of a CSV file whose header ends on ``header_line``.
+
+    Quoted cells may span lines, so the file is read again up to the row;
+    that only happens for an error message.
+    """
+    name, encoding = f.name, f.encoding
+
+    def line_of(index: int) -> int:
+        with open(name, "r", encoding=encoding, newline="") as again:
+            for _ in range(header_line):
+                again.readline()
+            reader = csv.reader(again, *args, **kwargs)
+            for _ in zip(range(index + 1), reader):
+                pass
+            return header_line + reader.line_num
+
+    return line_of
 
-        layer = row.get("Layer", "").strip()
-        if "Top" in layer:
-            side = Side.TOP
-        elif "Bottom" in layer:
-            side = Side.BOTTOM
+
+def _column_indices(columns: dict[str, int], names: tuple[str | None, ...]) -> tuple[int | None, ...]:
+    return tuple(None if name is None else columns.get(name) for name in names)
+
+
+class AltiumCsvFormat(PlacementFormat):
+    """Altium Designer Pick and Place CSV: a preamble, then a header starting with ``Designator``."""
+    name = "Altium CSV"
+    patterns = ("*.csv", "*.txt")
+
+    @staticmethod
+    def _is_header(line: str) -> bool:
+        return line.lstrip().lstrip('"').startswith("Designator")
+
+    def sniff(self, name: str, head: str) -> bool:
+        return any(self._is_header(line) for line in _lines(head))
+
+    def read(self, path: Path, f: TextIO) -> PlacementRows:
+        units = "mil"
+        line_no = 0
+        for line in f:
+            line_no += 1
+            if self._is_header(line):
+                break
+            match = re.match(r"\s*\"?Units used in this file\s*:\s*(mm|mil)", line, re.IGNORECASE)
+            if match:
+                units = match.group(1).lower()
         else:
-            continue
+            raise PickPlaceError(path, line_no, "could not find header row with 'Designator' column")
+
+        fieldnames = [name.strip() for name in next(csv.reader([line]))]
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        if "Center-X(mm)" in columns:
+            x_name, y_name, scale = "Center-X(mm)", "Center-Y(mm)", 1.0
+        elif "Center-X(mil)" in columns:
+            x_name, y_name, scale = "Center-X(mil)", "Center-Y(mil)", MIL_TO_MM
+        else:
+            # Newer exports give "Mid X", with the unit on every value or in the preamble.
+            x_name, y_name, scale = "Mid X", "Mid Y", UNIT_SCALES[units]
+        if x_name not in columns or y_name not in columns:
+            raise PickPlaceError(path, line_no, "header has no Center-X/Center-Y columns")
+
+        names = ("Designator", "Comment", "Layer", "Footprint", x_name, y_name, "Rotation", "Description")
+        return PlacementRows(
+            rows=csv.reader(f),
+            columns=_column_indices(columns, names),
+            width=len(fieldnames),
+            scale=scale,
+            side_of=_altium_side,
+            line_of=_csv_line_of(f, line_no),
+        )
+
+
+def _altium_side(layer: str) -> Side | None:
+    if "Top" in layer:
+        return Side.TOP
+    if "Bottom" in layer:
+        return Side.BOTTOM
+    # Some versions write just T and B.
+    return {"T": Side.TOP, "B": Side.BOTTOM}.get(layer.strip())
+
 
+class KicadPosFormat(PlacementFormat):
+    """KiCad footprint position files, as aligned text (``.pos``) or CSV."""
+    name = "KiCad .pos"
+    patterns = ("*.pos", "*.csv")
+
+    @staticmethod
+    def _csv_header(line: str) -> bool:
+        return line.startswith(("Ref,", '"Ref",')) and "PosX" in line
+
+    @staticmethod
+    def _text_header(line: str) -> bool:
+        return line.startswith("#") and line.lstrip("# ").startswith("Ref") and "PosX" in line
+
+    def sniff(self, name: str, head: str) -> bool:
+        for line in _lines(head):
+            if re.match(r"###\s*(Module|Footprint) positions", line) or self._csv_header(line) or self._text_header(line):
+                return True
+        return False
+
+    def read(self, path: Path, f: TextIO) -> PlacementRows:
+        scale = 1.0
+        line_no = 0
+        for line in f:
+            line_no += 1
+            match = re.match(r"##\s*Unit\s*=\s*(\w+)", line)
+            if match:
+                scale = INCH_TO_MM if match.group(1).lower().startswith("inch") else 1.0
+            if self._csv_header(line):
+                fieldnames = [name.strip() for name in next(csv.reader([line]))]
+                dialect = {}
+                break
+            if self._text_header(line):
+                fieldnames = line.lstrip("# ").split()
+                # Columns are padded with spaces; names with spaces are quoted.
+                dialect = {"delimiter": " ", "skipinitialspace": True}
+                break
+        else:
+            raise PickPlaceError(path, line_no, "could not find header row with 'Ref' and 'PosX' columns")
+
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        missing = [name for name in ("Ref", "PosX", "PosY") if name not in columns]
+        if missing:
+            raise PickPlaceError(path, line_no, f"header has no {'/'.join(missing)} column")
+        # Without a Side column every part is on top.
+        side_of = _parse_side if "Side" in columns else lambda _: Side.TOP
+        return PlacementRows(
+            rows=csv.reader(f, **dialect),
+            columns=_column_indices(columns, ("Ref", "Val", "Side", "Package", "PosX", "PosY", "Rot", None)),
+            width=len(fieldnames),
+            scale=scale,
+            side_of=side_of,
+            line_of=_csv_line_of(f, line_no, **dialect),
+            # The text format ends with "## End".
+            comment="#",
+        )
+
+
+class EagleMountFormat(PlacementFormat):
+    """Eagle ``mountsmd.ulp`` output: ``name x y rotation value package`` in millimetres.
+
+    The side comes from the file name: ``.mnt`` is the top, ``.mnb`` the bottom.
+    """
+    name = "Eagle .mnt/.mnb"
+    patterns = ("*.mnt", "*.mnb")
+
+    _ROW_RE = re.compile(r"^\s*\S+\s+[-+]?[\d.]+\s+[-+]?[\d.]+\s+[-+]?[\d.]+(\s|$)")
+
+    def sniff(self, name: str, head: str) -> bool:
+        lines = [line for line in _lines(head) if line.strip()]
+        if not lines or not all(self._ROW_RE.match(line) for line in lines):
+            return False
+        # Plain four-number rows are too generic to claim without the extension.
+        return Path(name).suffix.lower() in (".mnt", ".mnb") or all(len(line.split()) >= 6 for line in lines)
+
+    def read(self, path: Path, f: TextIO) -> PlacementRows:
+        side = Side.BOTTOM if path.suffix.lower() == ".mnb" else Side.TOP
+        lines: list[int] = []
+        return PlacementRows(
+            rows=self._rows(path, f, lines),
+            columns=(0, 4, None, 5, 1, 2, 3, None),
+            width=6,
+            scale=1.0,
+            side_of=lambda _: side,
+            line_of=lines.__getitem__,
+        )
+
+    @staticmethod
+    def _rows(path: Path, f: TextIO, lines: list[int]) -> Iterator[list[str]]:
+        for line_no, line in enumerate(f, 1):
+            tokens = line.split()
+            if not tokens:
+                continue
+            if len(tokens) < 4:
+                raise PickPlaceError(path, line_no, f"expected at least 4 fields, found {len(tokens)}")
+            lines.append(line_no)
+            # An empty value leaves five fields; values may contain spaces.
+            package = tokens[-1] if len(tokens) > 4 else ""
+            yield [tokens[0], tokens[1], tokens[2], tokens[3], " ".join(tokens[4:-1]), package]
+
+
+@dataclass(frozen=True)
+class ColumnMapping:
+    """Which header columns of a generic CSV hold each field.
+
+    Only the designator and coordinate columns are required. Coordinates are
+    in ``units`` (``mm``, ``mil`` or ``in``) unless a value carries its own
+    unit; rows without a side column are on ``default_side``.
+    """
+    designator: str
+    x: str
+    y: str
+    comment: str | None = None
+    footprint: str | None = None
+    rotation: str | None = None
+    side: str | None = None
+    description: str | None = None
+    units: str = "mm"
+    default_side: Side = Side.TOP
+
+    @classmethod
+    def parse(cls, text: str) -> "ColumnMapping":
+        """From ``field=Column`` pairs separated by commas, e.g. ``designator=Ref,x=X,y=Y,units=mil``."""
+        values = {}
+        for pair in text.split(","):
+            key, sep, value = pair.partition("=")
+            if not sep:
+                raise ValueError(f"expected field=column, got {pair!r}")
+            values[key.strip().lower().replace("-", "_")] = value.strip()
+        if "default_side" in values:
+            values["default_side"] = Side.BOTTOM if values["default_side"].lower().startswith("b") else Side.TOP
+        if values.get("units", "mm") not in UNIT_SCALES:
+            raise ValueError(f"units must be one of {', '.join(UNIT_SCALES)}")
         try:
-            x_val = float(row.get(x_col, 0))
-            y_val = float(row.get(y_col, 0))
-            rotation = float(row.get("Rotation", 0) or 0)
-
-            if units_mm:
-                x_mm = x_val
-                y_mm = y_val
-            else:
-                x_mm = x_val * 0.0254
-                y_mm = y_val * 0.0254
-        except ValueError:
-            continue
+            return cls(**values)
+        except TypeError as e:
+            raise ValueError(str(e)) from None
+
+
+def _sniff_dialect(head: str) -> type[csv.Dialect] | csv.Dialect:
+    try:
+        return csv.Sniffer().sniff(head, delimiters=",;\t")
+    except csv.Error:
+        return csv.excel
+
+
+def csv_header(path: str | Path) -> list[str]:
+    """Column names of a delimited file, for mapping them: the widest of its first rows."""
+    _, head = read_head(path)
+    rows = list(csv.reader(_lines(head, 20), _sniff_dialect(head)))
+    best = max(rows, key=lambda row: sum(1 for cell in row if cell.strip()), default=[])
+    return [cell.strip() for cell in best]
+
+
+class GenericCsvFormat(PlacementFormat):
+    """Any delimited table, read through a :class:`ColumnMapping`."""
+    name = "CSV"
+    patterns = ("*.csv", "*.txt", "*.tsv")
+
+    def __init__(self, mapping: ColumnMapping):
+        self.mapping = mapping
+
+    def _header_columns(self, row: list[str]) -> dict[str, int] | None:
+        columns = {cell.strip().lower(): i for i, cell in enumerate(row)}
+        required = (self.mapping.designator, self.mapping.x, self.mapping.y)
+        return columns if all(name.lower() in columns for name in required) else None
 
-        components.append(
-            Component(
-                designator=row.get("Designator", "").strip(),
-                comment=row.get("Comment", "").strip(),
-                side=side,
-                footprint=row.get("Footprint", "").strip(),
-                x_mm=x_mm,
-                y_mm=y_mm,
-                rotation_deg=rotation,
-                description=row.get("Description", "").strip(),
-            )
+    def sniff(self, name: str, head: str) -> bool:
+        reader = csv.reader(_lines(head), _sniff_dialect(head))
+        return any(self._header_columns(row) is not None for row in reader)
+
+    def read(self, path: Path, f: TextIO) -> PlacementRows:
+        dialect = _sniff_dialect(f.read(SNIFF_BYTES))
+        f.seek(0)
+        reader = csv.reader(f, dialect)
+        for row in reader:
+            columns = self._header_columns(row)
+            if columns is not None:
+                break
+        else:
+            raise PickPlaceError(path, reader.line_num, f"could not find header row with {self.mapping.designator!r} column")
+        header_line = reader.line_num
+
+        mapping = self.mapping
+        names = tuple(getattr(mapping, field) for field in FIELDS)
+        for name in names:
+            if name is not None and name.lower() not in columns:
+                raise PickPlaceError(path, header_line, f"header has no {name!r} column")
+        default_side = mapping.default_side
+        side_of = (lambda text: _parse_side(text) or default_side) if mapping.side else (lambda _: default_side)
+        return PlacementRows(
+            rows=reader,
+            columns=_column_indices(columns, tuple(None if name is None else name.lower() for name in names)),
+            width=len(row),
+            scale=UNIT_SCALES[mapping.units],
+            side_of=side_of,
+            line_of=_csv_line_of(f, header_line, dialect),
         )
 
-    return components
+
+# Tried in order; the first format whose sniff claims a file reads it.
+PLACEMENT_FORMATS: list[PlacementFormat] = [AltiumCsvFormat(), KicadPosFormat(), EagleMountFormat()]
+
+
+def register_format(fmt: PlacementFormat, first: bool = False):
+    """Add a reader to the formats tried by :func:`sniff_format`."""
+    if first:
+        PLACEMENT_FORMATS.insert(0, fmt)
+    else:
+        PLACEMENT_FORMATS.append(fmt)
+
+
+def file_filter() -> str:
+    """A file dialog filter listing every registered format."""
+    patterns = sorted({pattern for fmt in PLACEMENT_FORMATS for pattern in fmt.patterns})
+    return f"Placement Files ({' '.join(patterns)});;All Files (*)"
+
+
+def sniff_format(path: str | Path, mapping: ColumnMapping | None = None) -> tuple[PlacementFormat, str]:
+    """The format that claims a file, and its encoding, from the first few KB only.
+
+    A ``mapping`` is tried before the registered formats.
+    """
+    encoding, head = read_head(path)
+    formats = PLACEMENT_FORMATS if mapping is None else [GenericCsvFormat(mapping), *PLACEMENT_FORMATS]
+    for fmt in formats:
+        if fmt.sniff(Path(path).name, head):
+            return fmt, encoding
+    raise UnknownPlacementFormat(path)
+
+
+_NUMBER_RE = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(mm|mils?|in|inch|\")?\s*$", re.IGNORECASE)
+_SUFFIX_SCALES = {"mm": 1.0, "mil": MIL_TO_MM, "mils": MIL_TO_MM, "in": INCH_TO_MM, "inch": INCH_TO_MM, '"': INCH_TO_MM}
+
+
+def parse_numbers(
+    texts: Sequence[str], scale: float, path: str | Path, line_of: Callable[[int], int], blank: float | None = None
+) -> np.ndarray:
+    """Convert a whole column of numeric text, scaled by ``scale``.
+
+    Plain numbers take one C-level pass; only if that fails are the cells
+    parsed one by one, honouring unit suffixes such as ``12.5mil`` (converted
+    to millimetres instead of scaled), giving ``blank`` cells that value and
+    reporting the line of a bad cell.
+    """
+    try:
+        values = np.fromiter(map(float, texts), dtype=np.float64, count=len(texts))
+    except ValueError:
+        pass
+    else:
+        return values * scale if scale != 1.0 else values
+
+    values = np.empty(len(texts), dtype=np.float64)
+    for i, text in enumerate(texts):
+        values[i] = _parse_number(text, scale, path, lambda: line_of(i), blank)
+    return values
+
+
+def _parse_number(
+    text: str, scale: float, path: str | Path, line: Callable[[], int], blank: float | None = None
+) -> float:
+    """One cell of :func:`parse_numbers`; ``line`` is only called for the error message."""
+    try:
+        return float(text) * scale
+    except ValueError:
+        pass
+    if blank is not None and not text.strip():
+        return blank
+    match = _NUMBER_RE.match(text)
+    if match is None:
+        raise PickPlaceError(path, line(), f"invalid number {text.strip()!r}")
+    unit = match.group(2)
+    return float(match.group(1)) * (_SUFFIX_SCALES[unit.lower()] if unit else scale)
+
+
+def _placement_rows(path: str | Path, found: PlacementRows) -> Iterator[tuple]:
+    """The rows that place a part, as ``(index, designator, side code, comment,
+    footprint, x, y, rotation, description)`` with every cell but the
+    designator still raw text; ``index`` counts all rows read.
+    """
+    width = found.width
+    # Fields the file lacks read from an empty cell appended to every row.
+    fields = itemgetter(*(width if cell is None else cell for cell in found.columns))
+    comment = found.comment
+    side_codes: dict[str, int] = {}
+
+    for i, row in enumerate(found.rows):
+        if len(row) < width:
+            if not any(cell.strip() for cell in row) or (comment and row[0].startswith(comment)):
+                continue
+            raise PickPlaceError(path, found.line_of(i), f"expected {width} columns, found {len(row)}")
+        row.append("")
+        designator, comment_cell, side, footprint, x, y, rotation, description = fields(row)
+
+        side_code = side_codes.get(side)
+        if side_code is None:
+            board_side = found.side_of(side)
+            side_code = side_codes[side] = -1 if board_side is None else SIDES.index(board_side)
+        designator = designator.strip()
+        if side_code < 0 or not designator:
+            continue
+        yield i, designator, side_code, comment_cell, footprint, x, y, rotation, description
+
+
+def _build_store(path: str | Path, found: PlacementRows) -> ComponentStore:
+    """Turn the rows a format read into a store.
+
+    One pass collects the cells as text; the numeric columns are then
+    converted whole by :func:`parse_numbers`.
+    """
+    # Index of every kept row among the rows read, for error messages.
+    kept = array("l")
+    designators: list[str] = []
+    sides = array("b")
+    xs: list[str] = []
+    ys: list[str] = []
+    rotations: list[str] = []
+    comments, footprints, descriptions = TextColumn(), TextColumn(), TextColumn()
+
+    for i, designator, side_code, comment_cell, footprint, x, y, rotation, description in _placement_rows(path, found):
+        kept.append(i)
+        designators.append(designator)
+        sides.append(side_code)
+        xs.append(x)
+        ys.append(y)
+        rotations.append(rotation)
+        comments.append(comment_cell)
+        footprints.append(footprint)
+        descriptions.append(description)
+
+    def line_of(i: int) -> int:
+        return found.line_of(kept[i])
+
+    return ComponentStore(
+        designators=np.array(designators, dtype=object),
+        comment_codes=comments.array(),
+        comments=comments.values,
+        footprint_codes=footprints.array(),
+        footprints=footprints.values,
+        description_codes=descriptions.array(),
+        descriptions=descriptions.values,
+        sides=np.frombuffer(sides, dtype=np.int8).copy(),
+        x_mm=parse_numbers(xs, found.scale, path, line_of),
+        y_mm=parse_numbers(ys, found.scale, path, line_of),
+        rotation_deg=parse_numbers(rotations, 1.0, path, line_of, blank=0.0),
+    )
+
+
+def _bad_line(path: str | Path, encoding: str) -> int:
+    # Only used for the error message; an incremental decoder copes with
+    # multi-byte sequences split across lines.
+    decoder = codecs.getincrementaldecoder(encoding)()
+    line_no = 0
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            try:
+                decoder.decode(line)
+            except UnicodeDecodeError:
+                return line_no
+    return line_no
+
+
+def load_pickplace_store(path: str | Path, mapping: ColumnMapping | None = None) -> ComponentStore:
+    """Parse a placement file of any registered format straight into columns.
+
+    ``mapping`` reads a CSV file that no registered format recognises.
+    """
+    fmt, encoding = sniff_format(path, mapping)
+    try:
+        with open(path, "r", encoding=encoding, newline="") as f:
+            return _build_store(path, fmt.read(Path(path), f))
+    except UnicodeDecodeError as e:
+        raise PickPlaceError(path, _bad_line(path, encoding), f"not valid {encoding} text ({e.reason})") from None
+
+
+def iter_pickplace_records(path: str | Path, mapping: ColumnMapping | None = None) -> Iterator[PickPlaceRecord]:
+    """Yield placements row by row as plain tuples, in :data:`FIELDS` order.
+
+    Only the current row is held, plus each distinct text cell once.
+    """
+    fmt, encoding = sniff_format(path, mapping)
+    try:
+        with open(path, "r", encoding=encoding, newline="") as f:
+            found = fmt.read(Path(path), f)
+            scale = found.scale
+            # Repeated comment, footprint and description cells are stripped once and shared.
+            shared: dict[str, str] = {}
+            for i, designator, side_code, comment, footprint, x, y, rotation, description in _placement_rows(path, found):
+                line = lambda: found.line_of(i)
+                yield (
+                    designator,
+                    shared.get(comment) or shared.setdefault(comment, comment.strip()),
+                    SIDES[side_code],
+                    shared.get(footprint) or shared.setdefault(footprint, footprint.strip()),
+                    _parse_number(x, scale, path, line),
+                    _parse_number(y, scale, path, line),
+                    _parse_number(rotation, 1.0, path, line, blank=0.0),
+                    shared.get(description) or shared.setdefault(description, description.strip()),
+                )
+    except UnicodeDecodeError as e:
+        raise PickPlaceError(path, _bad_line(path, encoding), f"not valid {encoding} text ({e.reason})") from None
+
+
+def iter_pickplace_csv(path: str | Path, mapping: ColumnMapping | None = None) -> Iterator[Component]:
+    """Yield a :class:`Component` per row without holding the file in memory."""
+    for record in iter_pickplace_records(path, mapping):
+        yield Component(*record)
+
+
+def parse_pickplace_csv(path: str | Path, mapping: ColumnMapping | None = None) -> list[Component]:
+    return list(iter_pickplace_csv(path, mapping))
@@ -0,0 +1,150 @@
+from functools import partial
+from typing import Callable
+
+import numpy as np
+
+from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QPolygonF
+from PySide6.QtWidgets import QStyleOptionGraphicsItem
+
+from .layer_item import TiledItem
+
+PLACEMENT_COLOR = "#00c8ff"
+# Placements are split into this many chunks per axis for culling.
+CHUNKS_PER_AXIS = 16
+# Below this typical on-screen size (pixels) placements are drawn as dots.
+MIN_OUTLINE_PIXELS = 4.0
+DOT_PIXELS = 3.0
+
+
+def placement_corners(
+    positions: np.ndarray, sizes: np.ndarray, rotation_deg: np.ndarray, mirror: bool
+) -> np.ndarray:
+    """``(n, 4, 2)`` scene corners of each placement's rotated body.
+
+    ``sizes`` are scene-unit (x, y) extents at zero rotation. Rotation is
+    counter-clockwise on the board, whose y axis points up while the scene's
+    points down; the bottom side is additionally mirrored in x.
+    """
+    half = sizes / 2
+    local = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float64)
+    dx = local[None, :, 0] * half[:, None, 0]
+    dy = local[None, :, 1] * half[:, None, 1]
+
+    angle = np.radians(rotation_deg)[:, None]
+    cos, sin = np.cos(angle), np.sin(angle)
+    board_x = dx * cos - dy * sin
+    board_y = dx * sin + dy * cos
+
+    corners = np.empty((len(positions), 4, 2))
+    corners[:, :, 0] = positions[:, None, 0] + (-board_x if mirror else board_x)
+    corners[:, :, 1] = positions[:, None, 1] - board_y
+    return corners
+
+
+class _Chunk:
+    def __init__(self, rect: QRectF, centers: np.ndarray, corners: np.ndarray):
+        self.rect = rect
+        self._centers = centers
+        self._corners = corners
+        self._dots: QPolygonF | None = None
+        self._outlines: QPainterPath | None = None
+
+    @property
+    def dots(self) -> QPolygonF:
+        if self._dots is None:
+            self._dots = QPolygonF([QPointF(x, y) for x, y in self._centers.tolist()])
+        return self._dots
+
+    @property
+    def outlines(self) -> QPainterPath:
+        # Built on first zoom-in; most chunks are never seen up close.
+        if self._outlines is None:
+            path = QPainterPath()
+            for x0, y0, x1, y1, x2, y2, x3, y3 in self._corners.reshape(-1, 8).tolist():
+                path.moveTo(x0, y0)
+                path.lineTo(x1, y1)
+                path.lineTo(x2, y2)
+                path.lineTo(x3, y3)
+                path.closeSubpath()
+            self._outlines = path
+        return self._outlines
+
+
+def draw_placements(painter: QPainter, chunks: list[_Chunk], typical_size: float, color: QColor):
+    """Draw the chunks that intersect the painter's target, as dots or outlines by scale."""
+    transform = painter.worldTransform()
+    visible = transform.inverted()[0].mapRect(QRectF(painter.device().rect()))
+    chunks = [chunk for chunk in chunks if chunk.rect.intersects(visible)]
+    if not chunks:
+        return
+
+    pixels_per_unit = QStyleOptionGraphicsItem.levelOfDetailFromTransform(transform)
+    pen = QPen(color)
+    pen.setCosmetic(True)
+
+    painter.save()
+    if typical_size * pixels_per_unit < MIN_OUTLINE_PIXELS:
+        pen.setWidthF(DOT_PIXELS)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        for chunk in chunks:
+            painter.drawPoints(chunk.dots)
+    else:
+        painter.setPen(pen)
+        painter.setBrush(QBrush(Qt.BrushStyle.NoBrush))
+        for chunk in chunks:
+            painter.drawPath(chunk.outlines)
+    painter.restore()
+
+
+class PlacementItem(TiledItem):
+    """Every placement on one side, with level-of-detail culling.
+
+    Placements are bucketed into a coarse grid of chunks, and each tile only
+    draws the chunks it overlaps: one point set per chunk while parts are a
+    few pixels across, one outline path per chunk when zoomed in. Tiles are
+    cached like board layers, so panning and zooming reuse them.
+    """
+
+    def __init__(self, positions: np.ndarray, corners: np.ndarray):
+        super().__init__()
+        self._chunks: list[_Chunk] = []
+        self._bounds = QRectF()
+        self._typical_size = 0.0
+        self._color = QColor(PLACEMENT_COLOR)
+        self.setZValue(10)
+
+        if len(positions) == 0:
+            return
+
+        # Per-placement boxes; reducing over the four corners one by one is far
+        # cheaper than an axis reduction over such a short axis.
+        lo = np.minimum(np.minimum(corners[:, 0], corners[:, 1]), np.minimum(corners[:, 2], corners[:, 3]))
+        hi = np.maximum(np.maximum(corners[:, 0], corners[:, 1]), np.maximum(corners[:, 2], corners[:, 3]))
+        board_lo, board_hi = lo.min(axis=0), hi.max(axis=0)
+        self._bounds = QRectF(QPointF(*board_lo), QPointF(*board_hi))
+        edges = np.hypot(*(corners[:, 1] - corners[:, 0]).T), np.hypot(*(corners[:, 2] - corners[:, 1]).T)
+        self._typical_size = float(np.median(np.minimum(*edges)))
+
+        cell = np.maximum((board_hi - board_lo) / CHUNKS_PER_AXIS, 1e-9)
+        chunk = np.minimum(((positions - board_lo) // cell).astype(np.intp), CHUNKS_PER_AXIS - 1)
+        keys = chunk[:, 1] * CHUNKS_PER_AXIS + chunk[:, 0]
+        order = np.argsort(keys, kind="stable")
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys[order])) + 1))
+        chunk_lo = np.minimum.reduceat(lo[order], starts)
+        chunk_hi = np.maximum.reduceat(hi[order], starts)
+        positions, corners = positions[order], corners[order]
+        ends = np.append(starts[1:], len(order))
+        for start, end, (x0, y0), (x1, y1) in zip(starts.tolist(), ends.tolist(), chunk_lo.tolist(), chunk_hi.tolist()):
+            rect = QRectF(x0, y0, x1 - x0, y1 - y0)
+            self._chunks.append(_Chunk(rect, positions[start:end], corners[start:end]))
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def draw_vectors(self, painter: QPainter):
+        draw_placements(painter, self._chunks, self._typical_size, self._color)
+
+    def tile_draw(self) -> Callable[[QPainter], None]:
+        return partial(draw_placements, chunks=self._chunks, typical_size=self._typical_size, color=QColor(self._color))
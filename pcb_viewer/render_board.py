@@ -1,34 +1,186 @@
-from pathlib import Path
-
-from gerbonara import GerberFile
-from gerbonara.layers import LayerStack
+import json
+from dataclasses import dataclass, asdict, field, replace
 
 from .models import BoundsMM, Side
-from .gerber_loader import GerberSet
+from .gerber_loader import GerberSet, LayerFile
+from .layer_registry import layer_registry
+from .disk_cache import disk_cache, content_hash, combine_keys
+from .layer_geometry import LayerGeometry, load_layer_geometry
+from .gerber_bounds import UnsupportedGerber, scan_gerber_bounds
+from .panel import PanelLayout
+from .tracing import Span, tracer
 
+LAYER_COLORS = {
+    "outline": "#1a3d1a",
+    "copper": "#b87333",
+    "soldermask": "#1a5f1a",
+    "silkscreen": "#ffffff",
+    "drill": "#101010",
+}
+SOLDERMASK_OPENING_COLOR = "#d4af37"
+PASTE_COLOR = "#c0c0c0"
+
+
+@dataclass
+class LayerStyle:
+    key: str
+    label: str
+    role: str
+    color: str
+    opacity: float = 1.0
+    visible: bool = True
+
+
+# Paint order, bottom to top. Several entries may draw the same role; the
+# soldermask is drawn twice, once as the mask and once as its openings.
+LAYER_STACK = [
+    LayerStyle("outline", "Outline", "outline", LAYER_COLORS["outline"]),
+    LayerStyle("copper", "Copper", "copper", LAYER_COLORS["copper"]),
+    LayerStyle("soldermask", "Soldermask", "soldermask", LAYER_COLORS["soldermask"], 0.85),
+    LayerStyle("mask_openings", "Mask openings", "soldermask", SOLDERMASK_OPENING_COLOR),
+    LayerStyle("paste", "Paste", "paste", PASTE_COLOR, visible=False),
+    LayerStyle("silkscreen", "Silkscreen", "silkscreen", LAYER_COLORS["silkscreen"]),
+    LayerStyle("drill", "Drill", "drill", LAYER_COLORS["drill"]),
+]
+
+
+def default_layer_styles() -> dict[str, LayerStyle]:
+    return {style.key: replace(style) for style in LAYER_STACK}
 
-def get_board_bounds(gerber_set: GerberSet) -> BoundsMM:
-    all_bounds = []
+
+@dataclass
+class LoadedLayer:
+    path: LayerFile
+    geometry: LayerGeometry
+    spans: list[Span] = field(default_factory=list)
+    # Why the layer could not be read; its geometry is then empty.
+    error: str | None = None
+
+
+def bounds_layers(gerber_set: GerberSet) -> list[LayerFile]:
+    # The outline alone defines the board; other layers only matter without one.
+    if gerber_set.outline and gerber_set.outline.exists():
+        return [gerber_set.outline]
 
     files_to_check = [
-        gerber_set.outline,
         gerber_set.gtl,
         gerber_set.gbl,
         gerber_set.gto,
         gerber_set.gbo,
     ]
+    return [p for p in files_to_check if p and p.exists()]
+
+
+def side_layers(gerber_set: GerberSet, side: Side) -> dict[str, LayerFile]:
+    if side == Side.TOP:
+        layers = {
+            "outline": gerber_set.outline,
+            "copper": gerber_set.gtl,
+            "soldermask": gerber_set.gts,
+            "silkscreen": gerber_set.gto,
+            "paste": gerber_set.gtp,
+            "drill": gerber_set.drill,
+        }
+    else:
+        layers = {
+            "outline": gerber_set.outline,
+            "copper": gerber_set.gbl,
+            "soldermask": gerber_set.gbs,
+            "silkscreen": gerber_set.gbo,
+            "paste": gerber_set.gbp,
+            "drill": gerber_set.drill,
+        }
+    return {role: p for role, p in layers.items() if p and p.exists()}
+
+
+def _layers_key(paths: list[LayerFile]) -> str:
+    return combine_keys(*(f"{p.name}:{content_hash(p)}" for p in paths))
+
+
+def _bounds_cache_key(gerber_set: GerberSet) -> str:
+    return _layers_key(bounds_layers(gerber_set))
+
+
+def _svg_layers(gerber_set: GerberSet, side: Side) -> dict[str, LayerFile]:
+    return {role: p for role, p in side_layers(gerber_set, side).items() if role in LAYER_COLORS}
+
+
+def _svg_cache_key(gerber_set: GerberSet, side: Side, bounds: BoundsMM, panel: PanelLayout | None = None) -> str:
+    layers = _svg_layers(gerber_set, side)
+    parts = [
+        _layers_key(list(layers.values())),
+        ",".join(layers),
+        side.value,
+        repr((bounds.xmin, bounds.xmax, bounds.ymin, bounds.ymax)),
+    ]
+    if panel is not None:
+        parts.append(repr(panel))
+    return combine_keys(*parts)
+
+
+def cached_board_bounds(gerber_set: GerberSet) -> BoundsMM | None:
+    cached = disk_cache.get("bounds", _bounds_cache_key(gerber_set))
+    if cached is None:
+        return None
+    try:
+        return BoundsMM(**json.loads(cached))
+    except (ValueError, TypeError):
+        return None
+
+
+def store_board_bounds(gerber_set: GerberSet, bounds: BoundsMM):
+    disk_cache.put("bounds", _bounds_cache_key(gerber_set), json.dumps(asdict(bounds)).encode("utf-8"))
+
 
-    for gpath in files_to_check:
-        if gpath and gpath.exists():
-            try:
-                gf = GerberFile.open(gpath)
-                bounds = gf.bounding_box()
-                if bounds and bounds[0] is not None:
-                    (xmin, ymin), (xmax, ymax) = bounds
-                    all_bounds.append((xmin, ymin, xmax, ymax))
-            except Exception:
-                pass
+def cached_board_svg(
+    gerber_set: GerberSet, side: Side, bounds: BoundsMM, panel: PanelLayout | None = None
+) -> bytes | None:
+    return disk_cache.get("svg", _svg_cache_key(gerber_set, side, bounds, panel))
 
+
+def store_board_svg(
+    gerber_set: GerberSet, side: Side, bounds: BoundsMM, svg_data: bytes, panel: PanelLayout | None = None
+):
+    disk_cache.put("svg", _svg_cache_key(gerber_set, side, bounds, panel), svg_data)
+
+
+def get_board_bounds(gerber_set: GerberSet) -> BoundsMM:
+    bounds = cached_board_bounds(gerber_set)
+    if bounds is not None:
+        return bounds
+
+    with tracer.span("board bounds"):
+        bounds = merge_bounds([layer_bounds(p) for p in bounds_layers(gerber_set)])
+    store_board_bounds(gerber_set, bounds)
+    return bounds
+
+
+def layer_bounds(layer_path: LayerFile) -> tuple[float, float, float, float] | None:
+    with tracer.span("layer bounds", file=layer_path.name) as span:
+        return _layer_bounds(layer_path, span)
+
+
+def _layer_bounds(layer_path: LayerFile, span: Span) -> tuple[float, float, float, float] | None:
+    try:
+        return scan_gerber_bounds(layer_path)
+    except (UnsupportedGerber, ValueError, IndexError, OSError):
+        pass
+
+    # Fall back to a full parse for anything the scanner cannot size.
+    span.set(full_parse=True)
+    try:
+        gf = layer_registry.open(layer_path)
+        bounds = gf.bounding_box()
+        if bounds and bounds[0] is not None:
+            (xmin, ymin), (xmax, ymax) = bounds
+            return (xmin, ymin, xmax, ymax)
+    except Exception:
+        pass
+    return None
+
+
+def merge_bounds(all_bounds: list[tuple[float, float, float, float] | None]) -> BoundsMM:
+    all_bounds = [b for b in all_bounds if b is not None]
     if not all_bounds:
         return BoundsMM()
 
@@ -41,64 +193,122 @@ def get_board_bounds(gerber_set: GerberSet) -> BoundsMM:
 
 
 def render_gerber_to_svg(
-    gerber_set: GerberSet, side: Side, bounds: BoundsMM
+    gerber_set: GerberSet, side: Side, bounds: BoundsMM, panel: PanelLayout | None = None
 ) -> bytes:
-    width = bounds.width
-    height = bounds.height
+    with tracer.span("render svg", side=side.name.lower()) as span:
+        cached = cached_board_svg(gerber_set, side, bounds, panel)
+        if cached is not None:
+            span.set(cached=True, bytes=len(cached))
+            return cached
+
+        # Fragments are drawn in currentColor; the composer sets the colour per pass.
+        fragments = {
+            role: render_layer_svg(path, "currentColor")
+            for role, path in _svg_layers(gerber_set, side).items()
+        }
+        svg_data = compose_board_svg(side, bounds, fragments, panel)
+        store_board_svg(gerber_set, side, bounds, svg_data, panel)
+        span.set(cached=False, bytes=len(svg_data))
+        return svg_data
+
+
+def compose_board_svg(
+    side: Side, bounds: BoundsMM, fragments: dict[str, str], panel: PanelLayout | None = None
+) -> bytes:
+    with tracer.span("svg compose", layers=len(fragments)):
+        return _compose_board_svg(side, bounds, fragments, panel)
+
+
+def _compose_board_svg(side: Side, bounds: BoundsMM, fragments: dict[str, str], panel: PanelLayout | None) -> bytes:
+    # A panel writes the board once and places it with <use> per instance.
+    view = bounds if panel is None else panel.bounds(bounds)
+    width = view.width
+    height = view.height
 
     if side == Side.TOP:
-        outline = gerber_set.outline
-        copper = gerber_set.gtl
-        soldermask = gerber_set.gts
-        silkscreen = gerber_set.gto
+        transform = f'scale(1,-1) translate(0,{-(view.ymin + view.ymax)})'
     else:
-        outline = gerber_set.outline
-        copper = gerber_set.gbl
-        soldermask = gerber_set.gbs
-        silkscreen = gerber_set.gbo
+        center_x = view.xmin + width / 2
+        transform = f'scale(-1,-1) translate({-2 * center_x},{-(view.ymin + view.ymax)})'
 
-    if side == Side.TOP:
-        transform = f'scale(1,-1) translate(0,{-(bounds.ymin + bounds.ymax)})'
+    namespaces = 'xmlns="http://www.w3.org/2000/svg"'
+    if panel is None:
+        board_group = f'<g transform="{transform}">'
     else:
-        center_x = bounds.xmin + width / 2
-        transform = f'scale(-1,-1) translate({-2 * center_x},{-(bounds.ymin + bounds.ymax)})'
+        namespaces += ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+        board_group = '<defs><g id="board">'
 
     svg_parts = [
         f'<?xml version="1.0" encoding="utf-8"?>',
         f'<svg width="{width}mm" height="{height}mm" '
-        f'viewBox="{bounds.xmin} {bounds.ymin} {width} {height}" '
+        f'viewBox="{view.xmin} {view.ymin} {width} {height}" '
         f'style="background-color:#1a1a1a" '
-        f'xmlns="http://www.w3.org/2000/svg">',
-        f'<g transform="{transform}">'
+        f'{namespaces}>',
+        board_group
     ]
 
-    if outline and outline.exists():
-        svg_parts.append(_render_layer(outline, "#1a3d1a"))
+    def add_pass(role: str, color: str, extra: str = ''):
+        svg_parts.append(f'<g color="{color}"{extra}>')
+        svg_parts.append(fragments[role])
+        svg_parts.append('</g>')
+
+    if "outline" in fragments:
+        add_pass("outline", LAYER_COLORS["outline"])
 
-    if copper and copper.exists():
-        svg_parts.append(_render_layer(copper, "#b87333"))
+    if "copper" in fragments:
+        add_pass("copper", LAYER_COLORS["copper"])
 
-    if soldermask and soldermask.exists():
-        svg_parts.append(f'<g opacity="0.85">')
-        svg_parts.append(_render_layer(soldermask, "#1a5f1a"))
-        svg_parts.append('</g>')
+    if "soldermask" in fragments:
+        # Both soldermask passes share one rendering; only the colour of the group differs.
+        add_pass("soldermask", LAYER_COLORS["soldermask"], ' opacity="0.85"')
+        add_pass("soldermask", SOLDERMASK_OPENING_COLOR)
 
-    if soldermask and soldermask.exists():
-        svg_parts.append(_render_layer(soldermask, "#d4af37"))
+    if "silkscreen" in fragments:
+        add_pass("silkscreen", LAYER_COLORS["silkscreen"])
 
-    if silkscreen and silkscreen.exists():
-        svg_parts.append(_render_layer(silkscreen, "#ffffff"))
+    if "drill" in fragments:
+        add_pass("drill", LAYER_COLORS["drill"])
 
     svg_parts.append('</g>')
+    if panel is not None:
+        svg_parts.append('</defs>')
+        svg_parts.append(f'<g transform="{transform}">')
+        for (a, b, tx), (c, d, ty) in panel.transforms(bounds).tolist():
+            svg_parts.append(f'<use xlink:href="#board" transform="matrix({a},{c},{b},{d},{tx},{ty})"/>')
+        svg_parts.append('</g>')
     svg_parts.append('</svg>')
     return '\n'.join(svg_parts).encode('utf-8')
 
 
-def _render_layer(layer_path: Path, color: str) -> str:
-    try:
-        gf = GerberFile.open(layer_path)
-        svg_objects = list(gf.svg_objects(fg=color, bg='none'))
-        return '\n'.join(str(obj) for obj in svg_objects)
-    except Exception as e:
-        print(f"Error rendering {layer_path}: {e}")
-        return ''
+def render_layer_svg(layer_path: LayerFile, color: str = "currentColor") -> str:
+    with tracer.span("svg layer", file=layer_path.name) as span:
+        try:
+            with tracer.span("parse", file=layer_path.name) as parse_span:
+                gf = layer_registry.open(layer_path)
+                parse_span.set(objects=len(gf.objects))
+            svg_objects = list(gf.svg_objects(fg=color, bg='none'))
+            svg = '\n'.join(str(obj) for obj in svg_objects)
+            span.set(svg_objects=len(svg_objects), chars=len(svg))
+            return svg
+        except Exception as e:
+            span.set(error=str(e) or type(e).__name__)
+            return ''
+
+
+def load_layer(layer_path: LayerFile, trace: bool = False) -> LoadedLayer:
+    """Parse one layer and flatten it to drawable geometry; runs in a worker process.
+
+    With ``trace`` set, the layer's spans are collected and travel back with
+    the result. A layer that fails to parse comes back empty, with the
+    reason in ``error``.
+    """
+    error = None
+    with tracer.collect(trace) as spans, tracer.span("load layer", file=layer_path.name) as span:
+        try:
+            geometry = load_layer_geometry(layer_path)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            span.set(error=error)
+            geometry = LayerGeometry()
+        span.set(primitives=geometry.primitive_count)
+    return LoadedLayer(path=layer_path, geometry=geometry, spans=spans, error=error)
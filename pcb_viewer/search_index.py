@@ -0,0 +1,196 @@
+import re
+from collections import defaultdict
+
+import numpy as np
+
+from .component_store import ComponentStore
+
+_TOKEN_RE = re.compile(r"[^\s,;/|]+")
+# Letter runs and numbers within a token, so "c_0402_1005metric" and "c0402" also index "0402".
+_SUBTOKEN_RE = re.compile(r"[^\W\d_]+|\d+(?:\.\d+)?")
+_DESIGNATOR_RE = re.compile(r"^([A-Za-z_]*)(\d+)$")
+_RANGE_RE = re.compile(r"^([A-Za-z_]+)(\d+)-(?:([A-Za-z_]+))?(\d+)$")
+# Sorts after every character that can appear in a token, closing a prefix range.
+_PREFIX_END = "\U0010ffff"
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _index_terms(value: str) -> set[str]:
+    """Everything a query word may be a prefix of: the whole value, its words and their parts."""
+    terms = {value.lower().strip()}
+    for token in _tokens(value):
+        terms.add(token)
+        terms.update(_SUBTOKEN_RE.findall(token))
+    terms.discard("")
+    return terms
+
+
+class _Postings:
+    """Rows grouped by category code, so a set of codes expands to rows without a scan."""
+
+    def __init__(self, codes: np.ndarray, category_count: int):
+        order = np.argsort(codes, kind="stable")
+        self.codes = codes
+        self.category_count = category_count
+        self._rows = order.astype(np.intp)
+        self._starts = np.searchsorted(codes[order], np.arange(category_count + 1))
+
+    def count(self, codes) -> int:
+        return int(sum(self._starts[c + 1] - self._starts[c] for c in codes))
+
+    def rows(self, codes) -> list[np.ndarray]:
+        return [self._rows[self._starts[c]:self._starts[c + 1]] for c in codes]
+
+
+class _TermMatch:
+    """Rows matched by one query term, as designator spans plus category codes per field."""
+
+    def __init__(self, index: "SearchIndex"):
+        self._index = index
+        self.designator_span: tuple[int, int] = (0, 0)
+        self.designator_rows: np.ndarray | None = None
+        self.field_codes: dict[int, set[int]] = {}
+
+    def count(self) -> int:
+        """Upper bound on the number of matching rows, without touching them."""
+        if self.designator_rows is not None:
+            total = len(self.designator_rows)
+        else:
+            total = self.designator_span[1] - self.designator_span[0]
+        for field, codes in self.field_codes.items():
+            total += self._index._postings[field].count(codes)
+        return total
+
+    def rows(self) -> np.ndarray:
+        index = self._index
+        if self.designator_rows is not None:
+            parts = [self.designator_rows]
+        else:
+            start, end = self.designator_span
+            parts = [index._designator_order[start:end]]
+        for field, codes in self.field_codes.items():
+            parts.extend(index._postings[field].rows(codes))
+        # A row can match through several fields; a mask dedupes and sorts in one pass.
+        mask = np.zeros(index._row_count, dtype=bool)
+        for part in parts:
+            mask[part] = True
+        return np.flatnonzero(mask)
+
+    def contains(self, rows: np.ndarray) -> np.ndarray:
+        index = self._index
+        if self.designator_rows is not None:
+            keep = np.isin(rows, self.designator_rows)
+        else:
+            start, end = self.designator_span
+            position = index._designator_position[rows]
+            keep = (position >= start) & (position < end)
+        for field, codes in self.field_codes.items():
+            postings = index._postings[field]
+            lookup = np.zeros(postings.category_count, dtype=bool)
+            lookup[list(codes)] = True
+            keep |= lookup[postings.codes[rows]]
+        return keep
+
+
+class SearchIndex:
+    """Prefix and designator-range lookups over a component store, built once per load.
+
+    Designators are kept as a sorted array for prefix searches and, split into
+    letter prefix and number, per prefix for ``R10-R40`` style ranges. Value,
+    footprint and description are tokenised once per distinct string, down to
+    the letter and digit runs inside each word; each token maps to category
+    codes and each code to its rows.
+    """
+
+    def __init__(self, store: ComponentStore):
+        lowered = np.array([d.lower() for d in store.designators], dtype=object)
+        self._designator_order = np.argsort(lowered, kind="stable").astype(np.intp)
+        self._sorted_designators = lowered[self._designator_order].astype(str)
+        self._designator_position = np.empty(len(lowered), dtype=np.intp)
+        self._designator_position[self._designator_order] = np.arange(len(lowered))
+
+        numbered: dict[str, tuple[list[int], list[int]]] = defaultdict(lambda: ([], []))
+        for row, designator in enumerate(lowered):
+            match = _DESIGNATOR_RE.match(designator)
+            if match:
+                numbers, rows = numbered[match.group(1)]
+                numbers.append(int(match.group(2)))
+                rows.append(row)
+        self._numbered: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for prefix, (numbers, rows) in numbered.items():
+            numbers = np.array(numbers, dtype=np.int64)
+            order = np.argsort(numbers, kind="stable")
+            self._numbered[prefix] = (numbers[order], np.array(rows, dtype=np.intp)[order])
+
+        # token -> [(postings, category codes)], over the categorical columns.
+        fields = [
+            (store.comments, store.comment_codes),
+            (store.footprints, store.footprint_codes),
+            (store.descriptions, store.description_codes),
+        ]
+        token_codes: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self._postings: list[_Postings] = []
+        for field, (values, codes) in enumerate(fields):
+            self._postings.append(_Postings(codes, len(values)))
+            for code, value in enumerate(values):
+                for token in _index_terms(value):
+                    token_codes[token].append((field, code))
+
+        self._tokens = np.array(sorted(token_codes), dtype=str)
+        self._token_codes = [token_codes[t] for t in self._tokens]
+        self._row_count = len(store)
+
+    def _prefix_range(self, sorted_values: np.ndarray, prefix: str) -> tuple[int, int]:
+        start = np.searchsorted(sorted_values, prefix, side="left")
+        end = np.searchsorted(sorted_values, prefix + _PREFIX_END, side="left")
+        return int(start), int(end)
+
+    def _designator_range(self, prefix: str, low: int, high: int) -> np.ndarray:
+        entry = self._numbered.get(prefix)
+        if entry is None:
+            return np.empty(0, dtype=np.intp)
+        numbers, rows = entry
+        if low > high:
+            low, high = high, low
+        start = np.searchsorted(numbers, low, side="left")
+        end = np.searchsorted(numbers, high, side="right")
+        return rows[start:end]
+
+    def _match_term(self, term: str) -> _TermMatch:
+        match = _TermMatch(self)
+
+        designator_range = _RANGE_RE.match(term)
+        if designator_range and designator_range.group(3) in (None, designator_range.group(1)):
+            prefix, low, high = designator_range.group(1), int(designator_range.group(2)), int(designator_range.group(4))
+            match.designator_rows = self._designator_range(prefix, low, high)
+            return match
+
+        match.designator_span = self._prefix_range(self._sorted_designators, term)
+        start, end = self._prefix_range(self._tokens, term)
+        for entries in self._token_codes[start:end]:
+            for field, code in entries:
+                match.field_codes.setdefault(field, set()).add(code)
+        return match
+
+    def search(self, query: str) -> np.ndarray | None:
+        """Sorted store rows matching every whitespace-separated term, or None for an empty query.
+
+        Each term is a designator range or a prefix of a designator or of a
+        word in the value, footprint or description, or of a letter or digit
+        run inside such a word (``0402`` finds ``C_0402_1005Metric``). Only the rows of the most
+        selective term are materialised; the others are checked against them.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return None
+
+        matches = sorted((self._match_term(term) for term in terms), key=lambda m: m.count())
+        rows = matches[0].rows()
+        for match in matches[1:]:
+            if len(rows) == 0:
+                break
+            rows = rows[match.contains(rows)]
+        return rows
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+TARGET_POINTS_PER_CELL = 4
+
+
+class GridIndex:
+    """Uniform grid over 2D points for nearest-point and rectangle queries.
+
+    Points are bucketed by cell and stored cell by cell, so a row of cells is
+    one contiguous slice. ``rows`` carries an id per point (component store
+    rows here) which is what queries return.
+    """
+
+    def __init__(self, xy: np.ndarray, rows: np.ndarray, cell_size: float | None = None):
+        valid = ~np.isnan(xy).any(axis=1)
+        xy = xy[valid]
+        rows = rows[valid]
+        self._count = len(rows)
+
+        if self._count == 0:
+            self._origin = (0.0, 0.0)
+            self._cell = 1.0
+            self._nx = self._ny = 1
+            self._xy = np.empty((0, 2))
+            self._rows = np.empty(0, dtype=np.intp)
+            self._starts = np.zeros(2, dtype=np.intp)
+            return
+
+        lo = xy.min(axis=0)
+        hi = xy.max(axis=0)
+        extent = np.maximum(hi - lo, 1e-9)
+        if cell_size is None:
+            area = float(extent[0] * extent[1])
+            cell_size = math.sqrt(area * TARGET_POINTS_PER_CELL / self._count) if area > 0 else float(extent.max())
+        cell_size = max(cell_size, float(extent.max()) / 4096, 1e-9)
+
+        self._origin = (float(lo[0]), float(lo[1]))
+        self._cell = cell_size
+        self._nx = int(extent[0] // cell_size) + 1
+        self._ny = int(extent[1] // cell_size) + 1
+
+        cx = ((xy[:, 0] - lo[0]) // cell_size).astype(np.intp)
+        cy = ((xy[:, 1] - lo[1]) // cell_size).astype(np.intp)
+        keys = cy * self._nx + cx
+        order = np.argsort(keys, kind="stable")
+
+        self._xy = xy[order]
+        self._rows = rows[order]
+        self._starts = np.searchsorted(keys[order], np.arange(self._nx * self._ny + 1))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float) -> tuple[int, int, int, int]:
+        ox, oy = self._origin
+        cx0 = max(0, int((x0 - ox) // self._cell))
+        cy0 = max(0, int((y0 - oy) // self._cell))
+        cx1 = min(self._nx - 1, int((x1 - ox) // self._cell))
+        cy1 = min(self._ny - 1, int((y1 - oy) // self._cell))
+        return cx0, cy0, cx1, cy1
+
+    def _candidates(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        cx0, cy0, cx1, cy1 = self._cell_range(x0, y0, x1, y1)
+        if cx0 > cx1 or cy0 > cy1:
+            return np.empty(0, dtype=np.intp)
+
+        slices = []
+        for cy in range(cy0, cy1 + 1):
+            base = cy * self._nx
+            start, end = self._starts[base + cx0], self._starts[base + cx1 + 1]
+            if start < end:
+                slices.append(np.arange(start, end))
+        if not slices:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(slices)
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Rows of every point inside the rectangle, edges included."""
+        candidates = self._candidates(x0, y0, x1, y1)
+        xy = self._xy[candidates]
+        inside = (xy[:, 0] >= x0) & (xy[:, 0] <= x1) & (xy[:, 1] >= y0) & (xy[:, 1] <= y1)
+        return self._rows[candidates[inside]]
+
+    def nearest(self, x: float, y: float, max_distance: float) -> int | None:
+        """Row of the closest point within ``max_distance``, or None."""
+        candidates = self._candidates(x - max_distance, y - max_distance, x + max_distance, y + max_distance)
+        if len(candidates) == 0:
+            return None
+
+        xy = self._xy[candidates]
+        d2 = (xy[:, 0] - x) ** 2 + (xy[:, 1] - y) ** 2
+        best = int(np.argmin(d2))
+        if d2[best] > max_distance * max_distance:
+            return None
+        return int(self._rows[candidates[best]])
@@ -0,0 +1,207 @@
+import itertools
+import math
+import queue
+from collections import OrderedDict
+from typing import Callable
+
+from PySide6.QtCore import Qt, QObject, QRectF, QRunnable, QThread, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPainter
+
+TILE_SIZE = 256
+MIN_LEVEL = -4
+MAX_LEVEL = 8
+DEFAULT_TILE_CACHE_BYTES = 256 * 1024 * 1024
+
+# (source id, level, tile x, tile y). A level-n tile covers TILE_SIZE / 2**n
+# item units, so each level doubles the resolution of the one below it.
+TileKey = tuple[int, int, int, int]
+
+_source_ids = itertools.count(1)
+
+
+def new_source_id() -> int:
+    return next(_source_ids)
+
+
+def tile_level(pixels_per_unit: float) -> int:
+    if pixels_per_unit <= 0:
+        return MIN_LEVEL
+    return max(MIN_LEVEL, min(MAX_LEVEL, math.ceil(math.log2(pixels_per_unit))))
+
+
+def tile_span(level: int) -> float:
+    return TILE_SIZE / 2.0 ** level
+
+
+def tile_rect(level: int, tx: int, ty: int) -> QRectF:
+    span = tile_span(level)
+    return QRectF(tx * span, ty * span, span, span)
+
+
+def tile_range(rect: QRectF, level: int) -> tuple[int, int, int, int]:
+    span = tile_span(level)
+    return (
+        math.floor(rect.left() / span),
+        math.floor(rect.top() / span),
+        math.floor(rect.right() / span),
+        math.floor(rect.bottom() / span),
+    )
+
+
+class TileCache:
+    def __init__(self, max_bytes: int = DEFAULT_TILE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._tiles: OrderedDict[TileKey, QImage] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: TileKey) -> QImage | None:
+        image = self._tiles.get(key)
+        if image is not None:
+            self._tiles.move_to_end(key)
+        return image
+
+    def put(self, key: TileKey, image: QImage):
+        old = self._tiles.pop(key, None)
+        if old is not None:
+            self._bytes -= old.sizeInBytes()
+        self._tiles[key] = image
+        self._bytes += image.sizeInBytes()
+
+        while self._bytes > self.max_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self._bytes -= evicted.sizeInBytes()
+
+    def source_bytes(self, source_ids: set[int]) -> int:
+        """Bytes held by the cached tiles of the given sources."""
+        return sum(image.sizeInBytes() for key, image in self._tiles.items() if key[0] in source_ids)
+
+    def discard_source(self, source_id: int):
+        for key in [k for k in self._tiles if k[0] == source_id]:
+            self._bytes -= self._tiles.pop(key).sizeInBytes()
+
+    def clear(self):
+        self._tiles.clear()
+        self._bytes = 0
+
+
+tile_cache = TileCache()
+
+
+class _TileJob(QRunnable):
+    def __init__(self, renderer: "TileRenderer", key: TileKey, draw: Callable[[QPainter], None]):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self._renderer = renderer
+        self._draw = draw
+
+    def run(self):
+        _, level, tx, ty = self.key
+        rect = tile_rect(level, tx, ty)
+        scale = 2.0 ** level
+
+        image = QImage(TILE_SIZE, TILE_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.scale(scale, scale)
+        painter.translate(-rect.x(), -rect.y())
+        self._draw(painter)
+        painter.end()
+
+        self._renderer._job_finished(self.key, image)
+
+
+class TileRenderer(QObject):
+    _results_ready = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+        self._pending: dict[TileKey, tuple[_TileJob, list[Callable[[TileKey], None]]]] = {}
+        self._results: queue.SimpleQueue[tuple[TileKey, QImage]] = queue.SimpleQueue()
+        self._results_ready.connect(self._collect_results)
+
+    def request(
+        self,
+        key: TileKey,
+        draw: Callable[[QPainter], None],
+        on_ready: Callable[[TileKey], None],
+        priority: int = 0,
+    ):
+        """Queue a tile; ``on_ready`` runs on the GUI thread once it is in the cache.
+
+        Requesting a tile that is already queued only adds ``on_ready`` to the
+        callbacks it notifies.
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            if on_ready not in pending[1]:
+                pending[1].append(on_ready)
+            return
+        job = _TileJob(self, key, draw)
+        self._pending[key] = (job, [on_ready])
+        self._pool.start(job, priority)
+
+    def is_pending(self, key: TileKey) -> bool:
+        return key in self._pending
+
+    def cancel_where(self, predicate: Callable[[TileKey], bool]):
+        """Drop the matching requests; tiles already rendering finish but are thrown away."""
+        for key, (job, _) in list(self._pending.items()):
+            if predicate(key):
+                self._pool.tryTake(job)
+                del self._pending[key]
+
+    def wait_for_done(self):
+        """Block until every requested tile is rendered and handed to its item."""
+        self._pool.waitForDone()
+        self._collect_results()
+
+    def shutdown(self):
+        """Drop queued tiles and wait for the ones already rendering."""
+        self._pool.clear()
+        self._pending.clear()
+        self._pool.waitForDone()
+
+    def _job_finished(self, key: TileKey, image: QImage):
+        # Called on a pool thread; hand the tile to the GUI thread.
+        self._results.put((key, image))
+        try:
+            self._results_ready.emit()
+        except RuntimeError:
+            # The renderer went away during application shutdown.
+            pass
+
+    def _collect_results(self):
+        while True:
+            try:
+                key, image = self._results.get_nowait()
+            except queue.Empty:
+                return
+            entry = self._pending.pop(key, None)
+            if entry is None:
+                # Cancelled or shut down while rendering; caching it would only evict live tiles.
+                continue
+            tile_cache.put(key, image)
+            for on_ready in entry[1]:
+                try:
+                    on_ready(key)
+                except RuntimeError:
+                    # The requesting item was deleted while the tile rendered.
+                    pass
+
+
+_tile_renderer: TileRenderer | None = None
+
+
+def tile_renderer() -> TileRenderer:
+    global _tile_renderer
+    if _tile_renderer is None:
+        _tile_renderer = TileRenderer()
+    return _tile_renderer
@@ -0,0 +1,121 @@
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QCheckBox,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QFileDialog,
+    QMessageBox,
+)
+
+from .tracing import Span, tracer
+
+# Rebuilding the tree is coalesced so a burst of spans costs one refresh.
+REFRESH_DELAY_MS = 100
+# Levels of the tree that start out expanded.
+EXPANDED_DEPTH = 2
+
+
+def _format_args(span: Span) -> str:
+    return ", ".join(f"{key}={value}" for key, value in span.args.items() if key != "file")
+
+
+class TimingPanel(QWidget):
+    """Recorded spans as a tree of stages, with wall time and share of the parent stage."""
+
+    COLUMNS = ["Stage", "Time (ms)", "Share", "File", "Details"]
+
+    _spans_changed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        buttons = QHBoxLayout()
+        self._record_check = QCheckBox("Record Timings")
+        self._record_check.setChecked(tracer.enabled)
+        self._record_check.toggled.connect(self._on_record_toggled)
+        buttons.addWidget(self._record_check)
+        buttons.addStretch(1)
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(tracer.clear)
+        buttons.addWidget(clear_btn)
+        export_btn = QPushButton("Export Trace...")
+        export_btn.setToolTip("Save as Chrome trace-event JSON, for chrome://tracing or ui.perfetto.dev")
+        export_btn.clicked.connect(self._on_export)
+        buttons.addWidget(export_btn)
+        layout.addLayout(buttons)
+
+        self._tree = QTreeWidget()
+        self._tree.setColumnCount(len(self.COLUMNS))
+        self._tree.setHeaderLabels(self.COLUMNS)
+        self._tree.setUniformRowHeights(True)
+        layout.addWidget(self._tree)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        # Spans can end on any thread; the signal brings the refresh to this one.
+        self._spans_changed.connect(self._refresh_timer.start)
+        tracer.add_listener(self._on_spans_changed)
+
+    def _on_spans_changed(self):
+        try:
+            self._spans_changed.emit()
+        except RuntimeError:
+            # The panel went away during application shutdown.
+            pass
+
+    def _on_record_toggled(self, checked: bool):
+        tracer.enabled = checked
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        self._tree.clear()
+        items: dict[int, QTreeWidgetItem] = {}
+        for span in sorted(tracer.spans, key=lambda span: span.start_ns):
+            parent_item = items.get(id(span.parent)) if span.parent is not None else None
+            item = QTreeWidgetItem(parent_item or self._tree)
+            item.setText(0, span.name)
+            duration = span.duration_ms
+            item.setText(1, "…" if duration is None else f"{duration:.1f}")
+            item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            parent_duration = span.parent.duration_ms if span.parent is not None else None
+            if duration is not None and parent_duration:
+                item.setText(2, f"{duration / parent_duration:.0%}")
+                item.setTextAlignment(2, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            item.setText(3, str(span.args.get("file", "")))
+            item.setText(4, _format_args(span))
+            items[id(span)] = item
+
+        def expand(item: QTreeWidgetItem, depth: int):
+            item.setExpanded(True)
+            if depth + 1 < EXPANDED_DEPTH:
+                for i in range(item.childCount()):
+                    expand(item.child(i), depth + 1)
+
+        for i in range(self._tree.topLevelItemCount()):
+            expand(self._tree.topLevelItem(i), 0)
+        for column in range(len(self.COLUMNS) - 1):
+            self._tree.resizeColumnToContents(column)
+
+    def _on_export(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "trace.json", "Trace Files (*.json);;All Files (*)"
+        )
+        if not file_path:
+            return
+        try:
+            tracer.write_chrome_trace(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to export trace: {e}")
@@ -0,0 +1,208 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+
+@dataclass(eq=False)
+class Span:
+    """One timed stage; ``args`` carries the file involved and object counts."""
+    name: str
+    args: dict = field(default_factory=dict)
+    parent: "Span | None" = None
+    start_ns: int = 0
+    end_ns: int | None = None
+    pid: int = 0
+    tid: int = 0
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def finish(self):
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+            tracer._finished(self)
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, *exc_info):
+        stack = tracer._stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        self.finish()
+
+
+class _NullSpan:
+    """Stands in for a span while tracing is off, so call sites need no checks."""
+
+    def set(self, **args):
+        pass
+
+    def finish(self):
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _ThreadState(threading.local):
+    def __init__(self):
+        self.stack: list[Span] = []
+        self.collected: list[Span] | None = None
+        self.muted = False
+
+
+class Tracer:
+    """Records spans while enabled; while disabled every span is :data:`NULL_SPAN`.
+
+    ``span()`` nests under the innermost open span of the calling thread.
+    ``start_span()`` is for stages that end in a later callback and takes its
+    parent explicitly; ``within()`` resumes nesting under such a span. Worker processes wrap their work in ``collect()`` and
+    return the spans, which the caller adds with ``extend()``; the caller tells them whether it is tracing.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._spans: list[Span] = []
+        self._local = _ThreadState()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def spans(self) -> list[Span]:
+        return list(self._spans)
+
+    def _stack(self) -> list[Span]:
+        return self._local.stack
+
+    def _target(self) -> list[Span] | None:
+        if self._local.muted:
+            return None
+        collected = self._local.collected
+        if collected is not None:
+            return collected
+        return self._spans if self.enabled else None
+
+    def start_span(self, name: str, parent: "Span | _NullSpan | None" = None, **args) -> Span | _NullSpan:
+        target = self._target()
+        if target is None:
+            return NULL_SPAN
+        if not isinstance(parent, Span):
+            stack = self._stack()
+            parent = stack[-1] if stack else None
+        span = Span(name, args, parent, time.perf_counter_ns(), None, os.getpid(), threading.get_native_id())
+        target.append(span)
+        return span
+
+    def span(self, name: str, **args) -> Span | _NullSpan:
+        """A span for a ``with`` block; spans opened inside it become its children."""
+        span = self.start_span(name, **args)
+        if span is not NULL_SPAN:
+            self._stack().append(span)
+        return span
+
+    @contextmanager
+    def within(self, span: "Span | _NullSpan | None") -> Iterator[None]:
+        """Nest the block's spans under ``span``, typically one started in an earlier callback."""
+        if not isinstance(span, Span):
+            yield
+            return
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield
+        finally:
+            if stack and stack[-1] is span:
+                stack.pop()
+
+    @contextmanager
+    def collect(self, enabled: bool = True) -> Iterator[list[Span]]:
+        """Record the spans of the block into the yielded list, whether or not tracing is on here.
+
+        With ``enabled`` false nothing in the block is recorded and the list stays empty.
+        """
+        saved = self._local.collected, self._local.stack, self._local.muted
+        spans: list[Span] = []
+        self._local.collected, self._local.stack, self._local.muted = spans, [], not enabled
+        try:
+            yield spans
+        finally:
+            self._local.collected, self._local.stack, self._local.muted = saved
+
+    def extend(self, spans: list[Span], parent: Span | _NullSpan | None = None):
+        """Add spans recorded elsewhere, hanging their roots under ``parent``."""
+        target = self._target()
+        if target is None or not spans:
+            return
+        for span in spans:
+            if span.parent is None and isinstance(parent, Span):
+                span.parent = parent
+        target.extend(spans)
+        self._notify()
+
+    def clear(self):
+        self._spans.clear()
+        self._notify()
+
+    def add_listener(self, callback: Callable[[], None]):
+        """``callback`` runs, on the finishing thread, whenever a recorded span ends."""
+        self._listeners.append(callback)
+
+    def _finished(self, span: Span):
+        if self._local.collected is None:
+            self._notify()
+
+    def _notify(self):
+        for callback in self._listeners:
+            callback()
+
+    def chrome_trace(self) -> dict:
+        """Finished spans as Chrome trace-event JSON (``chrome://tracing``, Perfetto)."""
+        spans = [span for span in self._spans if span.end_ns is not None]
+        origin = min((span.start_ns for span in spans), default=0)
+        gui_pid = os.getpid()
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "pcb-viewer" if pid == gui_pid else f"worker {pid}"},
+            }
+            for pid in sorted({span.pid for span in spans})
+        ]
+        for span in spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "pcb-viewer",
+                    "ph": "X",
+                    "ts": (span.start_ns - origin) / 1e3,
+                    "dur": (span.end_ns - span.start_ns) / 1e3,
+                    "pid": span.pid,
+                    "tid": span.tid,
+                    "args": {key: str(value) if isinstance(value, Path) else value for key, value in span.args.items()},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path):
+        Path(path).write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+tracer = Tracer()
@@ -0,0 +1,35 @@
+from array import array
+
+import numpy as np
+
+from pcb_viewer.board_session import BoardSession, SessionCache, estimate_bytes
+
+
+def test_estimate_bytes_counts_shared_data_once():
+    values = np.zeros(1000)
+    coords = array("d", [0.0] * 100)
+    assert estimate_bytes(values) == 8000
+    assert estimate_bytes([values, (values, coords)], coords) == 8000 + 800
+
+
+def test_enforce_budget_evicts_least_recently_viewed_first():
+    cache = SessionCache(budget_bytes=250)
+    sessions = [BoardSession(gerber_source=f"board{i}", memory_bytes=100) for i in range(3)]
+    for session in sessions:
+        cache.add(session)
+    cache.touch(sessions[0])
+
+    evicted = cache.enforce_budget(keep=sessions[0])
+
+    assert evicted == [sessions[1]]
+    assert sessions[1].memory_bytes == 0 and not sessions[1].resident
+    assert sessions[1].gerber_source == "board1"
+    assert cache.total_bytes == 200
+
+
+def test_enforce_budget_keeps_the_board_on_screen():
+    cache = SessionCache(budget_bytes=10)
+    current = BoardSession(memory_bytes=100)
+    cache.add(current)
+    assert cache.enforce_budget(keep=current) == []
+    assert current.memory_bytes == 100
@@ -0,0 +1,115 @@
+import pytest
+from gerbonara import GerberFile
+
+from pcb_viewer.gerber_bounds import UnsupportedGerber, scan_gerber_bounds
+
+SAMPLES = {
+    "lines_mm": """\
+%FSLAX46Y46*%
+%MOMM*%
+%ADD10C,0.250000*%
+%ADD11C,1.000000*%
+G01*
+D10*
+X1000000Y2000000D02*
+X15000000Y2000000D01*
+X15000000Y12500000D01*
+D11*
+X-2500000Y7000000D02*
+X4000000Y-1500000D01*
+M02*
+""",
+    "flashes_inch": """\
+%FSLAX25Y25*%
+%MOIN*%
+%ADD10R,0.06000X0.04000*%
+%ADD11O,0.05000X0.12000*%
+%ADD12P,0.08000X6*%
+%ADD13C,0.03000*%
+D10*
+X100000Y100000D03*
+D11*
+X250000Y50000D03*
+D12*
+X-20000Y180000D03*
+D13*
+X300000Y300000D03*
+M02*
+""",
+    "trailing_zeros": """\
+%FSTAX34Y34*%
+%MOMM*%
+%ADD10C,0.2*%
+D10*
+X0125Y0375D02*
+X0405Y-0021D01*
+M02*
+""",
+    "arcs": """\
+%FSLAX46Y46*%
+%MOMM*%
+%ADD10C,0.200000*%
+G75*
+D10*
+X10000000Y0D02*
+G03X0Y10000000I-10000000J0D01*
+G02X-7071068Y-7071068I0J-10000000D01*
+X20000000Y5000000D02*
+G02X20000000Y5000000I3000000J0D01*
+M02*
+""",
+    "region_and_clear": """\
+%FSLAX46Y46*%
+%MOMM*%
+%ADD10C,0.500000*%
+%ADD11R,2.000000X2.000000*%
+G01*
+G75*
+G36*
+X0Y0D02*
+X20000000Y0D01*
+G03X20000000Y10000000I0J5000000D01*
+G01X0Y10000000D01*
+X0Y0D01*
+G37*
+%LPC*%
+D11*
+X30000000Y-4000000D03*
+%LPD*%
+D10*
+X5000000Y5000000D02*
+X8000000Y6000000D01*
+M02*
+""",
+}
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_scan_matches_gerbonara(tmp_path, name):
+    path = tmp_path / f"{name}.gbr"
+    path.write_text(SAMPLES[name])
+
+    (xmin, ymin), (xmax, ymax) = GerberFile.open(path).bounding_box()
+    assert scan_gerber_bounds(path) == pytest.approx((xmin, ymin, xmax, ymax), abs=1e-6)
+
+
+def test_scan_empty_file(tmp_path):
+    path = tmp_path / "empty.gbr"
+    path.write_text("%FSLAX46Y46*%\n%MOMM*%\nM02*\n")
+    assert scan_gerber_bounds(path) is None
+
+
+def test_scan_rejects_aperture_macros(tmp_path):
+    path = tmp_path / "macro.gbr"
+    path.write_text("""\
+%FSLAX46Y46*%
+%MOMM*%
+%AMTHERMAL*
+7,0,0,1.0,0.8,0.1,0*%
+%ADD10THERMAL*%
+D10*
+X0Y0D03*
+M02*
+""")
+    with pytest.raises(UnsupportedGerber):
+        scan_gerber_bounds(path)
@@ -0,0 +1,88 @@
+import zipfile
+
+import pytest
+
+from pcb_viewer.gerber_loader import ArchiveMember, classify_layer, discover_gerbers
+from pcb_viewer.render_board import load_layer
+
+GERBER = """\
+%FSLAX46Y46*%
+%MOMM*%
+%ADD10C,0.250000*%
+D10*
+X0Y0D02*
+X10000000Y5000000D01*
+M02*
+"""
+EXCELLON = """\
+M48
+METRIC,TZ
+T1C0.800
+%
+T1
+X10.0Y10.0
+M30
+"""
+
+
+@pytest.mark.parametrize(
+    "name, head, layer",
+    [
+        ("board.GTL", GERBER, "gtl"),
+        ("board.gm1", GERBER, "outline"),
+        ("board.sol", GERBER, "gbl"),
+        ("board-F_Cu.gbr", GERBER, "gtl"),
+        ("board-B_Silkscreen.gbr", GERBER, "gbo"),
+        ("board-Edge_Cuts.gbr", GERBER, "outline"),
+        ("solderpaste_bottom.gbr", GERBER, "gbp"),
+        ("anything.gbr", "%TF.FileFunction,Soldermask,Bot*%\n" + GERBER, "gbs"),
+        ("board-F_Cu.gbr", "G04 #@! TF.FileFunction,Copper,L4,Bot*\n" + GERBER, "gbl"),
+        ("board-PTH.drl", EXCELLON, "drill"),
+        ("drill.txt", EXCELLON, "drill"),
+    ],
+)
+def test_classify_layer(name, head, layer):
+    assert classify_layer(name, head)[0] == layer
+
+
+@pytest.mark.parametrize(
+    "name, head",
+    [
+        ("readme.txt", "Fabrication notes"),
+        ("board-In1_Cu.gbr", "%TF.FileFunction,Copper,L2,Inr*%\n" + GERBER),
+        ("board-F_Fab.gbr", GERBER),
+    ],
+)
+def test_classify_layer_ignores(name, head):
+    assert classify_layer(name, head) is None
+
+
+def test_discover_prefers_ranked_files(tmp_path):
+    (tmp_path / "board.GM1").write_text(GERBER)
+    (tmp_path / "board.GKO").write_text(GERBER)
+    (tmp_path / "board-NPTH.drl").write_text(EXCELLON)
+    (tmp_path / "board-PTH.drl").write_text(EXCELLON)
+    gerbers = discover_gerbers(tmp_path)
+    assert gerbers.outline.name == "board.GM1"
+    assert gerbers.drill.name == "board-PTH.drl"
+
+
+def test_discover_zip_reads_members_in_place(tmp_path):
+    archive = tmp_path / "board.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("gerbers/board-F_Cu.gbr", GERBER)
+        zf.writestr("gerbers/board.drl", EXCELLON)
+        zf.writestr("__MACOSX/gerbers/._board-F_Cu.gbr", "junk")
+
+    gerbers = discover_gerbers(archive)
+    assert gerbers.gtl == ArchiveMember(archive, "gerbers/board-F_Cu.gbr")
+    assert gerbers.drill.name == "board.drl"
+    assert gerbers.gtl.read_text() == GERBER
+    assert gerbers.gtl.stat().st_size == len(GERBER)
+    assert list(tmp_path.iterdir()) == [archive]
+
+
+def test_unreadable_layer_reports_error(tmp_path):
+    result = load_layer(tmp_path / "missing.GTL")
+    assert result.error
+    assert result.geometry.primitive_count == 0
@@ -0,0 +1,64 @@
+from array import array
+
+import numpy as np
+
+from pcb_viewer.layer_geometry import (
+    GeometryRun,
+    LayerGeometry,
+    decimate,
+    merge_circles,
+    simplification_levels,
+    simplify_runs,
+)
+
+
+def _circle(radius: float, count: int) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+    return np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+
+
+def _distance_to_polyline(points: np.ndarray, line: np.ndarray) -> np.ndarray:
+    a, b = line[:-1], line[1:]
+    ab = b - a
+    t = np.clip(((points[:, None] - a) * ab).sum(-1) / (ab * ab).sum(-1), 0, 1)
+    nearest = a + t[..., None] * ab
+    return np.hypot(*(points[:, None] - nearest).transpose(2, 0, 1)).min(axis=1)
+
+
+def test_decimate_stays_within_tolerance():
+    points = _circle(10.0, 2000)
+    ring = np.vstack((points, points[:1]))
+    simplified = decimate(ring, 0.05)
+    assert len(simplified) < len(ring) // 10
+    assert (simplified[0] == ring[0]).all() and (simplified[-1] == ring[-1]).all()
+    assert _distance_to_polyline(ring, simplified).max() <= 0.05
+
+
+def test_merge_circles_covers_merged_flashes_and_drops_specks():
+    circles = array("d", [0.0, 0.0, 0.1, 0.01, 0.0, 0.1, 5.0, 5.0, 0.3, 9.0, 9.0, 0.01])
+    merged = np.frombuffer(merge_circles(circles, 0.05)).reshape(-1, 3)
+    assert len(merged) == 2
+    (x, y, r), big = merged
+    assert r >= 0.1 + np.hypot(x - 0.01, y) - 1e-12
+    assert tuple(big) == (5.0, 5.0, 0.3)
+
+
+def test_simplification_levels_keep_polarity_and_shrink():
+    pour = array("d", _circle(10.0, 4000).ravel().tobytes())
+    specks = array("d", [x for i in range(100) for x in (20.0 + i, 0.0, 0.001)])
+    runs = [
+        GeometryRun(dark=True, polygons=[pour], circles=specks),
+        GeometryRun(dark=False, circles=array("d", [0.0, 0.0, 2.0])),
+    ]
+    geometry = LayerGeometry(runs=runs)
+
+    levels = simplification_levels(geometry)
+    assert levels
+    counts = [sum(run.vertex_count for run in level_runs) for _, level_runs in levels]
+    assert counts == sorted(counts, reverse=True)
+    assert counts[0] < sum(run.vertex_count for run in runs)
+    for _, level_runs in levels:
+        assert [run.dark for run in level_runs] == [True, False]
+
+    coarse = simplify_runs(runs, 0.1)
+    assert len(coarse[0].circles) == 0
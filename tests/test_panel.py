@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pcb_viewer.models import BoundsMM, Side
+from pcb_viewer.panel import PanelLayout, place_points
+from pcb_viewer.render_board import LAYER_COLORS, SOLDERMASK_OPENING_COLOR, compose_board_svg
+
+BOARD = BoundsMM(xmin=10.0, xmax=50.0, ymin=0.0, ymax=20.0)
+
+
+def test_step_and_repeat():
+    panel = PanelLayout(rows=2, columns=3, pitch_x_mm=45.0, pitch_y_mm=25.0)
+    x, y = place_points(panel.transforms(BOARD), np.array([10.0, 50.0]), np.array([0.0, 20.0]))
+    assert x.shape == (6, 2)
+    # Row by row from the original board, which keeps its place.
+    assert x[:, 0].tolist() == [10.0, 55.0, 100.0, 10.0, 55.0, 100.0]
+    assert y[:, 0].tolist() == [0.0, 0.0, 0.0, 25.0, 25.0, 25.0]
+    bounds = panel.bounds(BOARD)
+    assert (bounds.xmin, bounds.xmax, bounds.ymin, bounds.ymax) == (10.0, 140.0, 0.0, 45.0)
+
+
+def test_rotation_turns_each_board_about_its_centre():
+    panel = PanelLayout(rows=1, columns=2, pitch_x_mm=30.0, rotation_deg=90.0)
+    x, y = place_points(panel.transforms(BOARD), np.array([30.0, 50.0]), np.array([10.0, 10.0]))
+    # The centre stays put and the right edge ends up on top.
+    assert x[0] == pytest.approx([30.0, 30.0])
+    assert y[0] == pytest.approx([10.0, 30.0])
+    assert x[1] == pytest.approx([60.0, 60.0])
+    bounds = panel.bounds(BOARD)
+    assert (bounds.xmin, bounds.xmax, bounds.ymin, bounds.ymax) == pytest.approx((20.0, 70.0, -10.0, 30.0))
+
+
+def test_empty_panel_rejected():
+    with pytest.raises(ValueError):
+        PanelLayout(rows=0, columns=4)
+
+
+def test_panel_svg_writes_board_once():
+    panel = PanelLayout(rows=4, columns=6, pitch_x_mm=45.0, pitch_y_mm=25.0)
+    svg = compose_board_svg(Side.TOP, BOARD, {"copper": '<path id="copper"/>'}, panel).decode()
+    assert svg.count('<path id="copper"/>') == 1
+    assert svg.count('<use xlink:href="#board"') == 24
+    assert 'viewBox="10.0 0.0 265.0 95.0"' in svg
+
+
+def test_soldermask_passes_colour_their_groups():
+    svg = compose_board_svg(Side.TOP, BOARD, {"soldermask": '<path fill="currentColor"/>'}).decode()
+    assert svg.count('<path fill="currentColor"/>') == 2
+    assert f'<g color="{LAYER_COLORS["soldermask"]}" opacity="0.85">' in svg
+    assert f'<g color="{SOLDERMASK_OPENING_COLOR}">' in svg
@@ -0,0 +1,119 @@
+import pytest
+
+from pcb_viewer.models import Side
+from pcb_viewer.pickplace import (
+    ColumnMapping,
+    PickPlaceError,
+    UnknownPlacementFormat,
+    iter_pickplace_csv,
+    load_pickplace_store,
+    parse_pickplace_csv,
+    sniff_format,
+)
+
+ALTIUM = """\
+Altium Designer Pick and Place Locations
+Units used in this file: mil
+
+Designator,Comment,Layer,Footprint,Center-X(mil),Center-Y(mil),Rotation,Description
+"C1","100nF","TopLayer","C0603","1000","2000","90","Capacitor"
+"R2","10k","BottomLayer","R0603","100","200","0","Resistor"
+"""
+ALTIUM_MID = """\
+Units used in this file: mm
+
+Designator,Footprint,Mid X,Mid Y,Ref X,Ref Y,Pad X,Pad Y,Layer,Rotation,Comment
+C1,C0603,25.4mm,50.8,0,0,0,0,T,90,100nF
+R2,R0603,100mil,5.08,0,0,0,0,B,0,10k
+"""
+KICAD_POS = """\
+### Footprint positions - created on 2024-01-01 ###
+## Unit = mm, Angle = deg.
+## Side : All
+# Ref     Val       Package    PosX       PosY       Rot  Side
+C1        100nF     C0603     25.4000    50.8000   90.0000  top
+R2        10k       R0603      2.5400     5.0800    0.0000  bottom
+## End
+"""
+KICAD_CSV = """\
+Ref,Val,Package,PosX,PosY,Rot,Side
+"C1","100nF","C0603",25.4,50.8,90.0,top
+"R2","10k","R0603",0.1,0.2,0.0,bottom
+"""
+EAGLE = """\
+C1 25.40 50.80 90 100nF C0603
+R2 2.54 5.08 0 10k R0603
+"""
+GENERIC = """\
+RefDes,Xpos,Ypos,Rot,Value,Side
+C1,1000,2000,90,100nF,Top
+R2,100mil,0.2in,,10k,Bottom
+"""
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+@pytest.mark.parametrize(
+    "name, text, fmt",
+    [
+        ("board.csv", ALTIUM, "Altium CSV"),
+        ("board.csv", ALTIUM_MID, "Altium CSV"),
+        ("board-all.pos", KICAD_POS, "KiCad .pos"),
+        ("board.csv", KICAD_CSV, "KiCad .pos"),
+        ("board.mnt", EAGLE, "Eagle .mnt/.mnb"),
+    ],
+)
+def test_known_formats(tmp_path, name, text, fmt):
+    path = _write(tmp_path, name, text)
+    assert sniff_format(path)[0].name == fmt
+    store = load_pickplace_store(path)
+    assert store.designators.tolist() == ["C1", "R2"]
+    assert store.comment(0) == "100nF"
+    assert store.footprint(0) == "C0603"
+    assert (store.x_mm[0], store.y_mm[0], store.rotation_deg[0]) == pytest.approx((25.4, 50.8, 90.0))
+    # The streaming reader gives the same parts.
+    assert parse_pickplace_csv(path) == [store.component(i) for i in range(len(store))]
+
+
+def test_eagle_bottom_side(tmp_path):
+    path = _write(tmp_path, "board.mnb", EAGLE)
+    assert load_pickplace_store(path).side_mask(Side.BOTTOM).all()
+
+
+def test_generic_csv_needs_mapping(tmp_path):
+    path = _write(tmp_path, "placements.csv", GENERIC)
+    with pytest.raises(UnknownPlacementFormat):
+        sniff_format(path)
+
+    mapping = ColumnMapping.parse("designator=refdes,x=Xpos,y=Ypos,rotation=Rot,comment=Value,side=Side,units=mil")
+    store = load_pickplace_store(path, mapping)
+    assert store.designators.tolist() == ["C1", "R2"]
+    assert store.side_mask(Side.TOP).tolist() == [True, False]
+    # Unit suffixes override the mapped units; a blank rotation is 0.
+    assert store.x_mm.tolist() == pytest.approx([25.4, 2.54])
+    assert store.y_mm.tolist() == pytest.approx([50.8, 5.08])
+    assert store.rotation_deg.tolist() == [90.0, 0.0]
+    assert parse_pickplace_csv(path, mapping) == [store.component(i) for i in range(len(store))]
+
+
+def test_column_mapping_parse_rejects_missing_fields():
+    with pytest.raises(ValueError):
+        ColumnMapping.parse("designator=Ref,x=X")
+    with pytest.raises(ValueError):
+        ColumnMapping.parse("designator=Ref,x=X,y=Y,units=furlong")
+
+
+def test_invalid_number_reports_line(tmp_path):
+    path = _write(tmp_path, "board.csv", ALTIUM.replace('"200"', '"2OO"'))
+    with pytest.raises(PickPlaceError, match="line 6"):
+        load_pickplace_store(path)
+
+    # Streaming yields the rows before the bad one.
+    components = iter_pickplace_csv(path)
+    assert next(components).designator == "C1"
+    with pytest.raises(PickPlaceError, match="line 6"):
+        next(components)
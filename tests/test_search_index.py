@@ -0,0 +1,53 @@
+import pytest
+
+from pcb_viewer.component_store import ComponentStore
+from pcb_viewer.models import Component, Side
+from pcb_viewer.search_index import SearchIndex
+
+PARTS = [
+    ("C1", "100nF", "C_0402_1005Metric", "Capacitor"),
+    ("C2", "100nF", "C0603", "Capacitor"),
+    ("C3", "10uF", "C0402", "Capacitor"),
+    ("R9", "10k", "R0402", "Resistor"),
+    ("R10", "10k", "R_0402", "Resistor"),
+    ("R25", "4k7", "R0603", "Resistor"),
+    ("R40", "1k", "0805", "Resistor"),
+    ("R41", "1k", "0805", "Resistor"),
+    ("U1", "LM358", "SOIC-8", "Dual op-amp"),
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    store = ComponentStore.from_components(
+        Component(designator, value, Side.TOP, footprint, 0.0, 0.0, 0.0, description)
+        for designator, value, footprint, description in PARTS
+    )
+    return SearchIndex(store)
+
+
+def _designators(index, query):
+    rows = index.search(query)
+    return None if rows is None else [PARTS[row][0] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "query, designators",
+    [
+        ("", None),
+        ("c1", ["C1"]),
+        ("R4", ["R40", "R41"]),
+        ("100nF", ["C1", "C2"]),
+        ("100nf 0402", ["C1"]),
+        ("0402", ["C1", "C3", "R9", "R10"]),
+        ("c_0402", ["C1"]),
+        ("10 0402", ["C1", "C3", "R9", "R10"]),
+        ("R10-R40", ["R10", "R25", "R40"]),
+        ("R40-10", ["R10", "R25", "R40"]),
+        ("soic", ["U1"]),
+        ("op-amp", ["U1"]),
+        ("nothing", []),
+    ],
+)
+def test_search(index, query, designators):
+    assert _designators(index, query) == designators